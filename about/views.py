@@ -4,6 +4,7 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 from django_filters.rest_framework import DjangoFilterBackend
+from main.mixins import ConditionalGetMixin, SparseFieldsetsMixin
 from .models import Objective, TeamMember, WhoWeAre, OurStory, WhatSetsUsApart, Partner
 from .serializers import (
     ObjectiveSerializer, TeamMemberSerializer, WhoWeAreSerializer,
@@ -11,7 +12,7 @@ from .serializers import (
 )
 
 
-class ObjectiveViewSet(viewsets.ModelViewSet):
+class ObjectiveViewSet(ConditionalGetMixin, SparseFieldsetsMixin, viewsets.ModelViewSet):
     """
     ViewSet for Objectives
     
@@ -27,7 +28,7 @@ class ObjectiveViewSet(viewsets.ModelViewSet):
     http_method_names = ['get', 'head', 'options']  # Read-only for public
 
 
-class TeamMemberViewSet(viewsets.ModelViewSet):
+class TeamMemberViewSet(ConditionalGetMixin, SparseFieldsetsMixin, viewsets.ModelViewSet):
     """
     ViewSet for Team Members
     
@@ -43,7 +44,7 @@ class TeamMemberViewSet(viewsets.ModelViewSet):
     http_method_names = ['get', 'head', 'options']  # Read-only for public
 
 
-class WhoWeAreViewSet(viewsets.ModelViewSet):
+class WhoWeAreViewSet(ConditionalGetMixin, SparseFieldsetsMixin, viewsets.ModelViewSet):
     """
     ViewSet for Who We Are section
     """
@@ -56,7 +57,7 @@ class WhoWeAreViewSet(viewsets.ModelViewSet):
     http_method_names = ['get', 'head', 'options']  # Read-only for public
 
 
-class OurStoryViewSet(viewsets.ModelViewSet):
+class OurStoryViewSet(ConditionalGetMixin, SparseFieldsetsMixin, viewsets.ModelViewSet):
     """
     ViewSet for Our Story section
     """
@@ -69,7 +70,7 @@ class OurStoryViewSet(viewsets.ModelViewSet):
     http_method_names = ['get', 'head', 'options']  # Read-only for public
 
 
-class WhatSetsUsApartViewSet(viewsets.ModelViewSet):
+class WhatSetsUsApartViewSet(ConditionalGetMixin, SparseFieldsetsMixin, viewsets.ModelViewSet):
     """
     ViewSet for What Sets Us Apart items
     """
@@ -82,7 +83,7 @@ class WhatSetsUsApartViewSet(viewsets.ModelViewSet):
     http_method_names = ['get', 'head', 'options']  # Read-only for public
 
 
-class PartnerViewSet(viewsets.ModelViewSet):
+class PartnerViewSet(ConditionalGetMixin, SparseFieldsetsMixin, viewsets.ModelViewSet):
     """
     ViewSet for Partners
     """
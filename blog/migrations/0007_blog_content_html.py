@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-19 13:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0006_add_view_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blog',
+            name='content_html',
+            field=models.TextField(blank=True, editable=False, help_text='Content with absolute image URLs, rendered on save'),
+        ),
+    ]
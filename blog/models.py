@@ -3,6 +3,7 @@ from django.contrib.auth.models import User
 from django.utils import timezone
 from django.utils.text import slugify
 from ckeditor.fields import RichTextField
+from main.utils import render_rich_text
 
 
 def default_published_date():
@@ -27,6 +28,7 @@ class Blog(models.Model):
     author = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='blog_posts', db_index=True)
     category = models.CharField(max_length=50, choices=CATEGORY_CHOICES, default='governance')
     content = RichTextField()
+    content_html = models.TextField(blank=True, editable=False, help_text="Content with absolute image URLs, rendered on save")
     image = models.ImageField(upload_to='blogs/', blank=True, null=True)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='draft')
     published_date = models.DateField(default=default_published_date)
@@ -34,6 +36,9 @@ class Blog(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Rich text source field -> stored rendered HTML (see main.utils.render_rich_text)
+    RICH_TEXT_FIELDS = {'content': 'content_html'}
+
     class Meta:
         ordering = ['-published_date', '-created_at']
         verbose_name = 'Blog'
@@ -42,6 +47,7 @@ class Blog(models.Model):
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = slugify(self.title)
+        kwargs['update_fields'] = render_rich_text(self, self.RICH_TEXT_FIELDS, kwargs.get('update_fields'))
         super().save(*args, **kwargs)
 
     def __str__(self):
@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from main.utils import get_full_media_url, process_content_images
+from main.utils import get_full_media_url, rendered_rich_text
 from .models import Blog, BlogComment
 
 
@@ -88,9 +88,9 @@ class BlogDetailSerializer(serializers.ModelSerializer):
         return None
     
     def get_content(self, obj):
-        """Process content HTML to convert relative image URLs to absolute URLs"""
+        """Content HTML with absolute image URLs, rendered when the article was saved"""
         if obj.content:
-            return process_content_images(obj.content)
+            return rendered_rich_text(obj, 'content', 'content_html')
         return obj.content
 
 
@@ -1,13 +1,15 @@
 from rest_framework import viewsets, filters
-from rest_framework.pagination import PageNumberPagination
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
+from django.contrib.auth.models import User
 from django.db.models import F
 from django_filters.rest_framework import DjangoFilterBackend
-from django.views.decorators.cache import cache_page
-from django.utils.decorators import method_decorator
-from django.core.cache import cache
+from django.conf import settings
+from main.cache import stale_while_revalidate
+from main.compression import entry_response
+from main.mixins import ConditionalGetMixin, SparseFieldsetsMixin
+from main.pagination import KeysetPageNumberPagination
 from .models import Blog, BlogComment
 from .serializers import (
     BlogListSerializer,
@@ -18,13 +20,13 @@ from .serializers import (
 )
 
 
-class BlogPagination(PageNumberPagination):
+class BlogPagination(KeysetPageNumberPagination):
     page_size = 12
     page_size_query_param = 'page_size'
     max_page_size = 100
 
 
-class BlogViewSet(viewsets.ModelViewSet):
+class BlogViewSet(ConditionalGetMixin, SparseFieldsetsMixin, viewsets.ModelViewSet):
     """
     ViewSet for Blog model
 
@@ -39,6 +41,8 @@ class BlogViewSet(viewsets.ModelViewSet):
     search_fields = ['title', 'author__username', 'author__first_name', 'author__last_name', 'content']
     ordering_fields = ['published_date', 'created_at', 'title']
     lookup_field = 'slug'
+    # Serializers nest the author's name
+    conditional_models = [Blog, User]
 
     def get_serializer_class(self):
         """Use different serializers for list and detail views"""
@@ -63,11 +67,14 @@ class BlogViewSet(viewsets.ModelViewSet):
         return queryset
 
     def retrieve(self, request, *args, **kwargs):
-        instance = self.get_object()
-        Blog.objects.filter(pk=instance.pk).update(view_count=F('view_count') + 1)
-        instance.refresh_from_db()
-        serializer = self.get_serializer(instance)
-        return Response(serializer.data)
+        # Count the view even when the client's copy is current. The .update() does not
+        # bump Blog's version, so view_count is not part of the ETag: a 304 keeps the
+        # count the client last saw, and it refreshes with the next content change.
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        self.get_queryset().filter(**{self.lookup_field: kwargs[lookup_url_kwarg]}).update(
+            view_count=F('view_count') + 1
+        )
+        return super().retrieve(request, *args, **kwargs)
 
 
 # Home page blog summary endpoint - optimized and cached
@@ -75,18 +82,17 @@ class HomeBlogSummaryView(APIView):
     """
     Optimized endpoint for home page blog summary.
     Returns latest 3 published blog posts in a single response.
-    Cached for 10 minutes to improve performance.
+    Cached for hours; invalidated whenever a model it reads changes (main.cache.CACHE_DEPENDENCIES),
+    with stale-while-revalidate rebuilds.
     """
     permission_classes = [AllowAny]
 
-    @method_decorator(cache_page(600))  # Cache for 10 minutes
     def get(self, request):
-        cache_key = 'home_blog_summary'
-        cached_data = cache.get(cache_key)
-        
-        if cached_data is not None:
-            return Response(cached_data)
-        
+        return entry_response(request, self.build_summary.lookup_entry()[0])
+
+    @staticmethod
+    @stale_while_revalidate('home_blog_summary', settings.HOME_CACHE_TIMEOUT, settings.HOME_CACHE_STALE_TIMEOUT, precompress=True)
+    def build_summary():
         # Fetch latest 3 published blog posts with optimized query
         # Using only() to fetch only needed fields
         blog_posts = Blog.objects.filter(
@@ -100,10 +106,7 @@ class HomeBlogSummaryView(APIView):
             'results': HomeBlogSummarySerializer(blog_posts, many=True).data
         }
         
-        # Cache the response
-        cache.set(cache_key, data, 600)  # Cache for 10 minutes
-        
-        return Response(data)
+        return data
 
 
 # Blog comments - no login required
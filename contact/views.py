@@ -2,11 +2,12 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAuthenticated
+from main.mixins import SparseFieldsetsMixin
 from .models import ContactSubmission, DonationSubmission, Feedback
 from .serializers import ContactSubmissionSerializer, DonationSubmissionSerializer, FeedbackSerializer
 
 
-class ContactSubmissionViewSet(viewsets.ModelViewSet):
+class ContactSubmissionViewSet(SparseFieldsetsMixin, viewsets.ModelViewSet):
     """
     ViewSet for contact form submissions
 
@@ -57,7 +58,7 @@ class ContactSubmissionViewSet(viewsets.ModelViewSet):
         return ip
 
 
-class DonationSubmissionViewSet(viewsets.ModelViewSet):
+class DonationSubmissionViewSet(SparseFieldsetsMixin, viewsets.ModelViewSet):
     """
     ViewSet for donation form submissions
 
@@ -108,7 +109,7 @@ class DonationSubmissionViewSet(viewsets.ModelViewSet):
         return ip
 
 
-class FeedbackViewSet(viewsets.ModelViewSet):
+class FeedbackViewSet(SparseFieldsetsMixin, viewsets.ModelViewSet):
     """
     ViewSet for feedback submissions from Citizens Voice page
 
@@ -0,0 +1,19 @@
+"""
+Gunicorn hooks. Gunicorn loads this file automatically from the working
+directory; command-line options still take precedence for everything else.
+
+Set WARM_WORKERS=1 to warm each worker (URLconf, ContentTypes, L1 cache copies
+of the home payloads) before it accepts traffic. Pair it with
+`python manage.py warm_caches` in the deploy/release step, which fills the
+shared cache once for all workers.
+"""
+import os
+
+
+def post_worker_init(worker):
+    # Runs in the worker after the Django app is loaded, before it serves requests
+    if os.environ.get('WARM_WORKERS', '').lower() not in ('1', 'true', 'yes'):
+        return
+    from main.warmup import warm_worker
+    worker.log.info('Warming worker %s', worker.pid)
+    warm_worker()
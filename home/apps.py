@@ -3,3 +3,13 @@ from django.apps import AppConfig
 
 class HomeConfig(AppConfig):
     name = 'home'
+
+    def ready(self):
+        # Home page caches are built from models across several apps, so their
+        # signal-driven invalidation (and the per-model versions behind API ETags)
+        # is wired up here once every app is loaded
+        from main.cache import connect_cache_invalidation, connect_model_versions
+        from main.snapshots import connect_snapshot_export
+        connect_cache_invalidation()
+        connect_model_versions()
+        connect_snapshot_export()
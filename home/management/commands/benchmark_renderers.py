@@ -0,0 +1,113 @@
+import json
+import time
+from django.core.management.base import BaseCommand
+from django.db.models import Count
+from rest_framework.renderers import JSONRenderer
+from main.renderers import HAS_MSGPACK, HAS_ORJSON, ColumnarRenderer, MessagePackRenderer, ORJSONRenderer
+from trackers.models import Committee, DebtData, Loan, MP
+from trackers.serializers import CommitteeDetailSerializer, DebtDataSerializer, LoanSerializer, MPListSerializer
+from trackers.views import DebtDataViewSet, LoanViewSet, MPViewSet
+
+if HAS_MSGPACK:
+    import msgpack
+
+
+class Command(BaseCommand):
+    help = 'Compare DRF\'s JSONRenderer with the orjson, MessagePack and columnar renderers on the largest tracker payloads: checks the output matches and reports render time and size.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=20,
+            help='Renders per renderer; the fastest is reported (default: 20)'
+        )
+
+    def get_payloads(self):
+        """(label, serialized data, list view or None) - serialized once, so only rendering is timed"""
+        payloads = [
+            ('All MPs', MPListSerializer(MP.objects.select_related('party', 'district').order_by('last_name', 'first_name'), many=True).data, MPViewSet(action='list')),
+            ('All loans', LoanSerializer(Loan.objects.order_by('-approval_date'), many=True).data, LoanViewSet(action='list')),
+            ('Debt series', DebtDataSerializer(DebtData.objects.order_by('year'), many=True).data, DebtDataViewSet(action='list')),
+        ]
+        committee = Committee.objects.annotate(member_total=Count('members')).order_by('-member_total').first()
+        if committee is not None:
+            payloads.append((f'Committee detail ({committee.member_total} members)', CommitteeDetailSerializer(committee).data, None))
+        return payloads
+
+    @staticmethod
+    def decode_columnar(content):
+        block = json.loads(content)
+        dictionaries = block['dictionaries']
+        items = []
+        for row in block['rows']:
+            item = {}
+            for column, value in zip(block['columns'], row):
+                if column in dictionaries and value is not None:
+                    value = dictionaries[column][value]
+                item[column] = value
+            items.append(item)
+        return items
+
+    def time_best(self, func, repeat):
+        best = None
+        result = None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            result = func()
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        return best, result
+
+    def handle(self, *args, **options):
+        repeat = options['repeat']
+        if not HAS_ORJSON:
+            self.stdout.write(self.style.WARNING('orjson is not installed: ORJSONRenderer falls back to DRF\'s encoder'))
+        if not HAS_MSGPACK:
+            self.stdout.write(self.style.WARNING('msgpack is not installed: MessagePack is skipped'))
+
+        renderers = [('orjson', ORJSONRenderer())]
+        if HAS_MSGPACK:
+            renderers.append(('msgpack', MessagePackRenderer()))
+        mismatches = 0
+
+        for label, data, view in self.get_payloads():
+            base_time, base_content = self.time_best(lambda: JSONRenderer().render(data), repeat)
+            expected = json.loads(base_content)
+            self.stdout.write(f'{label}: json {base_time * 1000:.2f} ms, {len(base_content)} bytes')
+
+            for name, renderer in renderers:
+                elapsed, content = self.time_best(lambda: renderer.render(data), repeat)
+                if name == 'msgpack':
+                    identical = msgpack.unpackb(content, raw=False) == expected
+                else:
+                    identical = content == base_content
+                if not identical:
+                    mismatches += 1
+                line = (
+                    f'  {name} {elapsed * 1000:.2f} ms, {len(content)} bytes, '
+                    f'{base_time / elapsed:.1f}x faster'
+                    f'{"" if identical else " - OUTPUT DIFFERS"}'
+                )
+                self.stdout.write(self.style.SUCCESS(line) if identical else self.style.ERROR(line))
+
+            if view is not None:
+                renderer = ColumnarRenderer()
+                elapsed, content = self.time_best(lambda: renderer.render(data, renderer_context={'view': view}), repeat)
+                identical = self.decode_columnar(content) == expected
+                if not identical:
+                    mismatches += 1
+                line = (
+                    f'  columnar {elapsed * 1000:.2f} ms, {len(content)} bytes, '
+                    f'{100 - len(content) * 100 / len(base_content):.0f}% smaller'
+                    f'{"" if identical else " - OUTPUT DIFFERS"}'
+                )
+                self.stdout.write(self.style.SUCCESS(line) if identical else self.style.ERROR(line))
+
+        # Summary
+        self.stdout.write(self.style.SUCCESS('\n' + '='*60))
+        if mismatches:
+            self.stdout.write(self.style.ERROR(f'{mismatches} render(s) did not match DRF\'s JSON'))
+        else:
+            self.stdout.write(self.style.SUCCESS('All renderers matched DRF\'s JSON output'))
+        self.stdout.write(self.style.SUCCESS('='*60))
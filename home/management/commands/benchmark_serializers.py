@@ -0,0 +1,88 @@
+import time
+from django.core.management.base import BaseCommand
+from rest_framework.renderers import JSONRenderer
+from multimedia.models import Gallery
+from multimedia.serializers import GallerySerializer, GalleryValuesSerializer
+from news.models import News
+from news.serializers import NewsListSerializer, NewsListValuesSerializer
+from trackers.models import Bill, MP
+from trackers.serializers import BillListSerializer, BillListValuesSerializer, MPListSerializer, MPListValuesSerializer
+
+
+class Command(BaseCommand):
+    help = 'Compare the model serializers of the hot list endpoints with their values() fast paths: checks the JSON is byte-identical and reports time per row.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            type=int,
+            default=500,
+            help='Rows per page to serialize (default: 500)'
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=5,
+            help='Runs per serializer; the fastest is reported (default: 5)'
+        )
+
+    def get_cases(self):
+        # Ordered by pk as well, so both paths see the same rows in the same order
+        return [
+            ('MPListSerializer', MP.objects.select_related('party', 'district').order_by('last_name', 'first_name', 'pk'), MPListSerializer, MPListValuesSerializer),
+            ('BillListSerializer', Bill.objects.order_by('-created_at', 'pk'), BillListSerializer, BillListValuesSerializer),
+            ('NewsListSerializer', News.objects.order_by('-published_date', 'pk'), NewsListSerializer, NewsListValuesSerializer),
+            ('GallerySerializer', Gallery.objects.order_by('-created_at', 'pk'), GallerySerializer, GalleryValuesSerializer),
+        ]
+
+    def time_best(self, func, repeat):
+        best = None
+        result = None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            result = func()
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        return best, result
+
+    def handle(self, *args, **options):
+        rows = options['rows']
+        repeat = options['repeat']
+        renderer = JSONRenderer()
+        mismatches = 0
+
+        for label, queryset, serializer_class, values_serializer_class in self.get_cases():
+            # Both paths include the query, as they do in the list view
+            model_time, model_data = self.time_best(
+                lambda: serializer_class(queryset.all()[:rows], many=True).data, repeat
+            )
+
+            def fast():
+                serializer = values_serializer_class()
+                return serializer.serialize(serializer.project(queryset.all())[:rows])
+            values_time, values_data = self.time_best(fast, repeat)
+
+            count = len(model_data)
+            if not count:
+                self.stdout.write(self.style.WARNING(f'{label}: no rows, skipped'))
+                continue
+
+            identical = renderer.render(model_data) == renderer.render(values_data)
+            if not identical:
+                mismatches += 1
+            line = (
+                f'{label} ({count} rows): '
+                f'model {model_time / count * 1e6:.1f} us/row, '
+                f'values {values_time / count * 1e6:.1f} us/row, '
+                f'{model_time / values_time:.1f}x faster'
+                f'{"" if identical else " - OUTPUT DIFFERS"}'
+            )
+            self.stdout.write(self.style.SUCCESS(line) if identical else self.style.ERROR(line))
+
+        # Summary
+        self.stdout.write(self.style.SUCCESS('\n' + '='*60))
+        if mismatches:
+            self.stdout.write(self.style.ERROR(f'{mismatches} serializer(s) produced different JSON'))
+        else:
+            self.stdout.write(self.style.SUCCESS('All fast paths produced byte-identical JSON'))
+        self.stdout.write(self.style.SUCCESS('='*60))
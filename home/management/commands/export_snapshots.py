@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand, CommandError
+from main.snapshots import SNAPSHOTS, HAS_BROTLI, export_snapshots
+
+
+class Command(BaseCommand):
+    help = 'Write the static JSON snapshots (About page, settings payloads, parliament terms) served from /snapshots/. Run on deploy; afterwards they are re-exported automatically when their content changes.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'names',
+            nargs='*',
+            metavar='NAME',
+            help=f'Snapshots to export (default: all). Available: {", ".join(SNAPSHOTS)}'
+        )
+
+    def handle(self, *args, **options):
+        names = options['names'] or list(SNAPSHOTS)
+        unknown = [name for name in names if name not in SNAPSHOTS]
+        if unknown:
+            raise CommandError(f'Unknown snapshot(s): {", ".join(unknown)}')
+
+        exported = export_snapshots(names)
+        for name, url in exported.items():
+            self.stdout.write(f'  {name} -> {url}')
+
+        # Summary
+        self.stdout.write(self.style.SUCCESS('\n' + '='*60))
+        self.stdout.write(self.style.SUCCESS('Snapshot Export Summary:'))
+        self.stdout.write(self.style.SUCCESS(f'  Exported: {len(exported)}'))
+        if not HAS_BROTLI:
+            self.stdout.write(self.style.WARNING('  Brotli not installed: only gzip variants written'))
+        self.stdout.write(self.style.SUCCESS('='*60))
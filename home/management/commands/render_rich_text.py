@@ -0,0 +1,66 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from main.cache import CACHE_DEPENDENCIES, invalidate, model_version_name
+from main.utils import get_media_url_prefix, process_content_images
+
+
+class Command(BaseCommand):
+    help = 'Re-render the stored HTML of rich text fields (News/Blog content, MP bio, Loan description) with absolute image URLs. Run after FULL_MEDIA_URL or BACKEND_DOMAIN changes, and once to backfill existing rows.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--model',
+            type=str,
+            metavar='LABEL',
+            help='Only process one model, e.g. news.News'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Rows fetched and updated per batch (default: 500)'
+        )
+
+    def get_models(self, only_model):
+        for model in apps.get_models():
+            fields = getattr(model, 'RICH_TEXT_FIELDS', None)
+            if fields and (not only_model or model._meta.label_lower == only_model):
+                yield model, fields
+
+    def handle(self, *args, **options):
+        only_model = (options.get('model') or '').lower()
+        batch_size = options['batch_size']
+        self.stdout.write(f'Rendering with media URL prefix {get_media_url_prefix()}')
+
+        updated_count = 0
+        unchanged_count = 0
+
+        for model, fields in self.get_models(only_model):
+            self.stdout.write(f'Processing {model._meta.verbose_name_plural}...')
+            changed = []
+            queryset = model.objects.only('pk', *fields.keys(), *fields.values()).order_by('pk')
+            for instance in queryset.iterator(chunk_size=batch_size):
+                dirty = False
+                for source, rendered in fields.items():
+                    html = process_content_images(getattr(instance, source)) or ''
+                    if getattr(instance, rendered) != html:
+                        setattr(instance, rendered, html)
+                        dirty = True
+                if dirty:
+                    changed.append(instance)
+                else:
+                    unchanged_count += 1
+
+            # bulk_update skips save() and signals, so drop cached copies explicitly
+            model.objects.bulk_update(changed, list(fields.values()), batch_size=batch_size)
+            if changed:
+                invalidate(model_version_name(model), *CACHE_DEPENDENCIES.get(model._meta.label, []))
+            updated_count += len(changed)
+            self.stdout.write(f'  {len(changed)} updated')
+
+        # Summary
+        self.stdout.write(self.style.SUCCESS('\n' + '='*60))
+        self.stdout.write(self.style.SUCCESS('Rich Text Render Summary:'))
+        self.stdout.write(self.style.SUCCESS(f'  Updated: {updated_count}'))
+        self.stdout.write(self.style.SUCCESS(f'  Unchanged: {unchanged_count}'))
+        self.stdout.write(self.style.SUCCESS('='*60))
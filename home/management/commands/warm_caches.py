@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand
+from main.warmup import warm_shared_caches
+
+
+class Command(BaseCommand):
+    help = 'Pre-compute the home page summaries, Hot in Parliament, settings payloads and popular search results in the shared cache. Run after every deploy.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--search-top',
+            type=int,
+            default=50,
+            help='Number of most popular search queries to warm; 0 skips search (default: 50)'
+        )
+        parser.add_argument(
+            '--search-days',
+            type=int,
+            default=7,
+            help='Look-back window for search popularity, in days (default: 7)'
+        )
+
+    def handle(self, *args, **options):
+        results = warm_shared_caches(options['search_top'], options['search_days'])
+
+        total_entries = 0
+        total_errors = 0
+        for name, (entries, seconds, errors) in results.items():
+            total_entries += entries - errors
+            total_errors += errors
+            line = f'  {name}: {entries - errors}/{entries} entries in {seconds:.2f}s'
+            self.stdout.write(self.style.WARNING(line) if errors else line)
+
+        # Summary
+        self.stdout.write(self.style.SUCCESS('\n' + '='*60))
+        self.stdout.write(self.style.SUCCESS('Cache Warm-up Summary:'))
+        self.stdout.write(self.style.SUCCESS(f'  Warmed: {total_entries}'))
+        if total_errors > 0:
+            self.stdout.write(self.style.WARNING(f'  Failed: {total_errors} (see log)'))
+        self.stdout.write(self.style.SUCCESS('='*60))
@@ -1,11 +1,34 @@
-from rest_framework import viewsets, filters
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from rest_framework import viewsets, filters, status
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
 from django_filters.rest_framework import DjangoFilterBackend
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.utils.cache import patch_cache_control
+from django.utils.http import parse_etags, quote_etag
+from main.cache import stale_while_revalidate
+from main.compression import encode_payload, payload_digest, precompressed_response, wants_plain_json
+from main.mixins import ConditionalGetMixin, SparseFieldsetsMixin
+from blog.views import HomeBlogSummaryView
+from multimedia.models import Poll
+from multimedia.serializers import PollSerializer
+from news.views import HomeNewsSummaryView, HotInParliamentView
+from resources.views import HomeResourcesSummaryView
+from trackers.views import HomeSummaryView
 from .models import HeroImage, Headline
 from .serializers import HeroImageSerializer, HeadlineSerializer
 
 
-class HeroImageViewSet(viewsets.ModelViewSet):
+logger = logging.getLogger(__name__)
+
+
+class HeroImageViewSet(ConditionalGetMixin, SparseFieldsetsMixin, viewsets.ModelViewSet):
     """
     ViewSet for Hero Images
     
@@ -21,7 +44,7 @@ class HeroImageViewSet(viewsets.ModelViewSet):
     http_method_names = ['get', 'head', 'options']  # Read-only for public
 
 
-class HeadlineViewSet(viewsets.ModelViewSet):
+class HeadlineViewSet(ConditionalGetMixin, SparseFieldsetsMixin, viewsets.ModelViewSet):
     """
     ViewSet for Headlines
     
@@ -35,3 +58,105 @@ class HeadlineViewSet(viewsets.ModelViewSet):
     ordering_fields = ['order', 'created_at']
     ordering = ['order', 'created_at']
     http_method_names = ['get', 'head', 'options']  # Read-only for public
+
+
+class HomeBundleView(APIView):
+    """
+    GET /api/home/bundle/
+    Everything the home page needs in one response: the trackers, news, blog and
+    resources summaries, Hot in Parliament, hero images, headlines and active polls.
+    Sections are read concurrently from their own caches (stale_while_revalidate),
+    so the bundle stays in step with the individual endpoints. The payload carries
+    a `version`, which is also its ETag: a hash of the content digests stored in
+    the section cache entries, so a request never re-encodes the bundle just to
+    validate it. The rendered and compressed body is cached per version.
+    """
+    permission_classes = [AllowAny]
+
+    # Number of active polls included (featured first)
+    poll_limit = 3
+
+    def get(self, request):
+        sections = {
+            'trackers': HomeSummaryView.build_summary,
+            'news': HomeNewsSummaryView.build_summary,
+            'blog': HomeBlogSummaryView.build_summary,
+            'resources': HomeResourcesSummaryView.build_summary,
+            'hot_in_parliament': HotInParliamentView.build_items,
+            'hero_images': self.build_hero_images,
+            'headlines': self.build_headlines,
+            'polls': self.build_polls,
+        }
+
+        data = {}
+        digests = []
+        errors = []
+        with ThreadPoolExecutor(max_workers=len(sections)) as executor:
+            futures = {name: executor.submit(self._build_section, build) for name, build in sections.items()}
+            for name, future in futures.items():
+                try:
+                    entry = future.result()
+                except Exception as e:
+                    logger.warning(f"Home bundle section {name} failed: {e}")
+                    data[name] = None
+                    errors.append(name)
+                    continue
+                data[name] = entry['data']
+                # Entries cached before digests were stored are hashed here, once per request
+                digests.append(f"{name}:{entry.get('digest') or payload_digest(entry['data'])}")
+
+        if errors:
+            # Partial bundles are never validated, so clients refetch once the section recovers
+            return Response({'version': None, 'errors': errors, **data})
+
+        # Changes exactly when some section's payload changes
+        version = hashlib.md5(','.join(digests).encode()).hexdigest()
+        etag = quote_etag(version)
+
+        if etag in parse_etags(request.META.get('HTTP_IF_NONE_MATCH', '')):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        elif wants_plain_json(request):
+            response = precompressed_response(request, self.get_encoded_body(version, data))
+        else:
+            response = Response({'version': version, **data})
+        response['ETag'] = etag
+        patch_cache_control(response, no_cache=True)
+        return response
+
+    @staticmethod
+    def get_encoded_body(version, data):
+        """encode_payload() of the bundle, cached by content hash so each version is encoded once"""
+        body_key = f'home_bundle_body:{version}'
+        variants = cache.get(body_key)
+        if variants is None:
+            variants = encode_payload({'version': version, **data})
+            cache.set(body_key, variants, settings.HOME_CACHE_TIMEOUT)
+        return variants
+
+    @staticmethod
+    def _build_section(build):
+        """The section's stale_while_revalidate entry (data and content digest)"""
+        try:
+            return build.lookup_entry()[0]
+        finally:
+            # Worker threads get their own connection; do not leave it open
+            connection.close()
+
+    @staticmethod
+    @stale_while_revalidate('home_hero_images', settings.HOME_CACHE_TIMEOUT, settings.HOME_CACHE_STALE_TIMEOUT)
+    def build_hero_images():
+        hero_images = HeroImage.objects.filter(is_active=True).order_by('order', 'created_at')
+        return HeroImageSerializer(hero_images, many=True).data
+
+    @staticmethod
+    @stale_while_revalidate('home_headlines', settings.HOME_CACHE_TIMEOUT, settings.HOME_CACHE_STALE_TIMEOUT)
+    def build_headlines():
+        headlines = Headline.objects.filter(is_active=True).order_by('order', 'created_at')
+        return HeadlineSerializer(headlines, many=True).data
+
+    # Short soft TTL: Poll.is_active depends on start/end dates, not just on writes
+    @staticmethod
+    @stale_while_revalidate('home_polls', 60, settings.HOME_CACHE_STALE_TIMEOUT)
+    def build_polls():
+        polls = Poll.objects.filter(status='active').prefetch_related('options').order_by('-featured', '-created_at')
+        return PollSerializer(polls[:HomeBundleView.poll_limit], many=True).data
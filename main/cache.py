@@ -0,0 +1,436 @@
+"""
+Two-tier cache backend and versioned-key invalidation helpers.
+
+TieredCache keeps a small per-process L1 (LocMemCache) in front of a shared L2
+cache alias (file, database or Redis, see CACHES in settings). Reads are served
+from L1 for at most L1_TIMEOUT seconds, then from L2, so every gunicorn worker
+sees the same data and staleness is bounded by L1_TIMEOUT.
+
+Invalidation goes through versions: invalidate(name) bumps the version held
+in L2, and payloads built under an older version (versioned_key(name), or a
+stale_while_revalidate entry) stop being treated as current. Other workers pick
+up the new version as soon as their L1 copy of it expires.
+
+CACHE_DEPENDENCIES declares which cached payloads depend on which models;
+saving or deleting any of those models invalidates them automatically, so the
+payloads can be cached for hours instead of expiring every few minutes.
+
+stale_while_revalidate wraps payload builders: expired or invalidated entries
+keep being served while a single worker rebuilds them in the background, so a
+popular key expiring never sends every concurrent request to the database.
+With precompress=True an entry also holds its rendered JSON and gzip/brotli
+variants, which main.compression serves without re-encoding.
+
+Every other model write also bumps a per-model version (model_version_name),
+which the API uses as a cheap ETag / Last-Modified validator (main.mixins).
+"""
+import atexit
+import logging
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.base import BaseCache, DEFAULT_TIMEOUT
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import close_old_connections, connection, transaction
+from django.db.models.signals import m2m_changed, post_save, post_delete
+
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class TieredCache(BaseCache):
+    """
+    Cache backend with an in-process L1 in front of a shared L2 alias.
+
+    OPTIONS:
+        L2: alias of the shared cache in CACHES (default 'shared')
+        L1_TIMEOUT: max seconds a value is served from process memory (default 5)
+        L1_MAX_ENTRIES: size of the in-process cache (default 300)
+    """
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get('OPTIONS', {})
+        self._l2_alias = options.get('L2', 'shared')
+        self.l1_timeout = options.get('L1_TIMEOUT', 5)
+        self._l1 = LocMemCache(f'tiered-l1-{location}', {
+            'TIMEOUT': self.l1_timeout,
+            'OPTIONS': {'MAX_ENTRIES': options.get('L1_MAX_ENTRIES', 300)},
+        })
+
+    @property
+    def l1(self):
+        return self._l1
+
+    @property
+    def l2(self):
+        return caches[self._l2_alias]
+
+    def _timeouts(self, timeout):
+        """Return (l2_timeout, l1_timeout) for a requested timeout"""
+        if timeout is DEFAULT_TIMEOUT:
+            timeout = self.default_timeout
+        if timeout is None:
+            return None, self.l1_timeout
+        return timeout, min(timeout, self.l1_timeout)
+
+    def get(self, key, default=None, version=None):
+        value = self._l1.get(key, _MISSING, version=version)
+        if value is not _MISSING:
+            return value
+        value = self.l2.get(key, _MISSING, version=version)
+        if value is _MISSING:
+            return default
+        self._l1.set(key, value, self.l1_timeout, version=version)
+        return value
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        l2_timeout, l1_timeout = self._timeouts(timeout)
+        self.l2.set(key, value, l2_timeout, version=version)
+        self._l1.set(key, value, l1_timeout, version=version)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        l2_timeout, l1_timeout = self._timeouts(timeout)
+        added = self.l2.add(key, value, l2_timeout, version=version)
+        if added:
+            self._l1.set(key, value, l1_timeout, version=version)
+        return added
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        l2_timeout, _ = self._timeouts(timeout)
+        self._l1.delete(key, version=version)
+        return self.l2.touch(key, l2_timeout, version=version)
+
+    def delete(self, key, version=None):
+        self._l1.delete(key, version=version)
+        return self.l2.delete(key, version=version)
+
+    def has_key(self, key, version=None):
+        return self._l1.has_key(key, version=version) or self.l2.has_key(key, version=version)
+
+    def incr(self, key, delta=1, version=None):
+        self._l1.delete(key, version=version)
+        return self.l2.incr(key, delta, version=version)
+
+    def get_many(self, keys, version=None):
+        found = self._l1.get_many(keys, version=version)
+        missing = [key for key in keys if key not in found]
+        if missing:
+            from_l2 = self.l2.get_many(missing, version=version)
+            if from_l2:
+                self._l1.set_many(from_l2, self.l1_timeout, version=version)
+            found.update(from_l2)
+        return found
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        l2_timeout, l1_timeout = self._timeouts(timeout)
+        failed = self.l2.set_many(data, l2_timeout, version=version)
+        self._l1.set_many(data, l1_timeout, version=version)
+        return failed
+
+    def delete_many(self, keys, version=None):
+        self._l1.delete_many(keys, version=version)
+        self.l2.delete_many(keys, version=version)
+
+    def clear(self):
+        self._l1.clear()
+        self.l2.clear()
+
+
+def _version_key(name):
+    return f'version:{name}'
+
+
+def get_version(name):
+    """Current version of a named cache entry or group"""
+    version = cache.get(_version_key(name))
+    if version is None:
+        cache.add(_version_key(name), time.time_ns(), None)
+        version = cache.get(_version_key(name))
+    return version
+
+
+def versioned_key(name, *parts):
+    """
+    Physical cache key for a named entry, e.g. versioned_key('hot_in_parliament')
+    or versioned_key('search', query, limit). Changes whenever invalidate(name) runs.
+    """
+    key = f'{name}:v{get_version(name)}'
+    if parts:
+        key = ':'.join([key, *(str(part) for part in parts)])
+    return key
+
+
+def invalidate(*names):
+    """
+    Give each named entry a new version so every worker stops using the old payloads.
+    Versions are timestamps rather than counters, so an evicted version key can never
+    resurrect an old payload.
+    """
+    for name in names:
+        cache.set(_version_key(name), time.time_ns(), None)
+
+
+def model_version_name(model):
+    return f'model:{model._meta.label_lower}'
+
+
+def get_model_versions(models):
+    """Current version of each model, in order; versions are time_ns stamps of the last write"""
+    names = [model_version_name(model) for model in models]
+    found = cache.get_many([_version_key(name) for name in names])
+    return [found.get(_version_key(name)) or get_version(name) for name in names]
+
+
+LOCK_TIMEOUT = getattr(settings, 'CACHE_LOCK_TIMEOUT', 60)
+STATS_FLUSH_INTERVAL = getattr(settings, 'CACHE_STATS_FLUSH_INTERVAL', 10)
+STATS_EVENTS = ('hit', 'stale', 'miss', 'rebuild')
+
+_rebuilder = ThreadPoolExecutor(
+    max_workers=getattr(settings, 'CACHE_REBUILD_WORKERS', 2),
+    thread_name_prefix='cache-rebuild',
+)
+_stats = Counter()
+_stats_lock = threading.Lock()
+_stats_last_flush = time.monotonic()
+_swr_names = set()
+
+
+def stale_while_revalidate(name, soft_timeout, hard_timeout, key=None, precompress=False):
+    """
+    Cache a payload builder's return value with soft and hard TTLs.
+
+    Fresh entries (younger than soft_timeout, same version as get_version(name)) are
+    returned directly. Entries past soft_timeout, or built before invalidate(name),
+    are still returned until hard_timeout while one worker rebuilds them in the
+    background; a lock in the shared cache keeps the rebuild single-flight. On a
+    miss, one request builds and the others wait briefly for its result.
+
+    key maps the builder's arguments to cache key parts (default: the arguments).
+    The wrapped function also gets lookup(*args) -> (data, state), where state is
+    'hit', 'stale' or 'miss', lookup_entry(*args) -> (entry, state), and
+    rebuild(*args), which builds and stores now.
+
+    precompress stores entry['encoded'] (main.compression.encode_payload) with the
+    data, so the rendering and compression happen once per build, not per request.
+    Every entry also carries entry['digest'], a content hash of its data computed
+    at build time, for validators that combine several entries (the home bundle).
+    """
+    _swr_names.add(name)
+
+    def decorator(func):
+        from main.compression import encode_payload, payload_digest
+
+        def cache_key(args):
+            parts = key(*args) if key else args
+            return ':'.join(['swr', name, *(str(part) for part in parts)])
+
+        def make_entry(data, version):
+            entry = {
+                'data': data,
+                'version': version,
+                'fresh_until': time.time() + soft_timeout,
+            }
+            if precompress:
+                entry['encoded'] = encode_payload(data)
+                entry['digest'] = payload_digest(data, entry['encoded']['identity'])
+            else:
+                entry['digest'] = payload_digest(data)
+            return entry
+
+        def build(args, version):
+            entry = make_entry(func(*args), version)
+            cache.set(cache_key(args), entry, hard_timeout)
+            _count(name, 'rebuild')
+            return entry
+
+        def rebuild_in_background(args, version):
+            close_old_connections()
+            try:
+                build(args, version)
+            except Exception as e:
+                logger.warning(f"Background rebuild of {cache_key(args)} failed: {e}")
+            finally:
+                cache.delete(cache_key(args) + ':lock')
+                connection.close()
+
+        def is_fresh(entry, version):
+            return entry['version'] == version and entry['fresh_until'] > time.time()
+
+        def lookup_entry(*args):
+            entry_key = cache_key(args)
+            lock_key = entry_key + ':lock'
+            version = get_version(name)
+            entry = cache.get(entry_key)
+
+            if entry is not None and not is_fresh(entry, version):
+                # L1 may lag behind a rebuild another worker just finished
+                entry = getattr(cache, 'l2', cache).get(entry_key) or entry
+            if entry is not None:
+                if is_fresh(entry, version):
+                    _count(name, 'hit')
+                    return entry, 'hit'
+                if cache.add(lock_key, 1, LOCK_TIMEOUT):
+                    _rebuilder.submit(rebuild_in_background, args, version)
+                _count(name, 'stale')
+                return entry, 'stale'
+
+            _count(name, 'miss')
+            if not cache.add(lock_key, 1, LOCK_TIMEOUT):
+                # Someone else is building this entry; wait for it rather than piling on
+                deadline = time.monotonic() + min(LOCK_TIMEOUT, 5)
+                while time.monotonic() < deadline:
+                    time.sleep(0.05)
+                    entry = cache.get(entry_key)
+                    if entry is not None:
+                        return entry, 'miss'
+                return make_entry(func(*args), version), 'miss'
+            try:
+                return build(args, version), 'miss'
+            finally:
+                cache.delete(lock_key)
+
+        def lookup(*args):
+            entry, state = lookup_entry(*args)
+            return entry['data'], state
+
+        @wraps(func)
+        def wrapper(*args):
+            return lookup(*args)[0]
+
+        wrapper.lookup = lookup
+        wrapper.lookup_entry = lookup_entry
+        wrapper.rebuild = lambda *args: build(args, get_version(name))['data']
+        return wrapper
+    return decorator
+
+
+def _count(name, event):
+    """Count a cache event in-process; totals are pushed to the shared cache every few seconds"""
+    global _stats_last_flush
+    with _stats_lock:
+        _stats[(name, event)] += 1
+        if time.monotonic() - _stats_last_flush < STATS_FLUSH_INTERVAL:
+            return
+        pending = dict(_stats)
+        _stats.clear()
+        _stats_last_flush = time.monotonic()
+    _push_stats(pending)
+
+
+def _push_stats(pending):
+    for (name, event), delta in pending.items():
+        stats_key = f'cache-stats:{name}:{event}'
+        try:
+            if not cache.add(stats_key, delta, None):
+                cache.incr(stats_key, delta)
+        except Exception as e:
+            logger.warning(f"Could not record cache stats for {name}: {e}")
+
+
+def flush_stats():
+    with _stats_lock:
+        pending = dict(_stats)
+        _stats.clear()
+    _push_stats(pending)
+
+
+def get_cache_stats():
+    """Hit/stale/miss/rebuild totals across all workers for each stale_while_revalidate cache"""
+    keys = [f'cache-stats:{name}:{event}' for name in sorted(_swr_names) for event in STATS_EVENTS]
+    found = cache.get_many(keys)
+    stats = {}
+    for name in sorted(_swr_names):
+        counts = {event: found.get(f'cache-stats:{name}:{event}', 0) for event in STATS_EVENTS}
+        requests = counts['hit'] + counts['stale'] + counts['miss']
+        counts['hit_ratio'] = round((counts['hit'] + counts['stale']) / requests, 4) if requests else None
+        stats[name] = counts
+    return stats
+
+
+atexit.register(flush_stats)
+
+
+# Model label -> names of the cached payloads (versioned_key / stale_while_revalidate)
+# built from it. Add an entry here whenever a new cached view reads a model.
+CACHE_DEPENDENCIES = {
+    'trackers.ParliamentTerm': ['home_trackers_summary', 'mp_facets'],
+    'trackers.MP': ['home_trackers_summary', 'mp_facets'],
+    'trackers.Party': ['home_trackers_summary', 'mp_facets'],
+    'trackers.District': ['mp_facets'],
+    'trackers.Bill': ['home_trackers_summary'],
+    'trackers.Loan': ['home_trackers_summary', 'loan_analytics'],
+    'trackers.Lender': ['loan_analytics'],
+    'trackers.DebtData': ['debt_series'],
+    'trackers.Budget': ['home_trackers_summary'],
+    'trackers.Hansard': ['home_trackers_summary'],
+    'trackers.OrderPaper': ['home_trackers_summary'],
+    'news.News': ['home_news_summary'],
+    'news.HotInParliament': ['hot_in_parliament'],
+    'blog.Blog': ['home_blog_summary'],
+    'resources.Explainers': ['home_resources_summary'],
+    'resources.Report': ['home_resources_summary'],
+    'resources.PartnerPublication': ['home_resources_summary'],
+    'resources.Statement': ['home_resources_summary'],
+    'home.HeroImage': ['home_hero_images'],
+    'home.Headline': ['home_headlines'],
+    'multimedia.Poll': ['home_polls'],
+    'multimedia.PollOption': ['home_polls'],
+    'multimedia.PollVote': ['home_polls'],
+    'settings.CitizensVoiceFeedbackLinks': ['settings_feedback_links'],
+    'settings.FooterDocuments': ['settings_footer_documents'],
+    'settings.PageHeroImage': ['page_hero_images'],
+}
+
+
+def invalidate_dependents(sender, **kwargs):
+    """post_save/post_delete receiver: invalidate every payload built from the sender model"""
+    names = CACHE_DEPENDENCIES.get(sender._meta.label)
+    if names:
+        # After commit, so a concurrent rebuild cannot cache pre-commit data under the new version
+        transaction.on_commit(lambda: invalidate(*names))
+
+
+def connect_cache_invalidation():
+    """Connect invalidation receivers for every model in CACHE_DEPENDENCIES. Call once apps are ready."""
+    for label in CACHE_DEPENDENCIES:
+        model = apps.get_model(label)
+        post_save.connect(invalidate_dependents, sender=model, dispatch_uid=f'cache_invalidation_save_{label}')
+        post_delete.connect(invalidate_dependents, sender=model, dispatch_uid=f'cache_invalidation_delete_{label}')
+
+
+# Apps whose writes never affect API responses; skipped to avoid a cache write per login/session
+UNVERSIONED_APPS = {'admin', 'contenttypes', 'sessions', 'search'}
+# Saves that only touch these fields keep the model's version (a login updates last_login)
+UNVERSIONED_FIELDS = {'auth.user': {'last_login'}}
+
+
+def bump_model_version(sender, **kwargs):
+    """post_save/post_delete/m2m_changed receiver: give the written model(s) a new version"""
+    if kwargs.get('action', 'post').split('_')[0] != 'post':
+        return
+    models = {sender}
+    update_fields = kwargs.get('update_fields')
+    if update_fields and set(update_fields) <= UNVERSIONED_FIELDS.get(sender._meta.label_lower, set()):
+        return
+    if kwargs.get('action'):
+        # m2m_changed: sender is the through model; both ends change
+        models = {type(kwargs['instance']), kwargs['model']}
+    names = [model_version_name(model) for model in models if model._meta.app_label not in UNVERSIONED_APPS]
+    if names:
+        transaction.on_commit(lambda: invalidate(*names))
+
+
+def connect_model_versions():
+    """Connect the per-model version receivers for all models. Call once apps are ready."""
+    post_save.connect(bump_model_version, dispatch_uid='model_version_save')
+    post_delete.connect(bump_model_version, dispatch_uid='model_version_delete')
+    m2m_changed.connect(bump_model_version, dispatch_uid='model_version_m2m')
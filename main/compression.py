@@ -0,0 +1,106 @@
+"""
+Pre-compressed JSON responses for cached payloads.
+
+Nothing in MIDDLEWARE compresses API responses, and a cached payload would
+otherwise be rendered (and compressed) again on every hit. encode_payload()
+renders a payload once to JSON plus gzip and (if the Brotli package is installed)
+brotli variants; stale_while_revalidate(..., precompress=True) keeps them in the
+cache entry next to the data. entry_response() then answers with the variant the
+client's Accept-Encoding allows, straight from the cache.
+
+Bodies under RESPONSE_COMPRESSION_MIN_SIZE bytes are not compressed: the
+headers and framing would cost more than the compression saves. Clients that
+negotiated another format (browsable API, msgpack, columnar, indented JSON)
+get a regular DRF Response built from the same data.
+"""
+import gzip
+import hashlib
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+from rest_framework.response import Response
+
+from main.renderers import ORJSONRenderer
+
+try:
+    import brotli
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+
+
+MIN_SIZE = getattr(settings, 'RESPONSE_COMPRESSION_MIN_SIZE', 1024)
+
+# Server preference when the client accepts several
+ENCODINGS = ('br', 'gzip')
+
+
+def encode_payload(data):
+    """{'identity': JSON bytes, 'gzip': ..., 'br': ...}; compressed variants only where they are smaller"""
+    content = ORJSONRenderer().render(data)
+    variants = {'identity': content}
+    if len(content) >= MIN_SIZE:
+        compressed = {'gzip': gzip.compress(content, compresslevel=9, mtime=0)}
+        if HAS_BROTLI:
+            compressed['br'] = brotli.compress(content, quality=9)
+        variants.update((encoding, body) for encoding, body in compressed.items() if len(body) < len(content))
+    return variants
+
+
+def payload_digest(data, content=None):
+    """Content hash of a payload, from its rendered JSON (content, if already rendered)"""
+    if content is None:
+        content = ORJSONRenderer().render(data)
+    return hashlib.md5(content).hexdigest()
+
+
+def accepted_encoding(request, available):
+    """The preferred encoding in available that the request's Accept-Encoding allows, else 'identity'"""
+    header = request.META.get('HTTP_ACCEPT_ENCODING', '')
+    if not header:
+        return 'identity'
+
+    qualities = {}
+    for part in header.split(','):
+        coding, *params = part.split(';')
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.strip().lower()] = quality
+
+    for encoding in ENCODINGS:
+        if encoding in available and qualities.get(encoding, qualities.get('*', 0)) > 0:
+            return encoding
+    return 'identity'
+
+
+def wants_plain_json(request):
+    """True if DRF negotiated compact application/json, the form encode_payload() produces"""
+    renderer = getattr(request, 'accepted_renderer', None)
+    return type(renderer) is ORJSONRenderer and request.accepted_media_type == ORJSONRenderer.media_type
+
+
+def precompressed_response(request, variants):
+    """Serve encoded variants (see encode_payload) as-is, picking one by Accept-Encoding"""
+    encoding = accepted_encoding(request, variants)
+    body = variants[encoding]
+    response = HttpResponse(body, content_type='application/json')
+    if encoding != 'identity':
+        response['Content-Encoding'] = encoding
+    response['Content-Length'] = str(len(body))
+    patch_vary_headers(response, ['Accept', 'Accept-Encoding'])
+    return response
+
+
+def entry_response(request, entry):
+    """Response for a stale_while_revalidate(precompress=True) entry"""
+    if not wants_plain_json(request):
+        return Response(entry['data'])
+    # Entries cached before precompress was enabled are encoded on the fly
+    return precompressed_response(request, entry.get('encoded') or encode_payload(entry['data']))
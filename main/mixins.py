@@ -0,0 +1,197 @@
+"""
+Shared DRF view mixins.
+"""
+import hashlib
+import time
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from django.utils.cache import patch_cache_control
+from django.utils.http import http_date, parse_etags, quote_etag
+from rest_framework import status
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.response import Response
+
+from main.cache import get_model_versions
+
+
+class ValuesListMixin:
+    """
+    Serve the list action through values_serializer_class (a main.serializers.ValuesSerializer),
+    which reads a values() projection instead of building model instances. Filtering,
+    ordering and pagination are unchanged; other actions use the regular serializers.
+    """
+    values_serializer_class = None
+
+    def get_values_serializer(self, **kwargs):
+        return self.values_serializer_class(**kwargs)
+
+    def list(self, request, *args, **kwargs):
+        if self.values_serializer_class is None:
+            return super().list(request, *args, **kwargs)
+
+        serializer = self.get_values_serializer()
+        queryset = serializer.project(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(serializer.serialize(page))
+        return Response(serializer.serialize(queryset))
+
+
+class SparseFieldsetsMixin:
+    """
+    Sparse fieldsets for GET requests: ?fields=id,name,photo returns only those
+    serializer fields, ?omit=bio,content returns all but those. Unknown names are
+    ignored. Put the mixin before ValuesListMixin and the DRF viewset class.
+
+    Heavy text columns (TextFields and their rendered RICH_TEXT_FIELDS copies) read
+    only by dropped fields are deferred, so PostgreSQL never sends them. A
+    SerializerMethodField is taken to read the column of the same name. With
+    ValuesListMixin the values() projection selects only the kept fields' columns.
+    """
+
+    def get_sparse_fieldset(self):
+        """(fields, omit) from the query string; fields is None when not restricted"""
+        request = getattr(self, 'request', None)
+        if request is None or request.method not in SAFE_METHODS:
+            return None, set()
+        fields = {name.strip() for name in request.query_params.get('fields', '').split(',') if name.strip()}
+        omit = {name.strip() for name in request.query_params.get('omit', '').split(',') if name.strip()}
+        return fields or None, omit
+
+    def get_sparse_field_names(self, available):
+        """Names in available that the response keeps, or None to keep every field"""
+        fields, omit = self.get_sparse_fieldset()
+        if fields is None and not omit:
+            return None
+        return [name for name in available if (fields is None or name in fields) and name not in omit]
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        target = getattr(serializer, 'child', serializer)
+        keep = self.get_sparse_field_names(target.fields)
+        if keep is not None:
+            for name in set(target.fields) - set(keep):
+                target.fields.pop(name)
+        return serializer
+
+    def get_values_serializer(self, **kwargs):
+        available = self.values_serializer_class.serializer_class().fields
+        kwargs.setdefault('fields', self.get_sparse_field_names(available))
+        return super().get_values_serializer(**kwargs)
+
+    @staticmethod
+    def _text_columns(model, name, field):
+        """Heavy text columns a serializer field reads"""
+        source = field.source
+        if source == '*':
+            column = name
+        elif source.startswith('get_') and source.endswith('_display'):
+            column = source[len('get_'):-len('_display')]
+        else:
+            column = source.split('.')[0]
+        try:
+            model_field = model._meta.get_field(column)
+        except FieldDoesNotExist:
+            return set()
+        if not isinstance(model_field, models.TextField):
+            return set()
+        columns = {model_field.name}
+        rendered = getattr(model, 'RICH_TEXT_FIELDS', {}).get(model_field.name)
+        if rendered:
+            columns.add(rendered)
+        return columns
+
+    def get_deferred_columns(self, model):
+        fields = self.get_serializer_class()().fields
+        keep = self.get_sparse_field_names(fields)
+        if keep is None:
+            return set()
+        dropped, kept = set(), set()
+        for name, field in fields.items():
+            (kept if name in keep else dropped).update(self._text_columns(model, name, field))
+        return dropped - kept
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        deferred = self.get_deferred_columns(queryset.model)
+        return queryset.defer(*sorted(deferred)) if deferred else queryset
+
+
+class ConditionalGetMixin:
+    """
+    ETag / Last-Modified support for list and retrieve.
+
+    Validators come from per-model version stamps (main.cache.get_model_versions),
+    which change on every save/delete of the models in conditional_models, so an
+    unchanged resource is answered with 304 before the queryset is evaluated or
+    serialized. Only If-None-Match is honoured; Last-Modified is sent for
+    information but, at one-second resolution, is not used to answer 304s.
+    Put the mixin before the DRF viewset class.
+
+    conditional_models: models whose changes affect the response (default: the
+        viewset's queryset model). Add related models that serializers nest.
+    conditional_lifetime: rotate validators every N seconds even without writes,
+        for responses that depend on the clock (e.g. Poll.is_active).
+    """
+    conditional_models = None
+    conditional_lifetime = None
+
+    def get_conditional_models(self):
+        return self.conditional_models or [self.queryset.model]
+
+    def get_validators(self, request):
+        """Return (etag, last_modified) for this request"""
+        versions = get_model_versions(self.get_conditional_models())
+        parts = [
+            request.build_absolute_uri(),
+            request.META.get('HTTP_ACCEPT', ''),
+            str(request.user.is_staff),
+            *(str(version) for version in versions),
+        ]
+        last_modified = max(versions) / 1e9
+        if self.conditional_lifetime:
+            bucket = int(time.time() // self.conditional_lifetime)
+            parts.append(str(bucket))
+            last_modified = max(last_modified, bucket * self.conditional_lifetime)
+        etag = hashlib.md5(':'.join(parts).encode()).hexdigest()
+        return quote_etag(etag), int(last_modified)
+
+    def not_modified(self, request):
+        """Return a 304 response if the client's copy is still current, else None"""
+        if request.method not in ('GET', 'HEAD'):
+            return None
+        etag, last_modified = self.get_validators(request)
+        request._conditional_validators = (etag, last_modified)
+
+        # Only the ETag validates: Last-Modified has one-second resolution, so a write in
+        # the same second as a client's fetch would pass an If-Modified-Since check
+        if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+        if not if_none_match or not (etag in parse_etags(if_none_match) or if_none_match.strip() == '*'):
+            return None
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        self.set_validators(request, response)
+        return response
+
+    def set_validators(self, request, response):
+        validators = getattr(request, '_conditional_validators', None)
+        if validators is None or response.status_code not in (200, 304):
+            return response
+        etag, last_modified = validators
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+        # Let clients keep the body but always revalidate
+        patch_cache_control(response, no_cache=True)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        response = self.not_modified(request)
+        if response is not None:
+            return response
+        return self.set_validators(request, super().list(request, *args, **kwargs))
+
+    def retrieve(self, request, *args, **kwargs):
+        response = self.not_modified(request)
+        if response is not None:
+            return response
+        return self.set_validators(request, super().retrieve(request, *args, **kwargs))
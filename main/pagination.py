@@ -0,0 +1,263 @@
+"""
+Page-number pagination with an opt-in keyset (cursor) mode.
+
+PageNumberPagination runs a COUNT(*) for every page and reads deep pages with
+an OFFSET that PostgreSQL has to scan through. KeysetPageNumberPagination keeps
+that behaviour by default; a request with ?cursor= (empty for the first page)
+switches to keyset pagination instead: the next page is the rows after the
+last one returned, by the list's own ordering with the primary key as the
+final tiebreaker, so each page is one index range scan of page_size + 1 rows.
+
+The response is {'next', 'next_cursor', 'results'}; follow `next` (or pass
+`next_cursor` as ?cursor=) for the following page. Cursors are opaque tokens
+holding the last row's sort values. ?count=1 adds the total `count`, cached
+per filtered query under the versions of the view's conditional_models, so it
+is recounted only after a write.
+
+Orderings on model columns (and on foreign keys, which sort by the related
+model's Meta.ordering, as in Django) are supported; NULLs are placed as
+PostgreSQL sorts them (last ascending, first descending). Other orderings
+(random, annotations, expressions) answer a cursor request with 400.
+"""
+import base64
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist, ValidationError as DjangoValidationError
+from django.db.models import F, Q
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from main.cache import get_model_versions
+
+COUNT_TIMEOUT = getattr(settings, 'PAGINATION_COUNT_TIMEOUT', 60 * 60)
+
+
+def encode_cursor(values):
+    """Opaque keyset cursor from a list of JSON-serialisable sort values"""
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+def decode_cursor(cursor):
+    """Inverse of encode_cursor; returns None for a malformed cursor"""
+    try:
+        return json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, TypeError):
+        return None
+
+
+class KeysetColumn:
+    """One sort column: ORM path, direction, and the model field that parses its cursor value"""
+
+    def __init__(self, path, descending, field, nullable):
+        self.path = path
+        self.descending = descending
+        self.field = field
+        self.nullable = nullable
+
+    @property
+    def order_by(self):
+        return f'-{self.path}' if self.descending else self.path
+
+
+def _columns_for(model, term, prefix='', nullable=False, depth=0):
+    """KeysetColumns an ordering term sorts by, or None if it is not a plain column path"""
+    if not isinstance(term, str) or term == '?' or depth > 5:
+        return None
+    descending = term.startswith('-')
+    name = term.lstrip('-')
+
+    current, field, parts = model, None, []
+    for part in name.split('__'):
+        if field is not None:
+            if not field.is_relation:
+                return None
+            current = field.related_model
+        try:
+            field = current._meta.pk if part == 'pk' else current._meta.get_field(part)
+        except FieldDoesNotExist:
+            return None
+        parts.append(field.name)
+        nullable = nullable or field.null
+    path = prefix + '__'.join(parts)
+
+    if not field.is_relation:
+        return [KeysetColumn(path, descending, field, nullable)]
+    if not field.concrete or not (field.many_to_one or field.one_to_one):
+        return None
+    # A foreign key sorts by the related model's ordering, or by its own column without one
+    related_ordering = field.related_model._meta.ordering
+    if not related_ordering:
+        return [KeysetColumn(path, descending, field.target_field, nullable)]
+    columns = []
+    for related_term in related_ordering:
+        if descending and isinstance(related_term, str):
+            related_term = related_term[1:] if related_term.startswith('-') else f'-{related_term}'
+        expanded = _columns_for(field.related_model, related_term, f'{path}__', nullable, depth + 1)
+        if expanded is None:
+            return None
+        columns += expanded
+    return columns
+
+
+def keyset_columns(queryset):
+    """
+    The columns a queryset is ordered by, ending with its primary key, or None
+    when the ordering cannot be paged by keyset.
+    """
+    query = queryset.query
+    if query.order_by:
+        ordering = list(query.order_by)
+    elif query.default_ordering:
+        ordering = list(query.get_meta().ordering)
+    else:
+        ordering = []
+
+    model = queryset.model
+    columns = []
+    for term in ordering:
+        expanded = _columns_for(model, term)
+        if expanded is None:
+            return None
+        columns += expanded
+
+    pk_name = model._meta.pk.name
+    if not any(column.path == pk_name for column in columns):
+        descending = columns[-1].descending if columns else False
+        columns.append(KeysetColumn(pk_name, descending, model._meta.pk, False))
+    return columns
+
+
+def _after(columns, values):
+    """Q for the rows sorting after the row with these column values"""
+    branches = []
+    same = Q()
+    for column, value in zip(columns, values):
+        if value is None:
+            # NULLs sort last ascending and first descending
+            after = Q(**{f'{column.path}__isnull': False}) if column.descending else None
+            equal = Q(**{f'{column.path}__isnull': True})
+        else:
+            after = Q(**{f'{column.path}__{"lt" if column.descending else "gt"}': value})
+            if column.nullable and not column.descending:
+                after |= Q(**{f'{column.path}__isnull': True})
+            equal = Q(**{column.path: value})
+        if after is not None:
+            branches.append(same & after)
+        same &= equal
+
+    condition = Q()
+    for branch in branches:
+        condition |= branch
+    return condition if branches else None
+
+
+def _cursor_value(value):
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return str(value)
+
+
+class KeysetPageNumberPagination(PageNumberPagination):
+    """
+    PageNumberPagination, or keyset pagination when the request has ?cursor=.
+    Subclasses set page_size / max_page_size as usual; page_size_query_param
+    applies to both modes.
+    """
+    cursor_query_param = 'cursor'
+    count_query_param = 'count'
+
+    keyset = False
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = self.cursor_query_param in request.query_params
+        if not self.keyset:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        self.display_page_controls = False
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        columns = keyset_columns(queryset)
+        if columns is None:
+            raise ValidationError({'error': 'This ordering does not support cursor pagination'})
+
+        self.count = None
+        if request.query_params.get(self.count_query_param, '').lower() in ('1', 'true', 'yes'):
+            self.count = self.get_count(queryset, view)
+
+        queryset = queryset.order_by(*(column.order_by for column in columns)).annotate(
+            **{f'keyset_{index}': F(column.path) for index, column in enumerate(columns)}
+        )
+        cursor = request.query_params[self.cursor_query_param]
+        if cursor:
+            condition = _after(columns, self.decode_values(cursor, columns))
+            if condition is None:
+                queryset = queryset.none()
+            else:
+                queryset = queryset.filter(condition)
+
+        rows = list(queryset[:page_size + 1])
+        self.next_cursor = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            last = rows[-1]
+            values = [
+                last[f'keyset_{index}'] if isinstance(last, dict) else getattr(last, f'keyset_{index}')
+                for index in range(len(columns))
+            ]
+            self.next_cursor = encode_cursor([_cursor_value(value) for value in values])
+        return rows
+
+    def decode_values(self, cursor, columns):
+        values = decode_cursor(cursor)
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValidationError({'error': 'Invalid cursor'})
+        try:
+            return [
+                None if value is None else column.field.to_python(value)
+                for column, value in zip(columns, values)
+            ]
+        except (DjangoValidationError, TypeError, ValueError):
+            raise ValidationError({'error': 'Invalid cursor'})
+
+    def get_count(self, queryset, view):
+        """Total rows of the filtered queryset, cached until one of the view's models changes"""
+        queryset = queryset.order_by()
+        get_models = getattr(view, 'get_conditional_models', None)
+        models = get_models() if get_models else [queryset.model]
+        sql, params = queryset.query.sql_with_params()
+        digest = hashlib.md5(repr((sql, params, get_model_versions(models))).encode()).hexdigest()
+        key = f'keyset_count:{queryset.model._meta.label_lower}:{digest}'
+        count = cache.get(key)
+        if count is None:
+            count = queryset.count()
+            cache.set(key, count, COUNT_TIMEOUT)
+        return count
+
+    def get_next_link(self):
+        if not self.keyset:
+            return super().get_next_link()
+        if self.next_cursor is None:
+            return None
+        url = remove_query_param(self.request.build_absolute_uri(), self.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_paginated_response(self, data):
+        if not self.keyset:
+            return super().get_paginated_response(data)
+        payload = {} if self.count is None else {'count': self.count}
+        payload.update({
+            'next': self.get_next_link(),
+            'next_cursor': self.next_cursor,
+            'results': data,
+        })
+        return Response(payload)
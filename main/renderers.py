@@ -0,0 +1,142 @@
+"""
+Faster DRF renderers.
+
+ORJSONRenderer renders application/json with orjson. Its output is the same
+JSON DRF's JSONRenderer produces: types orjson does not handle the DRF way
+(Decimal, datetime, date, time, timedelta, lazy strings, querysets) go through
+DRF's own JSONEncoder.default. UUIDs are written by orjson natively, in the same
+form as str(uuid). Without orjson installed it falls back to DRF's renderer.
+
+MessagePackRenderer renders application/msgpack for clients that ask for it
+with `Accept: application/msgpack` (or ?format=msgpack). Values are converted
+with the same rules, so a msgpack response decodes to the JSON response's data.
+
+ColumnarRenderer (?format=columnar) sends list responses as column names plus
+row arrays, with choice labels dictionary-encoded, for the large tracker lists.
+
+`manage.py benchmark_renderers` compares them on the largest tracker payloads.
+"""
+from rest_framework import serializers
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
+
+
+_encoder = JSONEncoder()
+
+
+def encode_default(obj):
+    """Convert a value the fast encoders cannot serialize, exactly as DRF's JSONEncoder would"""
+    return _encoder.default(obj)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    application/json via orjson. Indented output (the browsable API, or an
+    `indent=` media type parameter) and non-compact settings keep using DRF's
+    encoder, so only the compact responses real clients get take the fast path.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        renderer_context = renderer_context or {}
+        if (not HAS_ORJSON or self.ensure_ascii or not self.compact
+                or self.get_indent(accepted_media_type, renderer_context)):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(
+            data,
+            default=encode_default,
+            # datetimes are formatted by DRF's rules (millisecond precision, 'Z' for UTC)
+            option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+        )
+        # Same escaping DRF applies, so the JSON is also valid JavaScript
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
+
+
+class MessagePackRenderer(BaseRenderer):
+    """application/msgpack, selected only when the client asks for it"""
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return msgpack.packb(data, default=encode_default, use_bin_type=True, datetime=False)
+
+
+
+class ColumnarRenderer(ORJSONRenderer):
+    """
+    Compact encoding of list responses, selected with ?format=columnar:
+
+        {"columns": ["id", "status", "status_display", ...],
+         "rows": [[12, 0, 0, ...], [13, 1, 1, ...]],
+         "dictionaries": {"status": ["passed", "1st_reading"], "status_display": [...]}}
+
+    Each row holds its values in `columns` order. Dictionary-encoded columns hold
+    indexes into dictionaries[column] (null stays null); these are the serializer's
+    choice fields (ChoiceField and source='get_<field>_display') plus the view's
+    columnar_dictionary_fields. A paginated response keeps count/next/previous and
+    carries the block as `results`. Anything else (detail views, errors) is
+    rendered as plain JSON.
+    """
+    media_type = 'application/vnd.pwatch.columnar+json'
+    format = 'columnar'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        view = (renderer_context or {}).get('view')
+        if isinstance(data, list):
+            data = self.encode(data, self.get_dictionary_fields(view))
+        elif isinstance(data, dict) and isinstance(data.get('results'), list):
+            data = {**data, 'results': self.encode(data['results'], self.get_dictionary_fields(view))}
+        return super().render(data, accepted_media_type, renderer_context)
+
+    @staticmethod
+    def get_dictionary_fields(view):
+        fields = set(getattr(view, 'columnar_dictionary_fields', []))
+        if hasattr(view, 'get_serializer_class'):
+            for name, field in view.get_serializer_class()().fields.items():
+                source = field.source or ''
+                if isinstance(field, serializers.ChoiceField) or (source.startswith('get_') and source.endswith('_display')):
+                    fields.add(name)
+        return fields
+
+    @staticmethod
+    def encode(items, dictionary_fields):
+        """The columnar block for a list of objects; a list of anything else is returned unchanged"""
+        if not all(isinstance(item, dict) for item in items):
+            return items
+        columns = list(dict.fromkeys(key for item in items for key in item))
+        encoded = [(index, {}) for index, column in enumerate(columns) if column in dictionary_fields]
+
+        rows = []
+        for item in items:
+            row = [item.get(column) for column in columns]
+            for index, labels in encoded:
+                value = row[index]
+                if value is not None:
+                    row[index] = labels.setdefault(value, len(labels))
+            rows.append(row)
+
+        return {
+            'columns': columns,
+            'rows': rows,
+            'dictionaries': {columns[index]: list(labels) for index, labels in encoded},
+        }
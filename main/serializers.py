@@ -0,0 +1,112 @@
+"""
+Read-only fast path for hot list endpoints.
+
+A ValuesSerializer produces exactly what `serializer_class(rows, many=True).data`
+would, but from a values() projection: no model instances are built and no
+per-row attribute or SerializerMethodField lookups run. Values still go through
+the DRF fields' own to_representation, so dates, decimals etc. are formatted
+identically. `manage.py benchmark_serializers` checks the output byte-for-byte.
+"""
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.storage import FileSystemStorage
+from django.utils.encoding import filepath_to_uri
+
+from main.utils import get_full_media_url, get_media_url_prefix
+
+
+class ValuesSerializer:
+    """
+    Fields of serializer_class are produced as follows:
+      - a method get_<field_name>(row) on the subclass, if defined (use for
+        SerializerMethodFields; list the columns it reads in extra_columns)
+      - media_fields: output field -> FileField column, rendered like
+        get_full_media_url(instance.<column>.url)
+      - display_fields: output field -> column, looked up in the column's choices
+        (source='get_<column>_display' fields are detected automatically)
+      - anything else: the model column named by the field's source
+
+    fields limits the output to those field names (sparse fieldsets); only the
+    columns they read are selected.
+    """
+    serializer_class = None
+    media_fields = {}
+    display_fields = {}
+    extra_columns = []
+
+    def __init__(self, fields=None):
+        self.plan = []
+        self.columns = list(self.extra_columns)
+        model = self.serializer_class.Meta.model
+        concrete_columns = {f.attname for f in model._meta.concrete_fields} | {f.name for f in model._meta.concrete_fields}
+
+        for name, field in self.serializer_class().fields.items():
+            if field.write_only or (fields is not None and name not in fields):
+                continue
+            method = getattr(self, f'get_{name}', None)
+            if method is not None:
+                self.plan.append((name, method))
+            elif name in self.media_fields:
+                self._add_column(self.media_fields[name])
+                self.plan.append((name, self._media_converter(model, self.media_fields[name])))
+            elif name in self.display_fields or (field.source.startswith('get_') and field.source.endswith('_display')):
+                column = self.display_fields.get(name) or field.source[len('get_'):-len('_display')]
+                self._add_column(column)
+                self.plan.append((name, self._choice_converter(model, column, field)))
+            elif field.source in concrete_columns:
+                self._add_column(field.source)
+                self.plan.append((name, self._column_converter(field.source, field)))
+            else:
+                raise ImproperlyConfigured(
+                    f'{type(self).__name__} cannot project {self.serializer_class.__name__}.{name}; '
+                    f'define get_{name}(row) or map it in media_fields/display_fields'
+                )
+
+    def _add_column(self, column):
+        if column not in self.columns:
+            self.columns.append(column)
+
+    @staticmethod
+    def _column_converter(column, field):
+        to_representation = field.to_representation
+
+        def convert(row):
+            value = row[column]
+            return None if value is None else to_representation(value)
+        return convert
+
+    @staticmethod
+    def _choice_converter(model, column, field):
+        choices = dict(model._meta.get_field(column).flatchoices)
+        to_representation = field.to_representation
+
+        def convert(row):
+            value = row[column]
+            label = choices.get(value, value)
+            return None if label is None else to_representation(label)
+        return convert
+
+    @staticmethod
+    def _media_converter(model, column):
+        storage = model._meta.get_field(column).storage
+        if isinstance(storage, FileSystemStorage) and storage.base_url == '/media/':
+            # Same result as get_full_media_url(storage.url(name)), without the urljoin
+            prefix = get_media_url_prefix()
+
+            def convert(row):
+                name = row[column]
+                return f'{prefix}/{filepath_to_uri(name).lstrip("/")}' if name else None
+        else:
+            def convert(row):
+                name = row[column]
+                return get_full_media_url(storage.url(name)) if name else None
+        return convert
+
+    def project(self, queryset):
+        """The queryset reduced to the columns this serializer reads"""
+        return queryset.prefetch_related(None).values(*(self.columns or ['pk']))
+
+    def to_representation(self, row):
+        return {name: convert(row) for name, convert in self.plan}
+
+    def serialize(self, rows):
+        return [self.to_representation(row) for row in rows]
@@ -41,6 +41,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'ckeditor',
     'ckeditor_uploader',
     'accounts',
@@ -54,6 +55,7 @@ INSTALLED_APPS = [
     'trackers',
     'chatbot',
     'settings',
+    'search',
     'rest_framework',
     'corsheaders',
 ]
@@ -145,6 +147,13 @@ STATIC_ROOT = BASE_DIR / 'staticfiles'
 STATICFILES_DIRS = [
     BASE_DIR / 'main' / 'static',
 ]
+
+# Pre-rendered JSON snapshots of read-mostly payloads (see main/snapshots.py),
+# served by WhiteNoise from main/wsgi.py. Kept outside STATIC_ROOT because they
+# are rewritten at runtime, after WhiteNoise has indexed the static files.
+SNAPSHOT_ROOT = BASE_DIR / 'snapshots'
+SNAPSHOT_URL = '/snapshots/'
+SNAPSHOT_MAX_AGE = 60 * 5  # stable names; hashed names are cached as immutable
 # Media files configuration
 MEDIA_URL = '/media/'
 
@@ -215,21 +224,100 @@ CSRF_TRUSTED_ORIGINS = [
     "http://127.0.0.1:3001",
 ]
 
+# Django REST framework
+# JSON is rendered with orjson (main/renderers.py); ?format=columnar gives the compact
+# list encoding, and clients may request MessagePack with `Accept: application/msgpack`
+# when the msgpack package is installed.
+REST_FRAMEWORK = {
+    'DEFAULT_RENDERER_CLASSES': [
+        'main.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+        'main.renderers.ColumnarRenderer',
+        'main.renderers.MessagePackRenderer',
+    ],
+}
+
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # Cache configuration
+# 'default' is a two-tier cache (main/cache.py): a small per-process L1 in front of
+# the 'shared' L2 that all gunicorn workers read and invalidate together.
+# L2 is Redis when REDIS_URL is set (requires the `redis` package), otherwise a
+# local stand-in selected by CACHE_L2_BACKEND: 'file' (default) or 'db'
+# (run `python manage.py createcachetable` once for 'db').
+REDIS_URL = config('REDIS_URL', default='')
+CACHE_L2_BACKEND = config('CACHE_L2_BACKEND', default='redis' if REDIS_URL else 'file')
+
+if CACHE_L2_BACKEND == 'redis':
+    SHARED_CACHE = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': REDIS_URL,
+    }
+elif CACHE_L2_BACKEND == 'db':
+    SHARED_CACHE = {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'django_cache',
+        'OPTIONS': {
+            'MAX_ENTRIES': 5000
+        }
+    }
+else:
+    SHARED_CACHE = {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': config('CACHE_L2_LOCATION', default=str(BASE_DIR / '.django_cache')),
+        'OPTIONS': {
+            'MAX_ENTRIES': 5000
+        }
+    }
+
 CACHES = {
     'default': {
-        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
-        'LOCATION': 'unique-snowflake',
+        'BACKEND': 'main.cache.TieredCache',
         'TIMEOUT': 300,  # 5 minutes default timeout
         'OPTIONS': {
-            'MAX_ENTRIES': 1000
+            'L2': 'shared',
+            'L1_TIMEOUT': 5,  # max seconds a worker serves a value from its own memory
+            'L1_MAX_ENTRIES': 1000,
         }
-    }
+    },
+    'shared': {
+        **SHARED_CACHE,
+        'TIMEOUT': 300,
+        'KEY_PREFIX': 'pwatch',
+    },
 }
 
+# Home page payload caches are invalidated on save/delete (main.cache.CACHE_DEPENDENCIES),
+# so they can live for hours instead of minutes
+HOME_CACHE_TIMEOUT = 60 * 60 * 6
+# Past HOME_CACHE_TIMEOUT (or after invalidation) payloads are served stale while
+# one worker rebuilds them; they are dropped entirely after this long
+HOME_CACHE_STALE_TIMEOUT = 60 * 60 * 24
+
+# Cached summary, bundle and search payloads keep pre-compressed gzip/brotli bodies
+# (main/compression.py); smaller bodies are sent uncompressed
+RESPONSE_COMPRESSION_MIN_SIZE = 1024
+
+# Stale-while-revalidate rebuilds (see main/cache.py)
+CACHE_REBUILD_WORKERS = 2
+CACHE_LOCK_TIMEOUT = 60  # seconds a rebuild lock is held at most
+CACHE_STATS_FLUSH_INTERVAL = 10  # seconds between pushes of hit/stale/miss counters
+
+# Totals for keyset-paginated lists (?cursor=...&count=1, see main/pagination.py);
+# keys include the list's model versions, so writes expire them anyway
+PAGINATION_COUNT_TIMEOUT = 60 * 60
+
+# Document text extraction for search (see search/extraction.py)
+DOCUMENT_EXTRACTION_WORKERS = 2
+DOCUMENT_SEARCH_MAX_INDEXED_CHARS = 500000
+
+# Search analytics (see search/analytics.py): fraction of searches logged and
+# how the in-memory buffer is flushed to the database
+SEARCH_ANALYTICS_SAMPLE_RATE = config('SEARCH_ANALYTICS_SAMPLE_RATE', default=1.0, cast=float)
+SEARCH_ANALYTICS_BATCH_SIZE = 50
+SEARCH_ANALYTICS_FLUSH_INTERVAL = 30  # seconds
+
 # CKEditor Configuration
 CKEDITOR_CONFIGS = {
     'default': {
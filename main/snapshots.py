@@ -0,0 +1,190 @@
+"""
+Static JSON snapshots of read-mostly API payloads.
+
+Content that changes a few times a month (About page sections, settings
+payloads, parliament terms) is pre-rendered to JSON files under SNAPSHOT_ROOT,
+together with gzip and (if the Brotli package is installed) brotli variants.
+main/wsgi.py serves the directory with WhiteNoise at SNAPSHOT_URL, so these
+requests never reach a Django view or the database.
+
+Each snapshot is written twice: <name>.json, a stable URL revalidated every
+SNAPSHOT_MAX_AGE seconds, and <name>.<hash>.json, a content-addressed copy
+cached as immutable. manifest.json maps each name to its current hashed URL.
+
+Snapshots are re-exported in the background whenever one of their models is
+saved or deleted, and in full by `manage.py export_snapshots` (run on deploy).
+"""
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from django.apps import apps
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+from django.db.models.signals import post_save, post_delete
+from django.http import HttpRequest
+from django.utils.module_loading import import_string
+from main.renderers import ORJSONRenderer
+
+try:
+    import brotli
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_ROOT = Path(getattr(settings, 'SNAPSHOT_ROOT', settings.BASE_DIR / 'snapshots'))
+SNAPSHOT_URL = getattr(settings, 'SNAPSHOT_URL', '/snapshots/')
+KEEP_HASHED_VERSIONS = 3
+
+HASHED_NAME_RE = re.compile(r'\.[0-9a-f]{12}\.json$')
+
+_exporter = ThreadPoolExecutor(max_workers=1, thread_name_prefix='snapshot-export')
+
+
+def _viewset_list(path):
+    """
+    Builder returning the same list a (non-paginated) viewset's list action returns
+    to an anonymous GET: the viewset's own get_queryset, filter backends and serializer.
+    """
+    def build():
+        request = HttpRequest()
+        request.method = 'GET'
+        viewset = import_string(path)(action_map={'get': 'list'}, args=(), kwargs={}, format_kwarg=None)
+        viewset.request = viewset.initialize_request(request)
+        queryset = viewset.filter_queryset(viewset.get_queryset())
+        return viewset.get_serializer(queryset, many=True).data
+    return build
+
+
+def _cached_payload(path, builder_name):
+    """Builder calling a view's stale_while_revalidate payload builder directly, bypassing the cache"""
+    def build():
+        return getattr(import_string(path), builder_name).__wrapped__()
+    return build
+
+
+# Snapshot name (also its path under SNAPSHOT_URL) -> (builder, model labels it reads)
+SNAPSHOTS = {
+    'about/objectives': (_viewset_list('about.views.ObjectiveViewSet'), ['about.Objective']),
+    'about/team-members': (_viewset_list('about.views.TeamMemberViewSet'), ['about.TeamMember']),
+    'about/who-we-are': (_viewset_list('about.views.WhoWeAreViewSet'), ['about.WhoWeAre']),
+    'about/our-story': (_viewset_list('about.views.OurStoryViewSet'), ['about.OurStory']),
+    'about/what-sets-us-apart': (_viewset_list('about.views.WhatSetsUsApartViewSet'), ['about.WhatSetsUsApart']),
+    'about/partners': (_viewset_list('about.views.PartnerViewSet'), ['about.Partner']),
+    'settings/citizens-voice-feedback': (
+        _cached_payload('settings.views.CitizensVoiceFeedbackLinksView', 'build_links'),
+        ['settings.CitizensVoiceFeedbackLinks'],
+    ),
+    'settings/footer-documents': (
+        _cached_payload('settings.views.FooterDocumentsView', 'build_documents'),
+        ['settings.FooterDocuments'],
+    ),
+    'settings/page-hero-images': (_viewset_list('settings.views.PageHeroImageViewSet'), ['settings.PageHeroImage']),
+    'trackers/parliament-terms': (_viewset_list('trackers.views.ParliamentTermViewSet'), ['trackers.ParliamentTerm']),
+}
+
+
+def _write_atomic(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as fh:
+            fh.write(content)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _write_variants(path, content):
+    """Write a file plus its .gz (and .br) variants, which WhiteNoise serves by Accept-Encoding"""
+    _write_atomic(path, content)
+    _write_atomic(path.with_name(path.name + '.gz'), gzip.compress(content, compresslevel=9, mtime=0))
+    if HAS_BROTLI:
+        _write_atomic(path.with_name(path.name + '.br'), brotli.compress(content, quality=11))
+
+
+def _hashed_paths(name):
+    base = SNAPSHOT_ROOT / name
+    candidates = base.parent.glob(f'{base.name}.*.json') if base.parent.exists() else []
+    hashed = [path for path in candidates if HASHED_NAME_RE.search(path.name)]
+    return sorted(hashed, key=lambda path: path.stat().st_mtime, reverse=True)
+
+
+def export_snapshot(name):
+    """Render one snapshot to disk. Returns the hashed URL."""
+    build, _ = SNAPSHOTS[name]
+    content = ORJSONRenderer().render(build())
+    digest = hashlib.md5(content).hexdigest()[:12]
+
+    stable_path = SNAPSHOT_ROOT / f'{name}.json'
+    hashed_path = SNAPSHOT_ROOT / f'{name}.{digest}.json'
+    if not hashed_path.exists():
+        _write_variants(hashed_path, content)
+    else:
+        os.utime(hashed_path)
+    _write_variants(stable_path, content)
+
+    # Keep a few old hashed copies for clients still holding an older manifest
+    for old_path in _hashed_paths(name)[KEEP_HASHED_VERSIONS:]:
+        for path in (old_path, old_path.with_name(old_path.name + '.gz'), old_path.with_name(old_path.name + '.br')):
+            path.unlink(missing_ok=True)
+
+    return f'{SNAPSHOT_URL}{name}.{digest}.json'
+
+
+def write_manifest():
+    """Rebuild manifest.json from the files on disk, so concurrent exporters cannot lose entries"""
+    manifest = {}
+    for name in SNAPSHOTS:
+        hashed = _hashed_paths(name)
+        if hashed:
+            manifest[name] = f'{SNAPSHOT_URL}{hashed[0].relative_to(SNAPSHOT_ROOT).as_posix()}'
+    _write_variants(SNAPSHOT_ROOT / 'manifest.json', json.dumps(manifest, sort_keys=True).encode())
+    return manifest
+
+
+def export_snapshots(names=None):
+    """Export the given snapshots (default: all) and refresh the manifest. Returns {name: url}."""
+    exported = {}
+    for name in names or SNAPSHOTS:
+        exported[name] = export_snapshot(name)
+    write_manifest()
+    return exported
+
+
+def _export_in_background(names):
+    close_old_connections()
+    try:
+        export_snapshots(names)
+    except Exception as e:
+        logger.warning(f"Snapshot export of {', '.join(names)} failed: {e}")
+    finally:
+        connection.close()
+
+
+def schedule_export(sender, **kwargs):
+    """post_save/post_delete receiver: re-export every snapshot built from the sender model"""
+    label = sender._meta.label
+    names = [name for name, (_, labels) in SNAPSHOTS.items() if label in labels]
+    if names:
+        transaction.on_commit(lambda: _exporter.submit(_export_in_background, names))
+
+
+def connect_snapshot_export():
+    """Connect the re-export receivers for every model a snapshot reads. Call once apps are ready."""
+    labels = {label for _, labels in SNAPSHOTS.values() for label in labels}
+    for label in labels:
+        model = apps.get_model(label)
+        post_save.connect(schedule_export, sender=model, dispatch_uid=f'snapshot_export_save_{label}')
+        post_delete.connect(schedule_export, sender=model, dispatch_uid=f'snapshot_export_delete_{label}')
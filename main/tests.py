@@ -0,0 +1,118 @@
+import datetime
+
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+
+from about.models import Objective, Partner, TeamMember
+from home.management.commands.benchmark_serializers import Command as BenchmarkSerializers
+from main.compression import HAS_BROTLI, encode_payload, entry_response
+from main.renderers import ORJSONRenderer
+from main.snapshots import SNAPSHOTS
+from multimedia.models import Gallery
+from news.models import News
+from trackers.models import Bill, District, MP, Party
+
+
+class CachedPayloadView(APIView):
+    authentication_classes = []
+    permission_classes = []
+
+    data = {'results': [{'id': index, 'title': f'Item {index}', 'summary': 'text ' * 20} for index in range(50)]}
+
+    def get(self, request):
+        return entry_response(request, {'data': self.data, 'encoded': encode_payload(self.data)})
+
+
+class PrecompressedResponseTests(SimpleTestCase):
+    def get(self, accept_encoding):
+        request = APIRequestFactory().get('/', HTTP_ACCEPT_ENCODING=accept_encoding)
+        return CachedPayloadView.as_view()(request)
+
+    def test_brotli_available(self):
+        self.assertTrue(HAS_BROTLI)
+
+    def test_br_negotiated(self):
+        response = self.get('gzip, deflate, br')
+        self.assertEqual(response['Content-Encoding'], 'br')
+        self.assertIn('Accept-Encoding', response['Vary'])
+
+    def test_gzip_without_br(self):
+        response = self.get('gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+
+    def test_identity_without_accept_encoding(self):
+        response = self.get('')
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+
+class ValuesSerializerTests(TestCase):
+    """Each values() fast path renders the same JSON as its model serializer"""
+
+    @classmethod
+    def setUpTestData(cls):
+        named = User.objects.create(username='editor', first_name='Jane', last_name='Doe')
+        unnamed = User.objects.create(username='desk')
+        for index, (author, image) in enumerate([(named, 'news/a b.jpg'), (unnamed, ''), (None, None)]):
+            News.objects.create(
+                title=f'Story {index}', slug=f'story-{index}', author=author, category='parliament',
+                content='<p>Body</p>', image=image, status='published',
+            )
+
+        party = Party.objects.create(name='NRM')
+        district = District.objects.create(name='Kampala')
+        MP.objects.create(
+            first_name='Ann', last_name='Apio', name='Ann Apio', party=party, district=district,
+            constituency='Central', photo='mps/ann.jpg', email='ann@example.org',
+        )
+        MP.objects.create(first_name='Bob', middle_name='K', last_name='Okello', name='Bob K Okello', constituency='North')
+
+        Bill.objects.create(
+            title='Finance Bill', bill_type='government', year_introduced=datetime.date(2024, 7, 1),
+            mover='Minister', assigned_to='Budget Committee', status='passed',
+        )
+        Bill.objects.create(
+            title='Unknown choice', bill_type='other', year_introduced=datetime.date(2023, 1, 5),
+            mover='Member', assigned_to='Legal Committee',
+        )
+
+        Gallery.objects.create(title='Opening', image='gallery/opening.jpg', event_date=datetime.date(2024, 6, 1), featured=True)
+        Gallery.objects.create(title='Sitting', image='gallery/sitting.png', tags='plenary')
+
+    def test_fast_paths_match_model_serializers(self):
+        renderer = JSONRenderer()
+        for label, queryset, serializer_class, values_serializer_class in BenchmarkSerializers().get_cases():
+            with self.subTest(label):
+                expected = serializer_class(queryset.all(), many=True).data
+                values_serializer = values_serializer_class()
+                actual = values_serializer.serialize(values_serializer.project(queryset.all()))
+                self.assertTrue(expected)
+                self.assertEqual(renderer.render(actual), renderer.render(expected))
+
+
+class SnapshotTests(TestCase):
+    """Viewset snapshots hold the bytes the live list endpoint returns"""
+
+    @classmethod
+    def setUpTestData(cls):
+        Objective.objects.create(title='Second', description='Text', order=2)
+        Objective.objects.create(title='First', description='Text', order=1)
+        Objective.objects.create(title='Hidden', description='Text', is_active=False)
+        TeamMember.objects.create(name='Ann', title='Editor', photo='team/ann.jpg')
+        TeamMember.objects.create(name='Bob', title='Former', is_active=False)
+        Partner.objects.create(name='Partner', logo='partners/logo.png')
+
+    def test_snapshots_match_list_responses(self):
+        renderer = ORJSONRenderer()
+        viewset_snapshots = [
+            'about/objectives', 'about/team-members', 'about/who-we-are', 'about/our-story',
+            'about/what-sets-us-apart', 'about/partners', 'settings/page-hero-images', 'trackers/parliament-terms',
+        ]
+        for name in viewset_snapshots:
+            build, _ = SNAPSHOTS[name]
+            with self.subTest(name):
+                response = self.client.get(f'/api/{name}/')
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(renderer.render(build()), response.content)
@@ -27,6 +27,7 @@ urlpatterns = [
     path('admin/', admin.site.urls),
     path('ckeditor/', include('ckeditor_uploader.urls')),
     path('api/search/', views.GlobalSearchView.as_view(), name='global-search'),
+    path('api/cache/stats/', views.CacheStatsView.as_view(), name='cache-stats'),
     path('api/trackers/', include('trackers.urls')),
     path('api/news/', include('news.urls')),
     path('api/blog/', include('blog.urls')),
@@ -2,10 +2,28 @@
 Utility functions for the main app
 """
 import re
+from functools import lru_cache
 from django.conf import settings
 from decouple import config
 
 
+@lru_cache(maxsize=None)
+def get_media_url_prefix():
+    """
+    Absolute base URL for media files, without trailing slash
+    (e.g. 'https://backend.example.com/media'). Resolved once per process.
+    """
+    full_media_url = getattr(settings, 'FULL_MEDIA_URL', None)
+    if not full_media_url:
+        if settings.DEBUG:
+            full_media_url = f"http://localhost:8000{settings.MEDIA_URL}"
+        else:
+            # In production, try to get from environment or use default
+            backend_domain = config('BACKEND_DOMAIN', default='https://pwatch-backend-production.up.railway.app')
+            full_media_url = f"{backend_domain}{settings.MEDIA_URL}"
+    return full_media_url.rstrip('/')
+
+
 def get_full_media_url(relative_url):
     """
     Convert a relative media URL to a full backend URL.
@@ -25,20 +43,13 @@ def get_full_media_url(relative_url):
     elif relative_url.startswith('media/'):
         relative_url = relative_url[6:]  # Remove 'media/'
     
-    # Get full media URL from settings
-    full_media_url = getattr(settings, 'FULL_MEDIA_URL', None)
-    if full_media_url:
-        # Remove trailing slash if present
-        full_media_url = full_media_url.rstrip('/')
-        return f"{full_media_url}/{relative_url}"
-    
-    # Fallback: construct from MEDIA_URL
-    if settings.DEBUG:
-        return f"http://localhost:8000{settings.MEDIA_URL}{relative_url}"
-    else:
-        # In production, try to get from environment or use default
-        backend_domain = config('BACKEND_DOMAIN', default='https://pwatch-backend-production.up.railway.app')
-        return f"{backend_domain}{settings.MEDIA_URL}{relative_url}"
+    return f"{get_media_url_prefix()}/{relative_url}"
+
+
+# Match img tags with src="/media/...", src="media/...", or src="ckeditor/..."
+# Pattern: <img ... src="..." ...> or <img ... src='...' ...>
+# Group 1: before src value, Group 2: src value, Group 3: quote and after
+IMG_SRC_PATTERN = re.compile(r'(<img[^>]*\ssrc=["\'])([^"\']+)(["\'][^>]*>)', re.IGNORECASE)
 
 
 def process_content_images(html_content):
@@ -54,19 +65,8 @@ def process_content_images(html_content):
     if not html_content:
         return html_content
     
-    # Get full media URL base
-    full_media_url = getattr(settings, 'FULL_MEDIA_URL', None)
-    if not full_media_url:
-        if settings.DEBUG:
-            full_media_url = f"http://localhost:8000{settings.MEDIA_URL}"
-        else:
-            backend_domain = config('BACKEND_DOMAIN', default='https://pwatch-backend-production.up.railway.app')
-            full_media_url = f"{backend_domain}{settings.MEDIA_URL}"
+    full_media_url = get_media_url_prefix()
     
-    full_media_url = full_media_url.rstrip('/')
-    
-    # Pattern to match img tags with src attributes
-    # Matches: <img src="/media/..." or <img src="media/..." or <img src="ckeditor/..."
     def replace_image_url(match):
         before_src = match.group(1)  # Everything before src value
         src_value = match.group(2)  # The src URL value
@@ -92,12 +92,28 @@ def process_content_images(html_content):
         # Reconstruct the img tag with absolute URL
         return f"{before_src}{absolute_url}{after_src}"
     
-    # Replace img src attributes
-    # Match img tags with src="/media/...", src="media/...", or src="ckeditor/..."
-    # Pattern: <img ... src="..." ...> or <img ... src='...' ...>
-    # Group 1: before src value, Group 2: src value, Group 3: quote and after
-    pattern = r'(<img[^>]*\ssrc=["\'])([^"\']+)(["\'][^>]*>)'
-    html_content = re.sub(pattern, replace_image_url, html_content, flags=re.IGNORECASE)
-    
-    return html_content
+    return IMG_SRC_PATTERN.sub(replace_image_url, html_content)
+
+
+def render_rich_text(instance, fields, update_fields=None):
+    """
+    Store the rendered (absolute image URL) HTML of rich text fields on the instance,
+    so serializers can return it without processing the HTML on every read.
+    Call from save(); `fields` maps source field -> rendered field. Returns
+    update_fields extended with the rendered fields whose source is being saved.
+    """
+    if update_fields is not None:
+        update_fields = set(update_fields)
+        fields = {source: rendered for source, rendered in fields.items() if source in update_fields}
+        update_fields.update(fields.values())
+    for source, rendered in fields.items():
+        setattr(instance, rendered, process_content_images(getattr(instance, source)) or '')
+    return update_fields
+
 
+def rendered_rich_text(instance, source, rendered):
+    """Stored rendered HTML, or the source rendered now for rows saved before it existed"""
+    value = getattr(instance, rendered, '')
+    if value:
+        return value
+    return process_content_images(getattr(instance, source))
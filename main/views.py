@@ -4,11 +4,11 @@ from django.contrib.admin.views.decorators import staff_member_required
 from django.conf import settings
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from rest_framework.permissions import AllowAny
-from django.core.cache import cache
+from rest_framework.permissions import AllowAny, IsAdminUser
 from django.db.models import Q
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import os
+import time
 import zipfile
 import tempfile
 from pathlib import Path
@@ -19,6 +19,10 @@ from blog.models import Blog
 from trackers.models import MP, Bill, Loan, Budget, Hansard, OrderPaper
 from resources.models import Explainers, Report, PartnerPublication, Statement
 from multimedia.models import Podcast, XSpace, Gallery, Poll
+from search.models import DocumentText
+from search.analytics import normalize_query, query_cache_key, record_search
+from main.cache import get_cache_stats, stale_while_revalidate
+from main.compression import entry_response
 
 # Import serializers
 from news.serializers import NewsListSerializer
@@ -38,14 +42,34 @@ def home(request):
     return render(request, 'main/home.html')
 
 
+class CacheStatsView(APIView):
+    """
+    Staff-only monitoring endpoint: hit / stale / miss / rebuild counts for every
+    stale-while-revalidate cache, summed across workers.
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(get_cache_stats())
+
+
 class GlobalSearchView(APIView):
     """
     Optimized global search endpoint that searches across all content types.
     Uses parallel queries, query optimization, and caching for sub-second performance.
+    Document categories also match the text of their uploaded files (see search app)
+    and include a highlighted `snippet` for file-text hits.
+    Requests are sampled into search analytics without blocking the response.
     """
     permission_classes = [AllowAny]
 
+    # Cache lifetime for search results (seconds); stale results are served
+    # while being rebuilt until cache_stale_timeout
+    cache_timeout = 600
+    cache_stale_timeout = 60 * 60
+
     def get(self, request):
+        started = time.perf_counter()
         query = request.query_params.get('q', '').strip()
         try:
             limit = int(request.query_params.get('limit', 5))  # Default 5 for dropdown, 20 for full page
@@ -62,13 +86,26 @@ class GlobalSearchView(APIView):
                 'counts': {}
             })
 
-        # Check cache first
-        cache_key = f'search:{query.lower()}:{limit}'
-        cached_result = cache.get(cache_key)
-        if cached_result:
-            return Response(cached_result)
-
-        # Perform parallel searches
+        entry, state = self.cached_search.lookup_entry(query, limit)
+
+        record_search(query, limit, entry['data'], (time.perf_counter() - started) * 1000, cache_hit=state != 'miss')
+        return entry_response(request, entry)
+
+    @staticmethod
+    @stale_while_revalidate(
+        'search', cache_timeout, cache_stale_timeout,
+        key=lambda query, limit: (query_cache_key(query), limit),
+        precompress=True,
+    )
+    def cached_search(query, limit):
+        """
+        Cached run_search, shared by the view and the warm_search_cache command.
+        Searches the normalized query, since that is what the entry is keyed on.
+        """
+        return GlobalSearchView().run_search(normalize_query(query), limit)
+
+    def run_search(self, query, limit):
+        """Search every content type in parallel and build the response payload"""
         results = {}
         counts = {}
         
@@ -112,18 +149,13 @@ class GlobalSearchView(APIView):
         total_results = sum(counts.values())
 
         # Prepare response
-        response_data = {
+        return {
             'query': query,
             'total_results': total_results,
             'results': results,
             'counts': counts
         }
 
-        # Cache for 10 minutes
-        cache.set(cache_key, response_data, 600)
-
-        return Response(response_data)
-
     def _search_news(self, query, limit):
         """Search news articles"""
         q = Q(title__icontains=query) | Q(author__username__icontains=query) | Q(author__first_name__icontains=query) | Q(author__last_name__icontains=query) | Q(content__icontains=query)
@@ -148,9 +180,9 @@ class GlobalSearchView(APIView):
 
     def _search_mps(self, query, limit):
         """Search Members of Parliament"""
-        q = Q(name__icontains=query) | Q(party__icontains=query) | Q(constituency__icontains=query) | Q(district__icontains=query)
-        queryset = MP.objects.filter(q).only(
-            'id', 'name', 'party', 'constituency', 'district', 'photo'
+        q = Q(name__icontains=query) | Q(party__name__icontains=query) | Q(constituency__icontains=query) | Q(district__name__icontains=query)
+        queryset = MP.objects.filter(q).select_related('party', 'district').only(
+            'id', 'name', 'party', 'party__name', 'constituency', 'district', 'district__name', 'photo'
         ).order_by('name')[:limit]
         
         serializer = MPListSerializer(queryset, many=True)
@@ -179,82 +211,102 @@ class GlobalSearchView(APIView):
         count = Loan.objects.filter(q).count()
         return serializer.data, count
 
+    def _document_q(self, model, query):
+        """Match objects whose uploaded file text (extracted at upload time) contains the query"""
+        matches = DocumentText.objects.for_model(model).matching(query).values('object_id')
+        return Q(pk__in=matches)
+
+    def _attach_snippets(self, data, model, query):
+        """Add a highlighted document snippet to each result whose file text matched"""
+        ids = [item['id'] for item in data]
+        snippets = {}
+        if ids:
+            snippets = dict(
+                DocumentText.objects.for_model(model).matching(query)
+                .filter(object_id__in=ids)
+                .with_headline(query)
+                .values_list('object_id', 'snippet')
+            )
+        for item in data:
+            item['snippet'] = snippets.get(item['id'])
+        return data
+
     def _search_budgets(self, query, limit):
         """Search budgets"""
-        q = Q(name__icontains=query) | Q(financial_year__icontains=query)
+        q = Q(name__icontains=query) | Q(financial_year__icontains=query) | self._document_q(Budget, query)
         queryset = Budget.objects.filter(q).only(
             'id', 'name', 'financial_year', 'file', 'created_at'
         ).order_by('-financial_year')[:limit]
         
         serializer = BudgetSerializer(queryset, many=True)
         count = Budget.objects.filter(q).count()
-        return serializer.data, count
+        return self._attach_snippets(serializer.data, Budget, query), count
 
     def _search_hansards(self, query, limit):
         """Search hansards"""
-        q = Q(name__icontains=query)
+        q = Q(name__icontains=query) | self._document_q(Hansard, query)
         queryset = Hansard.objects.filter(q).only(
             'id', 'name', 'date', 'file', 'created_at'
         ).order_by('-date')[:limit]
         
         serializer = HansardSerializer(queryset, many=True)
         count = Hansard.objects.filter(q).count()
-        return serializer.data, count
+        return self._attach_snippets(serializer.data, Hansard, query), count
 
     def _search_order_papers(self, query, limit):
         """Search order papers"""
-        q = Q(name__icontains=query) | Q(description__icontains=query)
+        q = Q(name__icontains=query) | Q(description__icontains=query) | self._document_q(OrderPaper, query)
         queryset = OrderPaper.objects.filter(q).only(
             'id', 'name', 'description', 'file', 'created_at'
         ).order_by('-created_at')[:limit]
         
         serializer = OrderPaperSerializer(queryset, many=True)
         count = OrderPaper.objects.filter(q).count()
-        return serializer.data, count
+        return self._attach_snippets(serializer.data, OrderPaper, query), count
 
     def _search_explainers(self, query, limit):
         """Search explainers"""
-        q = Q(name__icontains=query) | Q(description__icontains=query)
+        q = Q(name__icontains=query) | Q(description__icontains=query) | self._document_q(Explainers, query)
         queryset = Explainers.objects.filter(q).only(
             'id', 'name', 'description', 'file', 'created_at'
         ).order_by('-created_at')[:limit]
         
         serializer = ExplainersSerializer(queryset, many=True)
         count = Explainers.objects.filter(q).count()
-        return serializer.data, count
+        return self._attach_snippets(serializer.data, Explainers, query), count
 
     def _search_reports(self, query, limit):
         """Search reports"""
-        q = Q(name__icontains=query) | Q(description__icontains=query)
+        q = Q(name__icontains=query) | Q(description__icontains=query) | self._document_q(Report, query)
         queryset = Report.objects.filter(q).only(
             'id', 'name', 'description', 'file', 'created_at'
         ).order_by('-created_at')[:limit]
         
         serializer = ReportSerializer(queryset, many=True)
         count = Report.objects.filter(q).count()
-        return serializer.data, count
+        return self._attach_snippets(serializer.data, Report, query), count
 
     def _search_partner_publications(self, query, limit):
         """Search partner publications"""
-        q = Q(name__icontains=query) | Q(description__icontains=query)
+        q = Q(name__icontains=query) | Q(description__icontains=query) | self._document_q(PartnerPublication, query)
         queryset = PartnerPublication.objects.filter(q).only(
             'id', 'name', 'description', 'file', 'created_at'
         ).order_by('-created_at')[:limit]
         
         serializer = PartnerPublicationSerializer(queryset, many=True)
         count = PartnerPublication.objects.filter(q).count()
-        return serializer.data, count
+        return self._attach_snippets(serializer.data, PartnerPublication, query), count
 
     def _search_statements(self, query, limit):
         """Search statements"""
-        q = Q(name__icontains=query) | Q(description__icontains=query)
+        q = Q(name__icontains=query) | Q(description__icontains=query) | self._document_q(Statement, query)
         queryset = Statement.objects.filter(q).only(
             'id', 'name', 'description', 'file', 'created_at'
         ).order_by('-created_at')[:limit]
         
         serializer = StatementSerializer(queryset, many=True)
         count = Statement.objects.filter(q).count()
-        return serializer.data, count
+        return self._attach_snippets(serializer.data, Statement, query), count
 
     def _search_podcasts(self, query, limit):
         """Search podcasts"""
@@ -0,0 +1,100 @@
+"""
+Cache warm-up, so the first visitors after a deploy do not pay for cold caches.
+
+warm_shared_caches() rebuilds the stale_while_revalidate payloads in the shared
+cache (manage.py warm_caches, run once per deploy). warm_worker() prepares one
+gunicorn worker before it accepts traffic (see gunicorn.conf.py): it imports the
+URLconf and views, fills the worker's L1 cache and the ContentType cache.
+"""
+import logging
+import time
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import close_old_connections
+from django.urls import get_resolver
+
+from search.extraction import get_document_models
+
+
+logger = logging.getLogger(__name__)
+
+SEARCH_LIMITS = [5, 20]
+
+
+def get_payloads():
+    """(name, cached builder, argument tuples) for every payload worth warming"""
+    from blog.views import HomeBlogSummaryView
+    from home.views import HomeBundleView
+    from news.views import HomeNewsSummaryView, HotInParliamentView
+    from resources.views import HomeResourcesSummaryView
+    from settings.models import PageHeroImage
+    from settings.views import CitizensVoiceFeedbackLinksView, FooterDocumentsView, PageHeroImageViewSet
+    from trackers.models import Loan
+    from trackers.views import DebtDataViewSet, HomeSummaryView, LoanViewSet
+
+    page_slugs = PageHeroImage.objects.filter(is_active=True).values_list('page_slug', flat=True)
+    return [
+        ('home_trackers_summary', HomeSummaryView.build_summary, [()]),
+        ('home_news_summary', HomeNewsSummaryView.build_summary, [()]),
+        ('home_blog_summary', HomeBlogSummaryView.build_summary, [()]),
+        ('home_resources_summary', HomeResourcesSummaryView.build_summary, [()]),
+        ('hot_in_parliament', HotInParliamentView.build_items, [()]),
+        ('home_hero_images', HomeBundleView.build_hero_images, [()]),
+        ('home_headlines', HomeBundleView.build_headlines, [()]),
+        ('home_polls', HomeBundleView.build_polls, [()]),
+        ('settings_feedback_links', CitizensVoiceFeedbackLinksView.build_links, [()]),
+        ('settings_footer_documents', FooterDocumentsView.build_documents, [()]),
+        ('page_hero_images', PageHeroImageViewSet.build_hero_image, [(slug,) for slug in page_slugs]),
+        ('loan_analytics', LoanViewSet.build_analytics, [((), Loan.objects.all())]),
+        ('debt_series', DebtDataViewSet.build_series, [DebtDataViewSet.series_version()]),
+    ]
+
+
+def get_search_payloads(top=50, days=7, limits=SEARCH_LIMITS):
+    """Global search entries for the most popular recent queries"""
+    from main.views import GlobalSearchView
+    from search.analytics import popular_queries
+
+    queries = popular_queries(top, days)
+    return [('search', GlobalSearchView.cached_search, [(query, limit) for query in queries for limit in limits])]
+
+
+def warm_shared_caches(search_top=50, search_days=7):
+    """
+    Rebuild every payload in the shared cache. Returns {name: (entries, seconds, errors)}.
+    Failures are logged and counted, never raised, so one bad payload cannot fail a deploy.
+    """
+    payloads = get_payloads()
+    if search_top:
+        payloads += get_search_payloads(search_top, search_days)
+
+    results = {}
+    for name, builder, arg_list in payloads:
+        started = time.perf_counter()
+        errors = 0
+        for args in arg_list:
+            try:
+                builder.rebuild(*args)
+            except Exception as e:
+                errors += 1
+                logger.warning(f"Could not warm {name}{args}: {e}")
+        results[name] = (len(arg_list), time.perf_counter() - started, errors)
+    return results
+
+
+def warm_worker():
+    """Per-process warm-up: URLconf, views, ContentTypes and the L1 copies of the home payloads"""
+    started = time.perf_counter()
+    try:
+        get_resolver().url_patterns  # imports every app's urls and views
+        # Document search filters DocumentText by content type on every query
+        ContentType.objects.get_for_models(*(model for model, _ in get_document_models()))
+        for name, builder, arg_list in get_payloads():
+            for args in arg_list:
+                # lookup() reads through to the shared cache (building on a cold miss) and fills L1
+                builder.lookup(*args)
+    except Exception as e:
+        logger.warning(f"Worker warm-up incomplete: {e}")
+    finally:
+        close_old_connections()
+    logger.info(f"Worker warm-up finished in {time.perf_counter() - started:.2f}s")
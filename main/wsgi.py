@@ -10,7 +10,24 @@ https://docs.djangoproject.com/en/6.0/howto/deployment/wsgi/
 import os
 
 from django.core.wsgi import get_wsgi_application
+from whitenoise import WhiteNoise
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'main.settings')
 
 application = get_wsgi_application()
+
+# Serve the JSON snapshots (main/snapshots.py) straight from disk. autorefresh
+# makes WhiteNoise look files up per request, so snapshots re-exported after
+# startup are picked up; only this directory is served that way.
+from django.conf import settings  # noqa: E402
+from main.snapshots import HASHED_NAME_RE  # noqa: E402
+
+os.makedirs(settings.SNAPSHOT_ROOT, exist_ok=True)
+application = WhiteNoise(
+    application,
+    root=settings.SNAPSHOT_ROOT,
+    prefix=settings.SNAPSHOT_URL,
+    autorefresh=True,
+    max_age=settings.SNAPSHOT_MAX_AGE,
+    immutable_file_test=lambda path, url: bool(HASHED_NAME_RE.search(url)),
+)
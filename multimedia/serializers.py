@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from main.serializers import ValuesSerializer
 from main.utils import get_full_media_url
 from .models import XSpace, Podcast, Gallery, Poll, PollOption, PollVote, XPollEmbed, Trivia, TriviaQuestion, TriviaOption
 
@@ -86,6 +87,12 @@ class GallerySerializer(serializers.ModelSerializer):
         return None
 
 
+class GalleryValuesSerializer(ValuesSerializer):
+    """values() fast path for GallerySerializer (list endpoint)"""
+    serializer_class = GallerySerializer
+    media_fields = {'image': 'image'}
+
+
 class PollOptionSerializer(serializers.ModelSerializer):
     vote_count = serializers.IntegerField(read_only=True)
     vote_percentage = serializers.FloatField(read_only=True)
@@ -2,25 +2,26 @@ from django.views.decorators.csrf import csrf_exempt
 from rest_framework import viewsets, filters, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.pagination import PageNumberPagination
 from django_filters.rest_framework import DjangoFilterBackend
 from django.utils import timezone
-from .models import XSpace, Podcast, Gallery, Poll, PollOption, PollVote, XPollEmbed, Trivia, TriviaQuestion
+from main.mixins import ConditionalGetMixin, SparseFieldsetsMixin, ValuesListMixin
+from main.pagination import KeysetPageNumberPagination
+from .models import XSpace, Podcast, Gallery, Poll, PollOption, PollVote, XPollEmbed, Trivia, TriviaQuestion, TriviaOption
 from .serializers import (
-    XSpaceSerializer, PodcastSerializer, GallerySerializer,
+    XSpaceSerializer, PodcastSerializer, GallerySerializer, GalleryValuesSerializer,
     PollSerializer, PollOptionSerializer, PollVoteSerializer,
     XPollEmbedSerializer,
     TriviaListSerializer, TriviaDetailSerializer,
 )
 
 
-class XSpacePagination(PageNumberPagination):
+class XSpacePagination(KeysetPageNumberPagination):
     page_size = 12
     page_size_query_param = 'page_size'
     max_page_size = 100
 
 
-class XSpaceViewSet(viewsets.ModelViewSet):
+class XSpaceViewSet(ConditionalGetMixin, SparseFieldsetsMixin, viewsets.ModelViewSet):
     """
     ViewSet for X Spaces events
     
@@ -38,13 +39,13 @@ class XSpaceViewSet(viewsets.ModelViewSet):
     ordering = ['-scheduled_date', '-created_at']
 
 
-class PodcastPagination(PageNumberPagination):
+class PodcastPagination(KeysetPageNumberPagination):
     page_size = 12
     page_size_query_param = 'page_size'
     max_page_size = 100
 
 
-class PodcastViewSet(viewsets.ModelViewSet):
+class PodcastViewSet(ConditionalGetMixin, SparseFieldsetsMixin, viewsets.ModelViewSet):
     """
     ViewSet for Podcasts
     
@@ -62,13 +63,13 @@ class PodcastViewSet(viewsets.ModelViewSet):
     ordering = ['-published_date', '-created_at']
 
 
-class GalleryPagination(PageNumberPagination):
+class GalleryPagination(KeysetPageNumberPagination):
     page_size = 20
     page_size_query_param = 'page_size'
     max_page_size = 100
 
 
-class GalleryViewSet(viewsets.ModelViewSet):
+class GalleryViewSet(ConditionalGetMixin, SparseFieldsetsMixin, ValuesListMixin, viewsets.ModelViewSet):
     """
     ViewSet for Gallery Images
     
@@ -78,6 +79,7 @@ class GalleryViewSet(viewsets.ModelViewSet):
     """
     queryset = Gallery.objects.all().order_by('-featured', '-event_date', '-created_at')
     serializer_class = GallerySerializer
+    values_serializer_class = GalleryValuesSerializer
     pagination_class = GalleryPagination
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['category', 'featured']
@@ -86,13 +88,13 @@ class GalleryViewSet(viewsets.ModelViewSet):
     ordering = ['-featured', '-created_at']
 
 
-class PollPagination(PageNumberPagination):
+class PollPagination(KeysetPageNumberPagination):
     page_size = 10
     page_size_query_param = 'page_size'
     max_page_size = 50
 
 
-class PollViewSet(viewsets.ModelViewSet):
+class PollViewSet(ConditionalGetMixin, SparseFieldsetsMixin, viewsets.ModelViewSet):
     """
     ViewSet for Polls
     
@@ -101,6 +103,8 @@ class PollViewSet(viewsets.ModelViewSet):
     Search by title and description
     """
     queryset = Poll.objects.all().order_by('-featured', '-created_at')
+    conditional_models = [Poll, PollOption, PollVote]
+    conditional_lifetime = 60  # is_active depends on start_date/end_date
     serializer_class = PollSerializer
     pagination_class = PollPagination
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
@@ -213,19 +217,20 @@ class PollViewSet(viewsets.ModelViewSet):
         return ip
 
 
-class XPollEmbedViewSet(viewsets.ReadOnlyModelViewSet):
+class XPollEmbedViewSet(ConditionalGetMixin, SparseFieldsetsMixin, viewsets.ReadOnlyModelViewSet):
     """List and retrieve X (Twitter) poll embeds. Standalone, not linked to Poll."""
     queryset = XPollEmbed.objects.all()
     serializer_class = XPollEmbedSerializer
     pagination_class = None
 
 
-class TriviaViewSet(viewsets.ReadOnlyModelViewSet):
+class TriviaViewSet(ConditionalGetMixin, SparseFieldsetsMixin, viewsets.ReadOnlyModelViewSet):
     """
     List trivia sets (for cards) and retrieve a single trivia with questions (for play page).
     Only active trivia are listed.
     """
     queryset = Trivia.objects.filter(is_active=True).order_by('order', '-created_at')
+    conditional_models = [Trivia, TriviaQuestion, TriviaOption]
     pagination_class = None
 
     def get_serializer_class(self):
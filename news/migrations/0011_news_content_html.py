@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-19 13:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0010_alter_news_category'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='news',
+            name='content_html',
+            field=models.TextField(blank=True, editable=False, help_text='Content with absolute image URLs, rendered on save'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 6.0 on 2026-10-19 19:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0011_news_content_html'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='news',
+            index=models.Index(fields=['-published_date', '-created_at', '-id'], name='news_news_keyset_idx'),
+        ),
+    ]
@@ -1,11 +1,9 @@
 from django.db import models
-from django.db.models.signals import post_save, post_delete
-from django.dispatch import receiver
 from django.contrib.auth.models import User
 from django.utils import timezone
 from django.utils.text import slugify
-from django.core.cache import cache
 from ckeditor.fields import RichTextField
+from main.utils import render_rich_text
 
 
 def default_published_date():
@@ -30,6 +28,7 @@ class News(models.Model):
     author = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='news_articles', db_index=True)
     category = models.CharField(max_length=50, choices=CATEGORY_CHOICES, default='news_updates')
     content = RichTextField()
+    content_html = models.TextField(blank=True, editable=False, help_text="Content with absolute image URLs, rendered on save")
     image = models.ImageField(upload_to='news/', blank=True, null=True)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='draft')
     published_date = models.DateField(default=default_published_date)
@@ -37,13 +36,20 @@ class News(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Rich text source field -> stored rendered HTML (see main.utils.render_rich_text)
+    RICH_TEXT_FIELDS = {'content': 'content_html'}
+
     class Meta:
         verbose_name_plural = 'News'
         ordering = ['-published_date', '-created_at']
+        indexes = [
+            models.Index(fields=['-published_date', '-created_at', '-id'], name='news_news_keyset_idx'),
+        ]
 
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = slugify(self.title)
+        kwargs['update_fields'] = render_rich_text(self, self.RICH_TEXT_FIELDS, kwargs.get('update_fields'))
         super().save(*args, **kwargs)
 
     def __str__(self):
@@ -118,10 +124,3 @@ class HotInParliamentComment(models.Model):
     def __str__(self):
         return f'Comment by {self.author_name} on {self.hot_item.title}'
 
-
-# Signal to clear cache when HotInParliament items are saved or deleted
-@receiver(post_save, sender=HotInParliament)
-@receiver(post_delete, sender=HotInParliament)
-def clear_hot_in_parliament_cache(sender, instance, **kwargs):
-    """Clear the cache when Hot in Parliament items are modified"""
-    cache.delete('hot_in_parliament')
\ No newline at end of file
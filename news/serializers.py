@@ -1,5 +1,6 @@
 from rest_framework import serializers
-from main.utils import get_full_media_url, process_content_images
+from main.serializers import ValuesSerializer
+from main.utils import get_full_media_url, process_content_images, rendered_rich_text
 from .models import News, NewsComment, HotInParliament, HotInParliamentComment
 
 
@@ -51,6 +52,21 @@ class NewsListSerializer(serializers.ModelSerializer):
         return None
 
 
+class NewsListValuesSerializer(ValuesSerializer):
+    """values() fast path for NewsListSerializer (list endpoint); joins the author instead of a query per row"""
+    serializer_class = NewsListSerializer
+    media_fields = {'image': 'image'}
+    display_fields = {'category_display': 'category'}
+    extra_columns = ['author_id', 'author__first_name', 'author__last_name', 'author__username']
+
+    def get_author(self, row):
+        if row['author_id'] is None:
+            return 'Unknown'
+        # Same as User.get_full_name()
+        full_name = f"{row['author__first_name']} {row['author__last_name']}".strip()
+        return full_name or row['author__username']
+
+
 class NewsDetailSerializer(serializers.ModelSerializer):
     """Full serializer for news detail view"""
     category_display = serializers.CharField(read_only=True)
@@ -88,9 +104,9 @@ class NewsDetailSerializer(serializers.ModelSerializer):
         return None
     
     def get_content(self, obj):
-        """Process content HTML to convert relative image URLs to absolute URLs"""
+        """Content HTML with absolute image URLs, rendered when the article was saved"""
         if obj.content:
-            return process_content_images(obj.content)
+            return rendered_rich_text(obj, 'content', 'content_html')
         return obj.content
 
 
@@ -1,3 +1,119 @@
+import datetime
+from urllib.parse import parse_qs, urlparse
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.test import TestCase
+from django.utils import timezone
+
+from main.pagination import decode_cursor, encode_cursor
+from .models import News
+
+
+class NewsDetailConditionalGetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.author = User.objects.create(username='editor', first_name='Jane', last_name='Doe')
+            self.news = News.objects.create(
+                title='Budget read', slug='budget-read', author=self.author,
+                category='parliament', content='<p>Body</p>', status='published',
+            )
+        self.url = f'/api/news/{self.news.slug}/'
+
+    def test_unchanged_detail_is_not_modified_but_still_counted(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('ETag', response)
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+        self.news.refresh_from_db()
+        self.assertEqual(self.news.view_count, 2)
+
+    def test_author_change_changes_etag(self):
+        etag = self.client.get(self.url)['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            self.author.first_name = 'Janet'
+            self.author.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('Janet', response.content.decode())
+
+    def test_login_keeps_etag(self):
+        etag = self.client.get(self.url)['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            self.author.save(update_fields=['last_login'])
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+
+class NewsKeysetPaginationTests(TestCase):
+    url = '/api/news/'
+
+    @classmethod
+    def setUpTestData(cls):
+        # Five stories share one published_date and created_at, so only the pk breaks the tie
+        tied_at = timezone.now()
+        for index in range(7):
+            News.objects.create(
+                title=f'Story {index}', slug=f'story-{index}', category='parliament', content='<p>Body</p>',
+                status='published', published_date=datetime.date(2024, 5, 1 if index < 5 else index),
+            )
+        News.objects.filter(published_date=datetime.date(2024, 5, 1)).update(created_at=tied_at)
+        cls.expected = [
+            news.slug for news in News.objects.filter(status='published').order_by('-published_date', '-created_at', '-id')
+        ]
+
+    def setUp(self):
+        cache.clear()
+
+    def get(self, **params):
+        return self.client.get(self.url, params)
+
+    def test_cursor_pages_cover_every_row_once(self):
+        slugs = []
+        params = {'cursor': '', 'page_size': 2}
+        while True:
+            response = self.get(**params)
+            self.assertEqual(response.status_code, 200)
+            self.assertNotIn('count', response.data)
+            slugs += [row['slug'] for row in response.data['results']]
+            if response.data['next_cursor'] is None:
+                self.assertIsNone(response.data['next'])
+                break
+            self.assertEqual(parse_qs(urlparse(response.data['next']).query)['cursor'], [response.data['next_cursor']])
+            params['cursor'] = response.data['next_cursor']
+        self.assertEqual(slugs, self.expected)
+
+    def test_cursor_round_trips(self):
+        cursor = self.get(cursor='', page_size=3).data['next_cursor']
+        values = decode_cursor(cursor)
+        self.assertIsInstance(values, list)
+        self.assertEqual(encode_cursor(values), cursor)
+
+    def test_count_on_request(self):
+        response = self.get(cursor='', page_size=2, count=1)
+        self.assertEqual(response.data['count'], len(self.expected))
+
+    def test_invalid_cursors_are_rejected(self):
+        first_page = self.get(cursor='', page_size=2).data['next_cursor']
+        values = decode_cursor(first_page)
+        for cursor in [
+            'not a cursor',
+            first_page[:-4],
+            encode_cursor(values[:-1]),
+            encode_cursor({'published_date': values[0]}),
+            encode_cursor(['not a date'] + values[1:]),
+            encode_cursor(values[:-1] + ['not an id']),
+        ]:
+            with self.subTest(cursor=cursor):
+                response = self.get(cursor=cursor, page_size=2)
+                self.assertEqual(response.status_code, 400)
 
-# Create your tests here.
+    def test_page_number_fallback(self):
+        response = self.get(page=2, page_size=1)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], len(self.expected))
+        self.assertIsNotNone(response.data['previous'])
+        self.assertEqual([row['slug'] for row in response.data['results']], self.expected[1:2])
+        self.assertEqual(self.get(page=99, page_size=1).status_code, 404)
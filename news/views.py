@@ -1,18 +1,20 @@
 from rest_framework import viewsets, filters
-from rest_framework.pagination import PageNumberPagination
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework import status
+from django.contrib.auth.models import User
 from django.db.models import F
 from django_filters.rest_framework import DjangoFilterBackend
-from django.views.decorators.cache import cache_page
-from django.utils.decorators import method_decorator
-from django.core.cache import cache
-from django.db.models import F
+from django.conf import settings
+from main.cache import stale_while_revalidate
+from main.compression import entry_response
+from main.mixins import ConditionalGetMixin, SparseFieldsetsMixin, ValuesListMixin
+from main.pagination import KeysetPageNumberPagination
 from .models import News, NewsComment, HotInParliament, HotInParliamentComment
 from .serializers import (
     NewsListSerializer,
+    NewsListValuesSerializer,
     NewsDetailSerializer,
     HomeNewsSummarySerializer,
     HotInParliamentSerializer,
@@ -23,13 +25,13 @@ from .serializers import (
 )
 
 
-class NewsPagination(PageNumberPagination):
+class NewsPagination(KeysetPageNumberPagination):
     page_size = 12
     page_size_query_param = 'page_size'
     max_page_size = 100
 
 
-class NewsViewSet(viewsets.ModelViewSet):
+class NewsViewSet(ConditionalGetMixin, SparseFieldsetsMixin, ValuesListMixin, viewsets.ModelViewSet):
     """
     ViewSet for News model
 
@@ -38,12 +40,16 @@ class NewsViewSet(viewsets.ModelViewSet):
     Search by title, author, and content
     """
     queryset = News.objects.all().order_by('-published_date')
+    values_serializer_class = NewsListValuesSerializer
     pagination_class = NewsPagination
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['category', 'status', 'author']
     search_fields = ['title', 'author__username', 'author__first_name', 'author__last_name', 'content']
     ordering_fields = ['published_date', 'created_at', 'title']
+    ordering = ['-published_date', '-created_at']
     lookup_field = 'slug'
+    # Serializers nest the author's name
+    conditional_models = [News, User]
 
     def get_serializer_class(self):
         """Use different serializers for list and detail views"""
@@ -68,11 +74,14 @@ class NewsViewSet(viewsets.ModelViewSet):
         return queryset
 
     def retrieve(self, request, *args, **kwargs):
-        instance = self.get_object()
-        News.objects.filter(pk=instance.pk).update(view_count=F('view_count') + 1)
-        instance.refresh_from_db()
-        serializer = self.get_serializer(instance)
-        return Response(serializer.data)
+        # Count the view even when the client's copy is current. The .update() does not
+        # bump News's version, so view_count is not part of the ETag: a 304 keeps the
+        # count the client last saw, and it refreshes with the next content change.
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        self.get_queryset().filter(**{self.lookup_field: kwargs[lookup_url_kwarg]}).update(
+            view_count=F('view_count') + 1
+        )
+        return super().retrieve(request, *args, **kwargs)
 
 
 # Home page news summary endpoint - optimized and cached
@@ -80,18 +89,17 @@ class HomeNewsSummaryView(APIView):
     """
     Optimized endpoint for home page news summary.
     Returns latest 3 published news articles in a single response.
-    Cached for 10 minutes to improve performance.
+    Cached for hours; invalidated whenever a model it reads changes (main.cache.CACHE_DEPENDENCIES),
+    with stale-while-revalidate rebuilds.
     """
     permission_classes = [AllowAny]
 
-    @method_decorator(cache_page(600))  # Cache for 10 minutes
     def get(self, request):
-        cache_key = 'home_news_summary'
-        cached_data = cache.get(cache_key)
-        
-        if cached_data is not None:
-            return Response(cached_data)
-        
+        return entry_response(request, self.build_summary.lookup_entry()[0])
+
+    @staticmethod
+    @stale_while_revalidate('home_news_summary', settings.HOME_CACHE_TIMEOUT, settings.HOME_CACHE_STALE_TIMEOUT, precompress=True)
+    def build_summary():
         # Fetch latest 3 published news articles with optimized query
         # Using only() to fetch only needed fields
         news_articles = News.objects.filter(
@@ -105,10 +113,7 @@ class HomeNewsSummaryView(APIView):
             'results': HomeNewsSummarySerializer(news_articles, many=True).data
         }
         
-        # Cache the response
-        cache.set(cache_key, data, 600)  # Cache for 10 minutes
-        
-        return Response(data)
+        return data
 
 
 # Hot in Parliament endpoint - optimized and cached
@@ -116,22 +121,21 @@ class HotInParliamentView(APIView):
     """
     Optimized endpoint for Hot in Parliament items.
     Returns active items ordered by order and published_date.
-    Cached for 10 minutes to improve performance.
+    Cached for hours; invalidated whenever a Hot in Parliament item changes,
+    with stale-while-revalidate rebuilds.
     Use ?nocache=1 to bypass cache for debugging.
     """
     permission_classes = [AllowAny]
 
     def get(self, request):
         # Allow bypassing cache with ?nocache=1 parameter
-        bypass_cache = request.query_params.get('nocache') == '1'
-        
-        if not bypass_cache:
-            cache_key = 'hot_in_parliament'
-            cached_data = cache.get(cache_key)
-            
-            if cached_data is not None:
-                return Response(cached_data)
-        
+        if request.query_params.get('nocache') == '1':
+            return Response(self.build_items.__wrapped__())
+        return entry_response(request, self.build_items.lookup_entry()[0])
+
+    @staticmethod
+    @stale_while_revalidate('hot_in_parliament', settings.HOME_CACHE_TIMEOUT, settings.HOME_CACHE_STALE_TIMEOUT, precompress=True)
+    def build_items():
         # Fetch active hot in parliament items with optimized query
         hot_items = HotInParliament.objects.filter(
             is_active=True
@@ -144,11 +148,7 @@ class HotInParliamentView(APIView):
             'results': HotInParliamentSerializer(hot_items, many=True).data
         }
         
-        # Cache the response (unless bypassing)
-        if not bypass_cache:
-            cache.set(cache_key, data, 600)  # Cache for 10 minutes
-        
-        return Response(data)
+        return data
 
 
 # Hot in Parliament detail endpoint - increments view_count
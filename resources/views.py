@@ -1,12 +1,13 @@
 from rest_framework import viewsets, filters
-from rest_framework.pagination import PageNumberPagination
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
-from django.views.decorators.cache import cache_page
-from django.utils.decorators import method_decorator
-from django.core.cache import cache
+from django.conf import settings
+from main.cache import stale_while_revalidate
+from main.compression import entry_response
+from main.mixins import ConditionalGetMixin, SparseFieldsetsMixin
+from main.pagination import KeysetPageNumberPagination
 from .models import Explainers, Report, PartnerPublication, Statement, Publication
 from .serializers import (
     ExplainersSerializer, ReportSerializer, PartnerPublicationSerializer, StatementSerializer,
@@ -16,13 +17,13 @@ from .serializers import (
 )
 
 
-class ResourcePagination(PageNumberPagination):
+class ResourcePagination(KeysetPageNumberPagination):
     page_size = 15
     page_size_query_param = 'page_size'
     max_page_size = 100
 
 
-class ExplainersViewSet(viewsets.ModelViewSet):
+class ExplainersViewSet(ConditionalGetMixin, SparseFieldsetsMixin, viewsets.ModelViewSet):
     """
     ViewSet for Explainers
 
@@ -37,7 +38,7 @@ class ExplainersViewSet(viewsets.ModelViewSet):
     ordering = ['-created_at']
 
 
-class ReportViewSet(viewsets.ModelViewSet):
+class ReportViewSet(ConditionalGetMixin, SparseFieldsetsMixin, viewsets.ModelViewSet):
     """
     ViewSet for Reports & Briefs
 
@@ -52,7 +53,7 @@ class ReportViewSet(viewsets.ModelViewSet):
     ordering = ['-created_at']
 
 
-class PartnerPublicationViewSet(viewsets.ModelViewSet):
+class PartnerPublicationViewSet(ConditionalGetMixin, SparseFieldsetsMixin, viewsets.ModelViewSet):
     """
     ViewSet for Partner Publications
 
@@ -67,7 +68,7 @@ class PartnerPublicationViewSet(viewsets.ModelViewSet):
     ordering = ['-created_at']
 
 
-class StatementViewSet(viewsets.ModelViewSet):
+class StatementViewSet(ConditionalGetMixin, SparseFieldsetsMixin, viewsets.ModelViewSet):
     """
     ViewSet for Statements
 
@@ -82,7 +83,7 @@ class StatementViewSet(viewsets.ModelViewSet):
     ordering = ['-created_at']
 
 
-class PublicationViewSet(viewsets.ModelViewSet):
+class PublicationViewSet(ConditionalGetMixin, SparseFieldsetsMixin, viewsets.ModelViewSet):
     """
     ViewSet for Publications
 
@@ -103,18 +104,17 @@ class HomeResourcesSummaryView(APIView):
     """
     Optimized endpoint for home page resources summary.
     Returns latest 5 items from each resource type in a single response.
-    Cached for 10 minutes to improve performance.
+    Cached for hours; invalidated whenever a model it reads changes (main.cache.CACHE_DEPENDENCIES),
+    with stale-while-revalidate rebuilds.
     """
     permission_classes = [AllowAny]
 
-    @method_decorator(cache_page(600))  # Cache for 10 minutes
     def get(self, request):
-        cache_key = 'home_resources_summary'
-        cached_data = cache.get(cache_key)
-        
-        if cached_data is not None:
-            return Response(cached_data)
-        
+        return entry_response(request, self.build_summary.lookup_entry()[0])
+
+    @staticmethod
+    @stale_while_revalidate('home_resources_summary', settings.HOME_CACHE_TIMEOUT, settings.HOME_CACHE_STALE_TIMEOUT, precompress=True)
+    def build_summary():
         # Fetch latest 5 items from each resource type with optimized queries
         # Using only() to fetch only needed fields
         explainers = Explainers.objects.only('id', 'name', 'file').order_by('-created_at')[:5]
@@ -130,7 +130,4 @@ class HomeResourcesSummaryView(APIView):
             'statements': HomeSummaryStatementSerializer(statements, many=True).data,
         }
         
-        # Cache the response
-        cache.set(cache_key, data, 600)  # Cache for 10 minutes
-        
-        return Response(data)
\ No newline at end of file
+        return data
\ No newline at end of file
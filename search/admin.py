@@ -0,0 +1,67 @@
+from django.contrib import admin
+from .models import DocumentText, SearchQueryLog, SearchQueryDailyStats
+
+
+@admin.register(DocumentText)
+class DocumentTextAdmin(admin.ModelAdmin):
+    list_display = ['content_type', 'object_id', 'field_name', 'file_name', 'status', 'page_count', 'extracted_at']
+    list_filter = ['status', 'content_type']
+    search_fields = ['file_name', 'error']
+    readonly_fields = [
+        'content_type', 'object_id', 'field_name', 'file_name', 'text', 'page_count',
+        'status', 'error', 'extracted_at', 'created_at', 'updated_at',
+    ]
+    ordering = ['-updated_at']
+
+    fieldsets = (
+        ('Document', {
+            'fields': ('content_type', 'object_id', 'field_name', 'file_name')
+        }),
+        ('Extraction', {
+            'fields': ('status', 'error', 'page_count', 'extracted_at')
+        }),
+        ('Text', {
+            'fields': ('text',),
+            'classes': ('collapse',)
+        }),
+        ('Metadata', {
+            'fields': ('created_at', 'updated_at'),
+            'classes': ('collapse',)
+        }),
+    )
+
+    def has_add_permission(self, request):
+        return False
+
+
+@admin.register(SearchQueryLog)
+class SearchQueryLogAdmin(admin.ModelAdmin):
+    list_display = ['query', 'limit', 'total_results', 'latency_ms', 'cache_hit', 'created_at']
+    list_filter = ['cache_hit', 'created_at']
+    search_fields = ['query']
+    date_hierarchy = 'created_at'
+    ordering = ['-created_at']
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(SearchQueryDailyStats)
+class SearchQueryDailyStatsAdmin(admin.ModelAdmin):
+    list_display = [
+        'date', 'query', 'search_count', 'zero_result_count', 'cache_hit_count',
+        'avg_results', 'avg_latency_ms', 'max_latency_ms',
+    ]
+    list_filter = ['date']
+    search_fields = ['query']
+    date_hierarchy = 'date'
+    ordering = ['-date', '-search_count']
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
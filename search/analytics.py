@@ -0,0 +1,165 @@
+"""
+Non-blocking search analytics.
+
+Requests are sampled and appended to an in-memory buffer; the buffer is written
+to SearchQueryLog with bulk_create from a background thread once it is full or
+old enough, so logging never adds a database write to the request path. A
+timer thread per process also writes it every FLUSH_INTERVAL seconds, so a
+quiet worker does not hold entries until its next search (or lose them if it
+is killed).
+"""
+import atexit
+import datetime
+import hashlib
+import logging
+import os
+import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections, connection
+from django.db.models import Sum
+from django.utils import timezone
+
+from .models import SearchQueryLog, SearchQueryDailyStats
+
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = getattr(settings, 'SEARCH_ANALYTICS_SAMPLE_RATE', 1.0)
+BATCH_SIZE = getattr(settings, 'SEARCH_ANALYTICS_BATCH_SIZE', 50)
+FLUSH_INTERVAL = getattr(settings, 'SEARCH_ANALYTICS_FLUSH_INTERVAL', 30)
+# Only the logged text is cut to the column size; cache keys use the full query
+QUERY_MAX_LENGTH = SearchQueryLog._meta.get_field('query').max_length
+
+_buffer = []
+_buffer_lock = threading.Lock()
+_last_flush = time.monotonic()
+_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='search-analytics')
+_timer_lock = threading.Lock()
+# pid of the process whose timer thread is running (threads do not survive a fork)
+_timer_pid = None
+
+
+def normalize_query(query):
+    """Lowercase and collapse whitespace so equivalent searches share logs and cache entries"""
+    return re.sub(r'\s+', ' ', query).strip().lower()
+
+
+def query_cache_key(query):
+    """Cache key part for a search: a digest of the whole normalized query, whatever its length"""
+    return hashlib.sha256(normalize_query(query).encode()).hexdigest()
+
+
+def record_search(query, limit, response_data, latency_ms, cache_hit):
+    """Sample one search request into the buffer. Never raises and never touches the database."""
+    if SAMPLE_RATE <= 0 or random.random() >= SAMPLE_RATE:
+        return
+    _start_timer()
+
+    try:
+        entry = SearchQueryLog(
+            query=normalize_query(query)[:QUERY_MAX_LENGTH],
+            limit=limit,
+            total_results=response_data.get('total_results', 0),
+            counts=response_data.get('counts', {}),
+            latency_ms=round(latency_ms, 2),
+            cache_hit=cache_hit,
+            weight=1 / min(SAMPLE_RATE, 1.0),
+            created_at=timezone.now(),
+        )
+    except Exception as e:
+        logger.warning(f"Could not record search analytics: {e}")
+        return
+
+    global _last_flush
+    batch = None
+    with _buffer_lock:
+        _buffer.append(entry)
+        if len(_buffer) >= BATCH_SIZE or time.monotonic() - _last_flush >= FLUSH_INTERVAL:
+            batch = _buffer[:]
+            _buffer.clear()
+            _last_flush = time.monotonic()
+
+    if batch:
+        _writer.submit(_write_batch, batch)
+
+
+def flush(wait=False):
+    """Write whatever is buffered now; used at shutdown and by management commands"""
+    global _last_flush
+    with _buffer_lock:
+        batch = _buffer[:]
+        _buffer.clear()
+        _last_flush = time.monotonic()
+
+    if batch:
+        future = _writer.submit(_write_batch, batch)
+        if wait:
+            future.result()
+
+
+def _start_timer():
+    """Start this process's flush timer thread, once"""
+    global _timer_pid
+    if _timer_pid == os.getpid():
+        return
+    with _timer_lock:
+        if _timer_pid == os.getpid():
+            return
+        _timer_pid = os.getpid()
+        threading.Thread(target=_flush_periodically, name='search-analytics-timer', daemon=True).start()
+
+
+def _flush_periodically():
+    while True:
+        time.sleep(FLUSH_INTERVAL)
+        with _buffer_lock:
+            due = bool(_buffer) and time.monotonic() - _last_flush >= FLUSH_INTERVAL
+        if due:
+            try:
+                flush()
+            except Exception as e:
+                logger.warning(f"Search analytics flush failed: {e}")
+
+
+def popular_queries(top=50, days=7):
+    """
+    Most searched normalized queries over the last `days` days, most popular first.
+    Queries logged at QUERY_MAX_LENGTH may have been truncated, so they are left out:
+    their stored text is not the query any request would search for.
+    """
+    since = timezone.localdate() - datetime.timedelta(days=days)
+    totals = {}
+
+    # Rolled-up days plus today's raw logs, which have not been rolled up yet
+    for row in (
+        SearchQueryDailyStats.objects.filter(date__gte=since)
+        .values('query').annotate(total=Sum('search_count'))
+    ):
+        totals[row['query']] = totals.get(row['query'], 0) + row['total']
+    for row in (
+        SearchQueryLog.objects.filter(created_at__date=timezone.localdate())
+        .values('query').annotate(total=Sum('weight'))
+    ):
+        totals[row['query']] = totals.get(row['query'], 0) + row['total']
+
+    ranked = sorted(totals.items(), key=lambda item: item[1], reverse=True)
+    return [query for query, _ in ranked if query and len(query) < QUERY_MAX_LENGTH][:top]
+
+
+def _write_batch(batch):
+    close_old_connections()
+    try:
+        SearchQueryLog.objects.bulk_create(batch, batch_size=BATCH_SIZE)
+    except Exception as e:
+        # Analytics are best-effort; drop the batch rather than retrying forever
+        logger.warning(f"Dropped {len(batch)} search analytics entries: {e}")
+    finally:
+        connection.close()
+
+
+atexit.register(flush, wait=True)
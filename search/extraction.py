@@ -0,0 +1,155 @@
+"""
+Background text extraction for uploaded documents.
+
+Files are read once, when they are uploaded or replaced, and the text is stored
+in DocumentText so that search never has to open a PDF at query time.
+"""
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.search import SearchVector
+from django.db import close_old_connections, connection, transaction
+from django.db.models.functions import Left
+from django.dispatch import Signal
+from django.utils import timezone
+
+from .models import DocumentText, SEARCH_CONFIG
+
+try:
+    from PyPDF2 import PdfReader
+    HAS_PDF_SUPPORT = True
+except ImportError:
+    HAS_PDF_SUPPORT = False
+
+
+logger = logging.getLogger(__name__)
+
+# Models whose uploaded files are made searchable, mapped to their FileFields
+DOCUMENT_FIELDS = {
+    'trackers.Hansard': ['file'],
+    'trackers.Budget': ['file'],
+    'trackers.OrderPaper': ['file'],
+    'resources.Explainers': ['file'],
+    'resources.Report': ['file'],
+    'resources.PartnerPublication': ['file'],
+    'resources.Statement': ['file'],
+}
+
+# Sent after a file has been (re)extracted, with the per-page text, so apps can keep
+# finer-grained indexes (e.g. Hansard pages). Receives: instance, field_name, pages.
+document_extracted = Signal()
+
+# PostgreSQL caps a tsvector at 1MB, so only the leading part of very long documents is indexed
+MAX_INDEXED_CHARS = getattr(settings, 'DOCUMENT_SEARCH_MAX_INDEXED_CHARS', 500000)
+
+_executor = ThreadPoolExecutor(
+    max_workers=getattr(settings, 'DOCUMENT_EXTRACTION_WORKERS', 2),
+    thread_name_prefix='document-extraction',
+)
+
+
+def get_document_models():
+    """Yield (model, file_field_names) for every model with searchable files"""
+    for label, field_names in DOCUMENT_FIELDS.items():
+        yield apps.get_model(label), field_names
+
+
+def extract_pages(field_file):
+    """
+    Read a stored file and return its text as a list of pages.
+
+    PDFs are read page by page; plain-text files are returned as a single page.
+    Raises ValueError for unsupported file types.
+    """
+    extension = os.path.splitext(field_file.name)[1].lower()
+
+    if extension == '.pdf':
+        if not HAS_PDF_SUPPORT:
+            raise RuntimeError('PyPDF2 is required to extract text from PDF documents')
+        with field_file.open('rb') as fh:
+            reader = PdfReader(fh)
+            pages = [page.extract_text() or '' for page in reader.pages]
+    elif extension in ('.txt', '.md', '.csv'):
+        with field_file.open('rb') as fh:
+            pages = [fh.read().decode('utf-8', errors='ignore')]
+    else:
+        raise ValueError(f"Unsupported document type: {extension or 'unknown'}")
+
+    # PostgreSQL text columns cannot hold NUL bytes, which some PDFs emit
+    return [page.replace('\x00', '').strip() for page in pages]
+
+
+def extract_document(instance, field_name, force=False):
+    """
+    Extract and index the text of one file field. Runs synchronously.
+
+    Skips the work when the stored text already belongs to the current file,
+    unless force is set. Returns the DocumentText row (None if the field is empty).
+    """
+    field_file = getattr(instance, field_name)
+    lookup = {
+        'content_type': ContentType.objects.get_for_model(instance),
+        'object_id': instance.pk,
+        'field_name': field_name,
+    }
+
+    if not field_file:
+        DocumentText.objects.filter(**lookup).delete()
+        return None
+
+    document, _ = DocumentText.objects.get_or_create(**lookup)
+    if not force and document.status == DocumentText.STATUS_EXTRACTED and document.file_name == field_file.name:
+        return document
+
+    document.file_name = field_file.name
+    document.extracted_at = timezone.now()
+    try:
+        pages = extract_pages(field_file)
+    except Exception as e:
+        logger.warning(f"Could not extract text from {field_file.name}: {e}")
+        document.text = ''
+        document.page_count = 0
+        document.status = DocumentText.STATUS_FAILED
+        document.error = str(e)
+        document.save()
+        DocumentText.objects.filter(pk=document.pk).update(search_vector=None)
+        document_extracted.send(sender=type(instance), instance=instance, field_name=field_name, pages=[])
+        return document
+
+    document.text = '\n\n'.join(page for page in pages if page)
+    document.page_count = len(pages)
+    document.status = DocumentText.STATUS_EXTRACTED
+    document.error = ''
+    document.save()
+
+    # Build the tsvector in the database so the GIN index stays in sync with the text
+    DocumentText.objects.filter(pk=document.pk).update(
+        search_vector=SearchVector(Left('text', MAX_INDEXED_CHARS), config=SEARCH_CONFIG)
+    )
+    document_extracted.send(sender=type(instance), instance=instance, field_name=field_name, pages=pages)
+    return document
+
+
+def _run_extraction(model_label, pk, field_name):
+    """Worker-thread entry point; uses its own database connection"""
+    close_old_connections()
+    try:
+        model = apps.get_model(model_label)
+        instance = model.objects.filter(pk=pk).first()
+        if instance is not None:
+            extract_document(instance, field_name)
+    except Exception:
+        logger.exception(f"Document extraction failed for {model_label} #{pk} ({field_name})")
+    finally:
+        connection.close()
+
+
+def schedule_extraction(instance, field_name):
+    """Queue background extraction for a file field once the current transaction commits"""
+    model_label = instance._meta.label
+    pk = instance.pk
+    transaction.on_commit(lambda: _executor.submit(_run_extraction, model_label, pk, field_name))
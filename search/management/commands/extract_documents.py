@@ -0,0 +1,52 @@
+from django.core.management.base import BaseCommand
+from search.extraction import get_document_models, extract_document
+from search.models import DocumentText
+
+
+class Command(BaseCommand):
+    help = 'Extract and index text from uploaded documents (Hansards, Budgets, Order Papers, resources). Skips files that are already indexed unless --force is given (use --force once to build Hansard page rows for existing Hansards).'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--model',
+            type=str,
+            metavar='LABEL',
+            help='Only process one model, e.g. trackers.Hansard'
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Re-extract files even if their text is already indexed'
+        )
+
+    def handle(self, *args, **options):
+        only_model = (options.get('model') or '').lower()
+
+        extracted_count = 0
+        failed_count = 0
+        skipped_count = 0
+
+        for model, field_names in get_document_models():
+            if only_model and model._meta.label_lower != only_model:
+                continue
+
+            self.stdout.write(f'Processing {model._meta.verbose_name_plural}...')
+            for instance in model.objects.all().iterator():
+                for field_name in field_names:
+                    document = extract_document(instance, field_name, force=options['force'])
+                    if document is None:
+                        skipped_count += 1
+                    elif document.status == DocumentText.STATUS_FAILED:
+                        failed_count += 1
+                        self.stdout.write(self.style.WARNING(f'  Failed: {document.file_name} ({document.error})'))
+                    else:
+                        extracted_count += 1
+
+        # Summary
+        self.stdout.write(self.style.SUCCESS('\n' + '='*60))
+        self.stdout.write(self.style.SUCCESS('Extraction Summary:'))
+        self.stdout.write(self.style.SUCCESS(f'  Indexed: {extracted_count}'))
+        if failed_count > 0:
+            self.stdout.write(self.style.WARNING(f'  Failed: {failed_count}'))
+        self.stdout.write(self.style.SUCCESS(f'  Without file: {skipped_count}'))
+        self.stdout.write(self.style.SUCCESS('='*60))
@@ -0,0 +1,71 @@
+import datetime
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Avg, Count, Max, Q, Sum
+from django.utils import timezone
+from search import analytics
+from search.models import SearchQueryLog, SearchQueryDailyStats
+
+
+class Command(BaseCommand):
+    help = 'Roll up sampled search logs into daily per-query stats. Run daily (defaults to yesterday); safe to re-run for the same day.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--date',
+            type=datetime.date.fromisoformat,
+            metavar='YYYY-MM-DD',
+            help='Day to roll up (default: yesterday)'
+        )
+        parser.add_argument(
+            '--keep-days',
+            type=int,
+            default=30,
+            help='Delete raw search logs older than this many days (0 keeps everything)'
+        )
+
+    def handle(self, *args, **options):
+        day = options.get('date') or (timezone.localdate() - datetime.timedelta(days=1))
+
+        # Make sure this process's buffered entries are included
+        analytics.flush(wait=True)
+
+        rows = (
+            SearchQueryLog.objects.filter(created_at__date=day)
+            .values('query')
+            .annotate(
+                search_count=Sum('weight'),
+                sampled_count=Count('id'),
+                zero_result_count=Count('id', filter=Q(total_results=0)),
+                cache_hit_count=Count('id', filter=Q(cache_hit=True)),
+                avg_results=Avg('total_results'),
+                avg_latency_ms=Avg('latency_ms'),
+                max_latency_ms=Max('latency_ms'),
+            )
+        )
+        stats = [
+            SearchQueryDailyStats(
+                date=day,
+                query=row['query'],
+                search_count=round(row['search_count']),
+                sampled_count=row['sampled_count'],
+                zero_result_count=row['zero_result_count'],
+                cache_hit_count=row['cache_hit_count'],
+                avg_results=round(row['avg_results'], 2),
+                avg_latency_ms=round(row['avg_latency_ms'], 2),
+                max_latency_ms=round(row['max_latency_ms'], 2),
+            )
+            for row in rows
+        ]
+
+        with transaction.atomic():
+            SearchQueryDailyStats.objects.filter(date=day).delete()
+            SearchQueryDailyStats.objects.bulk_create(stats, batch_size=500)
+
+        self.stdout.write(self.style.SUCCESS(f'Rolled up {len(stats)} distinct queries for {day}'))
+
+        if options['keep_days'] > 0:
+            cutoff = timezone.now() - datetime.timedelta(days=options['keep_days'])
+            deleted, _ = SearchQueryLog.objects.filter(created_at__lt=cutoff).delete()
+            if deleted:
+                self.stdout.write(f'Deleted {deleted} search logs older than {options["keep_days"]} days')
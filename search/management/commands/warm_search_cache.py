@@ -0,0 +1,48 @@
+import time
+from django.core.management.base import BaseCommand
+from main.views import GlobalSearchView
+from search.analytics import popular_queries
+
+
+class Command(BaseCommand):
+    help = 'Pre-compute and cache global search results for the most popular queries. Run after deploys and bulk content changes.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--top',
+            type=int,
+            default=50,
+            help='Number of most popular queries to warm (default: 50)'
+        )
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=7,
+            help='Look-back window for popularity, in days (default: 7)'
+        )
+        parser.add_argument(
+            '--limits',
+            type=int,
+            nargs='+',
+            default=[5, 20],
+            help='Result limits to warm; the frontend uses 5 for the dropdown and 20 for the results page'
+        )
+
+    def handle(self, *args, **options):
+        queries = popular_queries(options['top'], options['days'])
+        if not queries:
+            self.stdout.write(self.style.WARNING('No search history yet; nothing to warm.'))
+            return
+
+        started = time.perf_counter()
+        warmed = 0
+        for query in queries:
+            for limit in options['limits']:
+                limit = max(1, min(limit, 50))
+                GlobalSearchView.cached_search.rebuild(query, limit)
+                warmed += 1
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'Warmed {warmed} search cache entries for {len(queries)} queries in {elapsed:.1f}s'
+        ))
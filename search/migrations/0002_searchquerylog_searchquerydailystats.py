@@ -0,0 +1,55 @@
+# Generated by Django 6.0 on 2026-10-19 10:00
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchQueryLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('query', models.CharField(db_index=True, help_text='Normalized query text', max_length=255)),
+                ('limit', models.PositiveSmallIntegerField(default=5)),
+                ('total_results', models.PositiveIntegerField(default=0)),
+                ('counts', models.JSONField(blank=True, default=dict, help_text='Result count per category')),
+                ('latency_ms', models.FloatField(help_text='Server-side time to answer the request')),
+                ('cache_hit', models.BooleanField(default=False)),
+                ('weight', models.FloatField(default=1.0, help_text='1 / sample rate; estimated requests this row stands for')),
+                ('created_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+            ],
+            options={
+                'verbose_name': 'Search Query Log',
+                'verbose_name_plural': 'Search Query Logs',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='SearchQueryDailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(db_index=True)),
+                ('query', models.CharField(max_length=255)),
+                ('search_count', models.PositiveIntegerField(default=0, help_text='Estimated searches (scaled by sample rate)')),
+                ('sampled_count', models.PositiveIntegerField(default=0)),
+                ('zero_result_count', models.PositiveIntegerField(default=0)),
+                ('cache_hit_count', models.PositiveIntegerField(default=0)),
+                ('avg_results', models.FloatField(default=0)),
+                ('avg_latency_ms', models.FloatField(default=0)),
+                ('max_latency_ms', models.FloatField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Search Query Daily Stats',
+                'verbose_name_plural': 'Search Query Daily Stats',
+                'ordering': ['-date', '-search_count'],
+                'unique_together': {('date', 'query')},
+            },
+        ),
+    ]
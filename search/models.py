@@ -0,0 +1,128 @@
+from django.db import models
+from django.utils import timezone
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchVectorField
+
+
+SEARCH_CONFIG = 'english'
+
+
+class DocumentTextQuerySet(models.QuerySet):
+    def for_model(self, model):
+        return self.filter(content_type=ContentType.objects.get_for_model(model))
+
+    def matching(self, query):
+        """Rows whose extracted text matches a free-form (websearch syntax) query"""
+        return self.filter(
+            status=DocumentText.STATUS_EXTRACTED,
+            search_vector=SearchQuery(query, config=SEARCH_CONFIG, search_type='websearch'),
+        )
+
+    def with_headline(self, query, max_words=35, min_words=15):
+        """Annotate each row with a highlighted ts_headline snippet"""
+        return self.annotate(
+            snippet=SearchHeadline(
+                'text',
+                SearchQuery(query, config=SEARCH_CONFIG, search_type='websearch'),
+                config=SEARCH_CONFIG,
+                start_sel='<mark>',
+                stop_sel='</mark>',
+                max_words=max_words,
+                min_words=min_words,
+                max_fragments=2,
+            )
+        )
+
+
+class DocumentText(models.Model):
+    """
+    Text extracted from an uploaded document (FileField) so it can be searched
+    without opening the file at query time. One row per object and file field.
+    """
+    STATUS_PENDING = 'pending'
+    STATUS_EXTRACTED = 'extracted'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_EXTRACTED, 'Extracted'),
+        (STATUS_FAILED, 'Failed'),
+    ]
+
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveBigIntegerField()
+    content_object = GenericForeignKey('content_type', 'object_id')
+    field_name = models.CharField(max_length=100, help_text="Name of the FileField the text was extracted from")
+    file_name = models.CharField(max_length=500, blank=True, help_text="Stored file name at extraction time")
+
+    text = models.TextField(blank=True)
+    page_count = models.PositiveIntegerField(default=0)
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING, db_index=True)
+    error = models.TextField(blank=True)
+    extracted_at = models.DateTimeField(null=True, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = DocumentTextQuerySet.as_manager()
+
+    class Meta:
+        ordering = ['-updated_at']
+        verbose_name = 'Document Text'
+        verbose_name_plural = 'Document Texts'
+        unique_together = ['content_type', 'object_id', 'field_name']
+        indexes = [
+            GinIndex(fields=['search_vector'], name='search_doctext_vector_gin'),
+        ]
+
+    def __str__(self):
+        return f"{self.content_type.model} #{self.object_id} ({self.field_name})"
+
+
+class SearchQueryLog(models.Model):
+    """
+    A sampled global search request. Written in batches from an in-memory buffer
+    (see search/analytics.py) and rolled up daily into SearchQueryDailyStats.
+    """
+    query = models.CharField(max_length=255, db_index=True, help_text="Normalized query text")
+    limit = models.PositiveSmallIntegerField(default=5)
+    total_results = models.PositiveIntegerField(default=0)
+    counts = models.JSONField(default=dict, blank=True, help_text="Result count per category")
+    latency_ms = models.FloatField(help_text="Server-side time to answer the request")
+    cache_hit = models.BooleanField(default=False)
+    weight = models.FloatField(default=1.0, help_text="1 / sample rate; estimated requests this row stands for")
+    created_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = 'Search Query Log'
+        verbose_name_plural = 'Search Query Logs'
+
+    def __str__(self):
+        return f"{self.query} ({self.latency_ms:.0f} ms)"
+
+
+class SearchQueryDailyStats(models.Model):
+    """Per-day rollup of SearchQueryLog, one row per normalized query"""
+    date = models.DateField(db_index=True)
+    query = models.CharField(max_length=255)
+    search_count = models.PositiveIntegerField(default=0, help_text="Estimated searches (scaled by sample rate)")
+    sampled_count = models.PositiveIntegerField(default=0)
+    zero_result_count = models.PositiveIntegerField(default=0)
+    cache_hit_count = models.PositiveIntegerField(default=0)
+    avg_results = models.FloatField(default=0)
+    avg_latency_ms = models.FloatField(default=0)
+    max_latency_ms = models.FloatField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['-date', '-search_count']
+        verbose_name = 'Search Query Daily Stats'
+        verbose_name_plural = 'Search Query Daily Stats'
+        unique_together = ['date', 'query']
+
+    def __str__(self):
+        return f"{self.date} - {self.query} ({self.search_count})"
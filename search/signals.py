@@ -0,0 +1,40 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db.models.signals import post_save, post_delete
+
+from .extraction import DOCUMENT_FIELDS, get_document_models, schedule_extraction
+from .models import DocumentText
+
+
+def queue_document_extraction(sender, instance, raw=False, **kwargs):
+    """Extract text in the background when a document is uploaded or replaced"""
+    if raw:
+        return
+
+    field_names = DOCUMENT_FIELDS[sender._meta.label]
+    existing = dict(
+        DocumentText.objects.for_model(sender)
+        .filter(object_id=instance.pk, status=DocumentText.STATUS_EXTRACTED)
+        .values_list('field_name', 'file_name')
+    )
+
+    for field_name in field_names:
+        field_file = getattr(instance, field_name)
+        if not field_file:
+            DocumentText.objects.for_model(sender).filter(object_id=instance.pk, field_name=field_name).delete()
+            continue
+        if existing.get(field_name) == field_file.name:
+            continue
+        schedule_extraction(instance, field_name)
+
+
+def delete_document_text(sender, instance, **kwargs):
+    """Drop extracted text together with the document it belongs to"""
+    DocumentText.objects.filter(
+        content_type=ContentType.objects.get_for_model(sender),
+        object_id=instance.pk,
+    ).delete()
+
+
+for model, _ in get_document_models():
+    post_save.connect(queue_document_extraction, sender=model, dispatch_uid=f'extract_text_{model._meta.label_lower}')
+    post_delete.connect(delete_document_text, sender=model, dispatch_uid=f'delete_text_{model._meta.label_lower}')
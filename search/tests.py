@@ -0,0 +1,33 @@
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase
+
+from main.views import GlobalSearchView
+from search.analytics import QUERY_MAX_LENGTH, normalize_query, popular_queries, query_cache_key
+from search.models import SearchQueryLog
+
+
+class QueryCacheKeyTests(SimpleTestCase):
+    def test_equivalent_queries_share_a_key(self):
+        self.assertEqual(query_cache_key('  Budget   2024 '), query_cache_key('budget 2024'))
+
+    def test_long_queries_with_a_common_prefix_differ(self):
+        prefix = 'parliament ' * 30
+        self.assertGreater(len(prefix), QUERY_MAX_LENGTH)
+        self.assertNotEqual(query_cache_key(prefix + 'loans'), query_cache_key(prefix + 'bills'))
+
+    def test_normalize_keeps_the_full_query(self):
+        query = 'x' * (QUERY_MAX_LENGTH + 10)
+        self.assertEqual(normalize_query(query), query)
+
+    def test_cached_search_runs_the_normalized_query(self):
+        with mock.patch.object(GlobalSearchView, 'run_search', return_value={}) as run_search:
+            GlobalSearchView.cached_search.__wrapped__('  Budget   2024 ', 5)
+        run_search.assert_called_once_with('budget 2024', 5)
+
+
+class PopularQueriesTests(TestCase):
+    def test_truncated_queries_are_not_warmed(self):
+        SearchQueryLog.objects.create(query='budget', latency_ms=1)
+        SearchQueryLog.objects.create(query='x' * QUERY_MAX_LENGTH, latency_ms=1)
+        self.assertEqual(popular_queries(), ['budget'])
@@ -2,6 +2,9 @@ from rest_framework import viewsets, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.shortcuts import get_object_or_404
+from django.conf import settings
+from main.cache import stale_while_revalidate
+from main.mixins import ConditionalGetMixin, SparseFieldsetsMixin
 from .models import PageHeroImage, CitizensVoiceFeedbackLinks, FooterDocuments
 from .serializers import PageHeroImageSerializer, CitizensVoiceFeedbackLinksSerializer, FooterDocumentsSerializer
 
@@ -13,18 +16,22 @@ class CitizensVoiceFeedbackLinksView(APIView):
     If no config exists, returns empty strings for each URL.
     """
     def get(self, request):
+        return Response(self.build_links())
+
+    @staticmethod
+    @stale_while_revalidate('settings_feedback_links', settings.HOME_CACHE_TIMEOUT, settings.HOME_CACHE_STALE_TIMEOUT)
+    def build_links():
         instance = CitizensVoiceFeedbackLinks.objects.first()
         if not instance:
-            return Response({
+            return {
                 'ask_mp_form_url': '',
                 'comment_bill_form_url': '',
                 'feedback_law_form_url': '',
-            })
-        serializer = CitizensVoiceFeedbackLinksSerializer(instance)
-        return Response(serializer.data)
+            }
+        return CitizensVoiceFeedbackLinksSerializer(instance).data
 
 
-class PageHeroImageViewSet(viewsets.ReadOnlyModelViewSet):
+class PageHeroImageViewSet(ConditionalGetMixin, SparseFieldsetsMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet for Page Hero Images
     
@@ -40,15 +47,25 @@ class PageHeroImageViewSet(viewsets.ReadOnlyModelViewSet):
         Get the hero image for a specific page by its slug.
         Returns 404 if no active hero image exists for the page.
         """
-        try:
-            hero_image = PageHeroImage.objects.get(page_slug=page_slug, is_active=True)
-            serializer = self.get_serializer(hero_image)
-            return Response(serializer.data)
-        except PageHeroImage.DoesNotExist:
+        response = self.not_modified(request)
+        if response is not None:
+            return response
+        data = self.build_hero_image(page_slug)
+        if data is None:
             return Response(
                 {"detail": "No hero image found for this page."},
                 status=status.HTTP_404_NOT_FOUND
             )
+        return self.set_validators(request, Response(data))
+
+    @staticmethod
+    @stale_while_revalidate('page_hero_images', settings.HOME_CACHE_TIMEOUT, settings.HOME_CACHE_STALE_TIMEOUT)
+    def build_hero_image(page_slug):
+        """Serialized active hero image for a page, or None"""
+        hero_image = PageHeroImage.objects.filter(page_slug=page_slug, is_active=True).first()
+        if hero_image is None:
+            return None
+        return PageHeroImageSerializer(hero_image).data
 
 
 class FooterDocumentsView(APIView):
@@ -58,12 +75,16 @@ class FooterDocumentsView(APIView):
     If no config exists, returns null for each document URL.
     """
     def get(self, request):
+        return Response(self.build_documents())
+
+    @staticmethod
+    @stale_while_revalidate('settings_footer_documents', settings.HOME_CACHE_TIMEOUT, settings.HOME_CACHE_STALE_TIMEOUT)
+    def build_documents():
         instance = FooterDocuments.objects.first()
         if not instance:
-            return Response({
+            return {
                 'terms_of_service': None,
                 'privacy_policy': None,
                 'accessibility': None,
-            })
-        serializer = FooterDocumentsSerializer(instance)
-        return Response(serializer.data)
+            }
+        return FooterDocumentsSerializer(instance).data
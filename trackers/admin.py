@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Bill, BillReading, MP, ParliamentTerm, DebtData, Lender, Loan, LoanDocument, Hansard, Budget, OrderPaper, Committee, CommitteeDocument
+from .models import Bill, BillReading, MP, Party, District, ParliamentTerm, DebtData, Lender, Loan, LoanDocument, Hansard, Budget, OrderPaper, Committee, CommitteeDocument, ExchangeRate, TrackerStats
 
 
 @admin.register(ParliamentTerm)
@@ -62,11 +62,19 @@ class BillReadingAdmin(admin.ModelAdmin):
     )
 
 
+@admin.register(Party, District)
+class LookupNameAdmin(admin.ModelAdmin):
+    list_display = ['name']
+    search_fields = ['name']
+
+
 @admin.register(MP)
 class MPAdmin(admin.ModelAdmin):
     list_display = ['name', 'parliament_term', 'party', 'constituency', 'district', 'email', 'phone_no']
     list_filter = ['party', 'district', 'parliament_term']
-    search_fields = ['name', 'first_name', 'last_name', 'constituency', 'district', 'email']
+    list_select_related = ['parliament_term', 'party', 'district']
+    search_fields = ['name', 'first_name', 'last_name', 'constituency', 'district__name', 'email']
+    autocomplete_fields = ['party', 'district']
     ordering = ['last_name', 'first_name']
 
     fieldsets = (
@@ -120,19 +128,21 @@ class LenderAdmin(admin.ModelAdmin):
 
 @admin.register(Loan)
 class LoanAdmin(admin.ModelAdmin):
-    list_display = ['sector', 'label', 'approved_amount', 'currency', 'lender', 'source', 'approval_date']
+    list_display = ['sector', 'label', 'approved_amount', 'currency', 'amount_usd', 'lender', 'source', 'approval_date']
     list_filter = ['sector', 'currency', 'source', 'approval_date']
     search_fields = ['label', 'description', 'sector']
     ordering = ['-approval_date', '-created_at']
     date_hierarchy = 'approval_date'
     inlines = [LoanDocumentInline]
+    readonly_fields = ['amount_ugx', 'amount_usd']
 
     fieldsets = (
         ('Loan Information', {
             'fields': ('sector', 'label', 'description')
         }),
         ('Financial Details', {
-            'fields': ('approved_amount', 'currency')
+            'fields': ('approved_amount', 'currency', 'amount_ugx', 'amount_usd'),
+            'description': 'UGX and USD amounts are converted with the Exchange Rates on save.'
         }),
         ('Source / Lender', {
             'fields': ('lender', 'source', 'approval_date'),
@@ -141,6 +151,15 @@ class LoanAdmin(admin.ModelAdmin):
     )
 
 
+@admin.register(ExchangeRate)
+class ExchangeRateAdmin(admin.ModelAdmin):
+    """Saving or deleting a rate reconverts every loan's UGX/USD amounts"""
+    list_display = ['currency', 'date', 'ugx_per_unit', 'updated_at']
+    list_filter = ['currency']
+    ordering = ['-date', 'currency']
+    date_hierarchy = 'date'
+
+
 @admin.register(Hansard)
 class HansardAdmin(admin.ModelAdmin):
     list_display = ['name', 'date', 'date_received', 'file', 'created_at']
@@ -232,4 +251,17 @@ class CommitteeDocumentAdmin(admin.ModelAdmin):
         ('Document Information', {
             'fields': ('committee', 'title', 'description', 'file', 'document_date')
         }),
-    )
\ No newline at end of file
+    )
+
+
+@admin.register(TrackerStats)
+class TrackerStatsAdmin(admin.ModelAdmin):
+    """Read-only view of the materialized summary counters (rebuilt by reconcile_tracker_stats)"""
+    list_display = ['tracker', 'updated_at', 'reconciled_at']
+    readonly_fields = ['tracker', 'counts', 'amounts', 'updated_at', 'reconciled_at']
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
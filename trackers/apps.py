@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class TrackersConfig(AppConfig):
     name = 'trackers'
+
+    def ready(self):
+        from .stats import connect_tracker_stats
+        connect_tracker_stats()
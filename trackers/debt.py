@@ -0,0 +1,131 @@
+"""
+Derived debt series for /api/trackers/debt/series/.
+
+DebtData has one row per year, so the whole table is read once into NumPy
+float arrays and every derived series is one vectorized expression over whole
+columns: debt-to-GDP and interest-to-expenditure ratios, per-capita amounts
+from the population column, year-on-year growth, CAGR over the full range and
+a log-linear trend projected PROJECTION_YEARS ahead.
+
+Gaps between years are allowed: growth across a gap is annualized. Values that
+cannot be computed (division by zero, a missing population, non-positive
+amounts for growth and trends) are null.
+"""
+import math
+
+import numpy as np
+
+
+PROJECTION_YEARS = 5
+
+# DebtData columns returned as raw series, with the decimals they are rounded to
+SERIES_FIELDS = {
+    'national_debt': 2,
+    'gdp': 2,
+    'interest': 2,
+    'total_expenditure': 2,
+    'debt_per_citizen': 2,
+    'gdp_per_capita': 2,
+    'per_capita_income': 2,
+    'population': 0,
+}
+GROWTH_FIELDS = [
+    'national_debt', 'gdp', 'interest', 'total_expenditure',
+    'debt_per_citizen', 'gdp_per_capita', 'per_capita_income', 'population',
+]
+TREND_FIELDS = ['national_debt', 'gdp', 'interest']
+RATE_DIGITS = 4
+
+
+# Amounts are stored in millions of UGX; per-capita amounts are in UGX
+MILLION = 1_000_000
+# Per-capita series derived from population: output name -> amount column
+PER_CAPITA_FIELDS = {
+    'debt_per_citizen': 'national_debt',
+    'gdp_per_capita': 'gdp',
+    'interest_per_citizen': 'interest',
+    'expenditure_per_citizen': 'total_expenditure',
+}
+
+
+def _column(values):
+    return np.array([math.nan if value is None else float(value) for value in values], dtype=float)
+
+
+def _ratio(numerator, denominator, scale=100):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(denominator != 0, numerator / denominator * scale, np.nan)
+
+
+def _growth(years, values):
+    if len(values) < 2:
+        return np.full(len(values), np.nan)
+    previous, current = values[:-1], values[1:]
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        rates = np.where(
+            (previous > 0) & (current > 0),
+            ((current / previous) ** (1 / np.diff(years)) - 1) * 100,
+            np.nan,
+        )
+    return np.concatenate(([np.nan], rates))
+
+
+def _cagr(years, values):
+    valid = np.flatnonzero(values > 0)
+    if len(valid) < 2:
+        return math.nan
+    first, last = valid[0], valid[-1]
+    return float(((values[last] / values[first]) ** (1 / (years[last] - years[first])) - 1) * 100)
+
+
+def _trend(years, values, future):
+    valid = values > 0
+    if valid.sum() < 2:
+        return np.full(len(future), np.nan)
+    slope, intercept = np.polyfit(years[valid], np.log(values[valid]), 1)
+    return np.exp(intercept + slope * future)
+
+
+def _rounded(values, digits):
+    """JSON-ready list: NaN/inf become null, digits=0 gives ints"""
+    return [
+        None if not math.isfinite(value) else (round(value) if digits == 0 else round(value, digits))
+        for value in values
+    ]
+
+
+def compute_series(rows, projection_years=PROJECTION_YEARS):
+    """Parallel-array payload for DebtData rows (dicts with year and SERIES_FIELDS, ordered by year)"""
+    year_list = [row['year'] for row in rows]
+    future_years = list(range(year_list[-1] + 1, year_list[-1] + 1 + projection_years)) if rows else []
+
+    years = _column(year_list)
+    future = _column(future_years)
+    columns = {field: _column([row[field] for row in rows]) for field in SERIES_FIELDS}
+    trends = {field: _trend(years, columns[field], future) for field in TREND_FIELDS}
+
+    def output(values, digits=RATE_DIGITS):
+        return _rounded(values.tolist(), digits)
+
+    def scalar(value):
+        return None if not math.isfinite(value) else round(value, RATE_DIGITS)
+
+    return {
+        'years': year_list,
+        'series': {field: output(columns[field], digits) for field, digits in SERIES_FIELDS.items()},
+        'ratios': {
+            'debt_to_gdp': output(_ratio(columns['national_debt'], columns['gdp'])),
+            'interest_to_expenditure': output(_ratio(columns['interest'], columns['total_expenditure'])),
+        },
+        'per_capita': {
+            name: output(_ratio(columns[field], columns['population'], scale=MILLION), 2)
+            for name, field in PER_CAPITA_FIELDS.items()
+        },
+        'growth': {field: output(_growth(years, columns[field])) for field in GROWTH_FIELDS},
+        'cagr': {field: scalar(_cagr(years, columns[field])) for field in GROWTH_FIELDS},
+        'projection': {
+            'years': future_years,
+            **{field: output(trends[field], SERIES_FIELDS[field]) for field in TREND_FIELDS},
+            'debt_to_gdp': output(_ratio(trends['national_debt'], trends['gdp'])),
+        },
+    }
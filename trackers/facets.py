@@ -0,0 +1,79 @@
+"""
+Faceted MP counts for /api/trackers/mps/facets/.
+
+Each facet (party, district, parliament term) is counted the way filter chips
+need it: over the MPs matching every active filter except that facet's own, so
+picking one party still shows the count for every other party. All facets and
+the overall total come from one PostgreSQL GROUPING SETS query over the
+filtered MPs, with a COUNT(*) FILTER (...) per facet:
+
+    SELECT ..., GROUPING(party_id), ..., COUNT(*) FILTER (WHERE match_party), ...
+    FROM (<filtered MPs with one match_<facet> flag per facet>) AS filtered
+    GROUP BY GROUPING SETS ((party_id, party_name), (district_id, district_name),
+                           (parliament_term_id, parliament_term_name), ())
+"""
+from django.db import connections
+from django.db.models import BooleanField, ExpressionWrapper, F, Q, Value
+
+FACETS = ['party', 'district', 'parliament_term']
+
+
+def _all_of(conditions):
+    if not conditions:
+        return Value(True, output_field=BooleanField())
+    combined = Q()
+    for condition in conditions:
+        combined &= condition
+    return ExpressionWrapper(combined, output_field=BooleanField())
+
+
+def facet_counts(queryset, filters):
+    """
+    {'total': n, '<facet>': [{'id', 'name', 'count'}, ...]} for an MP queryset.
+
+    queryset carries the filters every facet shares (search, constituency);
+    filters maps facet names to the Q of that facet's own filter. Facet values
+    are ordered by count, then name; values with no matching MPs are left out.
+    The Qs must not join other tables (use pk__in subqueries), or MPs outside
+    the joined rows would drop out of the other facets.
+    """
+    flags = {'match_all': _all_of(list(filters.values()))}
+    for facet in FACETS:
+        flags[f'match_{facet}'] = _all_of([q for name, q in filters.items() if name != facet])
+    labels = {f'{facet}_name': F(f'{facet}__name') for facet in FACETS}
+
+    inner = (
+        queryset.order_by().prefetch_related(None)
+        .annotate(**labels, **flags)
+        .values(*(f'{facet}_id' for facet in FACETS), *labels, *flags)
+    )
+    inner_sql, params = inner.query.sql_with_params()
+
+    columns = []
+    for facet in FACETS:
+        columns += [f'{facet}_id', f'{facet}_name', f'GROUPING({facet}_id) AS grouped_{facet}']
+    columns += [f'COUNT(*) FILTER (WHERE {flag}) AS count_{flag[len("match_"):]}' for flag in flags]
+    grouping_sets = [f'({facet}_id, {facet}_name)' for facet in FACETS] + ['()']
+    sql = (
+        f'SELECT {", ".join(columns)} FROM ({inner_sql}) AS filtered '
+        f'GROUP BY GROUPING SETS ({", ".join(grouping_sets)})'
+    )
+
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(sql, params)
+        names = [column[0] for column in cursor.description]
+        rows = [dict(zip(names, row)) for row in cursor.fetchall()]
+
+    result = {'total': 0, **{facet: [] for facet in FACETS}}
+    for row in rows:
+        grouped = [facet for facet in FACETS if row[f'grouped_{facet}'] == 0]
+        if not grouped:
+            result['total'] = row['count_all']
+            continue
+        facet = grouped[0]
+        if row[f'count_{facet}']:
+            result[facet].append({'id': row[f'{facet}_id'], 'name': row[f'{facet}_name'], 'count': row[f'count_{facet}']})
+
+    for facet in FACETS:
+        result[facet].sort(key=lambda item: (-item['count'], item['name'] or ''))
+    return result
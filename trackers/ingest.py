@@ -0,0 +1,376 @@
+"""
+Bulk ingestion of tracker documents from a manifest (`manage.py ingest`).
+
+A manifest is a CSV, JSON-lines or JSON array file with one row per record:
+model fields plus file paths (relative to the manifest's directory). Each
+ingestible model has an IngestSpec naming its natural key, the columns read from
+the manifest, its file fields, foreign keys looked up by name and child rows
+(bill readings).
+
+Rows are processed in batches. Files are hashed and copied into storage by a
+thread pool under content-addressed names ('<sha256 prefix>-<file name>' in
+the field's upload_to), so a file already in storage is never copied again.
+The batch's new rows are then created with bulk_create in one transaction.
+Rows whose natural key already exists are left alone, which makes re-running a
+manifest safe: nothing is copied or created twice.
+
+bulk_create sends no signals, so after ingesting, the caches of the touched
+models are invalidated and their TrackerStats rows rebuilt. Text extraction
+for search is left to `manage.py extract_documents`, which skips indexed files.
+"""
+import csv
+import hashlib
+import json
+import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.exceptions import ValidationError
+from django.core.files import File
+from django.db import transaction
+
+from main.cache import CACHE_DEPENDENCIES, invalidate, model_version_name
+from .models import Bill, BillReading, Budget, Committee, CommitteeDocument, Hansard, OrderPaper
+from .stats import MODEL_TRACKERS, rebuild_stats
+
+FORMATS = {'.csv': 'csv', '.jsonl': 'jsonl', '.ndjson': 'jsonl'}
+
+
+def read_records(path, input_format=None):
+    """
+    Yield one dict per row of a CSV (header row), JSON-lines or JSON array file.
+    CSV and JSON lines are streamed; a JSON array is loaded whole. The format
+    defaults to the file extension. Raises ValueError on invalid JSON.
+    """
+    input_format = input_format or FORMATS.get(os.path.splitext(path)[1].lower(), 'json')
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if input_format == 'csv':
+            yield from csv.DictReader(f)
+        elif input_format == 'jsonl':
+            for number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f'Invalid JSON on line {number}: {e}')
+        else:
+            try:
+                yield from json.load(f)
+            except json.JSONDecodeError:
+                raise ValueError('Invalid JSON format')
+
+
+class IngestSpec:
+    """
+    How manifest rows map to a model.
+
+    key: fields identifying an existing row (a row with the same key is skipped)
+    fields: columns read from the manifest
+    file_fields: FileFields whose manifest value is a path to copy into storage
+    lookups: foreign key field -> (model, name field); the manifest gives the
+        related row's id or name (matched ignoring case)
+    children: manifest column -> (child spec, child's foreign key to this model);
+        the column holds a list of child rows (a JSON string in CSV manifests)
+    """
+
+    def __init__(self, model, key, fields, file_fields=(), lookups=None, children=None):
+        self.model = model
+        self.key = list(key)
+        self.fields = list(fields)
+        self.file_fields = list(file_fields)
+        self.lookups = lookups or {}
+        self.children = children or {}
+
+    def key_attnames(self):
+        return [self.model._meta.get_field(name).attname for name in self.key]
+
+    def key_of(self, instance):
+        return tuple(getattr(instance, attname) for attname in self.key_attnames())
+
+
+READING_SPEC = IngestSpec(
+    BillReading,
+    key=['bill', 'stage'],
+    fields=['stage', 'date', 'details'],
+    file_fields=['document', 'committee_report', 'analysis', 'mp_photo'],
+)
+
+INGEST_SPECS = {
+    'hansard': IngestSpec(Hansard, key=['name', 'date'], fields=['name', 'date', 'date_received'], file_fields=['file']),
+    'orderpaper': IngestSpec(
+        OrderPaper, key=['name', 'date_received'], fields=['name', 'description', 'date_received'], file_fields=['file'],
+    ),
+    'budget': IngestSpec(
+        Budget, key=['name', 'financial_year'], fields=['name', 'financial_year', 'budget_total_amount'], file_fields=['file'],
+    ),
+    'committeedocument': IngestSpec(
+        CommitteeDocument,
+        key=['committee', 'title'],
+        fields=['committee', 'title', 'description', 'document_date'],
+        file_fields=['file'],
+        lookups={'committee': (Committee, 'title')},
+    ),
+    'bill': IngestSpec(
+        Bill,
+        key=['title'],
+        fields=['title', 'bill_type', 'year_introduced', 'mover', 'assigned_to', 'status', 'description', 'video_url'],
+        children={'readings': (READING_SPEC, 'bill')},
+    ),
+}
+
+
+def hash_file(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def store_file(field, path):
+    """Copy a file into the field's storage under a content-addressed name. Returns (name, copied)."""
+    name = field.generate_filename(None, f'{hash_file(path)[:16]}-{os.path.basename(path)}')
+    if field.storage.exists(name):
+        return name, False
+    with open(path, 'rb') as f:
+        return field.storage.save(name, File(f, name=os.path.basename(path))), True
+
+
+class Ingester:
+    """
+    Ingest manifest rows for one spec. `stats` counts read, created, existing,
+    invalid and files_copied / files_reused; `errors` lists the invalid rows.
+    """
+
+    def __init__(self, spec, base_dir, workers=8, batch_size=200, dry_run=False):
+        self.spec = spec
+        self.base_dir = base_dir
+        self.workers = workers
+        self.batch_size = batch_size
+        self.dry_run = dry_run
+        self.stats = Counter()
+        self.errors = []
+        self.touched = set()
+        # Natural key -> pk of existing rows, per spec, loaded once
+        self.keys = {}
+        self.lookup_rows = {}
+
+    def existing_keys(self, spec):
+        if spec not in self.keys:
+            attnames = spec.key_attnames()
+            self.keys[spec] = {
+                tuple(row[:-1]): row[-1] for row in spec.model.objects.values_list(*attnames, 'pk').iterator()
+            }
+        return self.keys[spec]
+
+    def lookup(self, model, name_field, value):
+        """pk of the related row given by id or name"""
+        if model not in self.lookup_rows:
+            rows = {}
+            for pk, name in model.objects.values_list('pk', name_field):
+                rows[str(pk)] = pk
+                rows.setdefault(str(name).strip().lower(), pk)
+            self.lookup_rows[model] = rows
+        pk = self.lookup_rows[model].get(str(value).strip().lower())
+        if pk is None:
+            raise ValueError(f'{model._meta.verbose_name} "{value}" not found')
+        return pk
+
+    def build(self, spec, row):
+        """(unsaved instance, {file field: source path}) for a manifest row; raises ValueError/ValidationError"""
+        if not isinstance(row, dict):
+            raise ValueError('not an object')
+        instance = spec.model()
+        for name in spec.fields:
+            field = spec.model._meta.get_field(name)
+            raw = row.get(name)
+            if isinstance(raw, str):
+                raw = raw.strip()
+            if name in spec.lookups:
+                if raw in (None, '') and not field.null:
+                    raise ValueError(f'{name} is required')
+                model, name_field = spec.lookups[name]
+                setattr(instance, field.attname, self.lookup(model, name_field, raw) if raw not in (None, '') else None)
+            elif raw in (None, ''):
+                setattr(instance, field.attname, field.get_default() if field.has_default() else (None if field.null else ''))
+            else:
+                setattr(instance, field.attname, field.to_python(raw))
+
+        files = {}
+        for name in spec.file_fields:
+            path = (row.get(name) or '').strip()
+            if path:
+                path = os.path.join(self.base_dir, path)
+                if not os.path.isfile(path):
+                    raise ValueError(f'{name}: file not found: {path}')
+                files[name] = path
+            elif not spec.model._meta.get_field(name).blank:
+                raise ValueError(f'{name} is required')
+
+        # Only the manifest's own columns are validated: files and parent links are set later,
+        # and looked-up foreign keys are known to exist (validating them would query per row)
+        instance.clean_fields(exclude=[
+            field.name for field in spec.model._meta.fields if field.name not in spec.fields or field.name in spec.lookups
+        ])
+        return instance, files
+
+    def parse(self, row_number, row):
+        """(instance, files, [(child spec, fk, instance, files), ...]) or None when the row is invalid"""
+        try:
+            instance, files = self.build(self.spec, row)
+            children = []
+            for column, (child_spec, fk) in self.spec.children.items():
+                child_rows = row.get(column) or []
+                if isinstance(child_rows, str):
+                    child_rows = json.loads(child_rows)
+                for child_row in child_rows:
+                    children.append((child_spec, fk, *self.build(child_spec, child_row)))
+            return instance, files, children
+        except (TypeError, ValueError, ValidationError) as e:
+            message = '; '.join(e.messages) if isinstance(e, ValidationError) else str(e)
+            self.stats['invalid'] += 1
+            self.errors.append(f'Row {row_number}: {message}')
+            return None
+
+    def store_files(self, items):
+        """
+        Copy the files of (row number, spec, instance, files) items with the thread pool and set
+        the fields. Returns the row numbers whose files could not be read or copied; each is
+        reported as invalid.
+        """
+        jobs = {}
+        for _, spec, instance, files in items:
+            for name, path in files.items():
+                jobs.setdefault((spec.model, name, path), spec.model._meta.get_field(name))
+        if self.dry_run or not jobs:
+            self.stats['files_to_copy'] += len(jobs)
+            return set()
+
+        def copy(job):
+            try:
+                return store_file(jobs[job], job[2])
+            except OSError as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='ingest') as executor:
+            stored = dict(zip(jobs, executor.map(copy, jobs)))
+        for result in stored.values():
+            if not isinstance(result, OSError):
+                self.stats['files_copied' if result[1] else 'files_reused'] += 1
+
+        failed = {}
+        for row_number, spec, instance, files in items:
+            for name, path in files.items():
+                result = stored[(spec.model, name, path)]
+                if isinstance(result, OSError):
+                    failed.setdefault(row_number, []).append(f'{name}: cannot copy {path}: {result.strerror or result}')
+                else:
+                    setattr(instance, name, result[0])
+        for row_number, messages in sorted(failed.items()):
+            self.stats['invalid'] += 1
+            self.errors.append(f'Row {row_number}: {"; ".join(messages)}')
+        return set(failed)
+
+    def ingest_batch(self, rows):
+        parent_keys = self.existing_keys(self.spec)
+        # (row number, spec, instance, files) of the parent rows to create
+        parents = []
+        # (row number, parent key, child spec, foreign key, instance, files) of the child rows to create
+        children = []
+        pending_children = set()
+
+        for row_number, row in rows:
+            parsed = self.parse(row_number, row)
+            if parsed is None:
+                continue
+            instance, files, child_items = parsed
+            key = self.spec.key_of(instance)
+            if key in parent_keys:
+                self.stats['existing'] += 1
+            else:
+                # Until bulk_create assigns the pk the key maps to the pending instance,
+                # so a later row with the same key is not created twice
+                parent_keys[key] = instance
+                parents.append((row_number, self.spec, instance, files))
+
+            parent = parent_keys[key]
+            for child_spec, fk, child, child_files in child_items:
+                if isinstance(parent, int):
+                    setattr(child, child_spec.model._meta.get_field(fk).attname, parent)
+                    child_key = child_spec.key_of(child)
+                    if child_key in self.existing_keys(child_spec):
+                        self.stats['children_existing'] += 1
+                        continue
+                else:
+                    child_key = (key, child_spec.key_of(child))
+                if (child_spec, child_key) in pending_children:
+                    self.stats['children_existing'] += 1
+                    continue
+                pending_children.add((child_spec, child_key))
+                children.append((row_number, key, child_spec, fk, child, child_files))
+
+        failed = self.store_files(parents + [
+            (row_number, spec, child, files) for row_number, _, spec, _, child, files in children
+        ])
+        if failed:
+            # A row whose files failed is skipped whole, with the children later rows gave its parent
+            dropped_keys = set()
+            for row_number, spec, instance, _ in parents:
+                if row_number in failed:
+                    key = spec.key_of(instance)
+                    del parent_keys[key]
+                    dropped_keys.add(key)
+            parents = [item for item in parents if item[0] not in failed]
+            for row_number, key, *_ in children:
+                if key in dropped_keys and row_number not in failed:
+                    failed.add(row_number)
+                    self.stats['invalid'] += 1
+                    self.errors.append(f'Row {row_number}: skipped, the row creating its {self.spec.model._meta.verbose_name} failed')
+            children = [item for item in children if item[0] not in failed]
+
+        if self.dry_run:
+            self.stats['created'] += len(parents)
+            self.stats['children_created'] += len(children)
+            return
+
+        new_children = {}
+        with transaction.atomic():
+            if parents:
+                self.spec.model.objects.bulk_create([instance for _, _, instance, _ in parents])
+                for _, _, instance, _ in parents:
+                    parent_keys[self.spec.key_of(instance)] = instance.pk
+
+            for _, key, child_spec, fk, child, _ in children:
+                setattr(child, child_spec.model._meta.get_field(fk).attname, parent_keys[key])
+                new_children.setdefault(child_spec, []).append(child)
+            for child_spec, instances in new_children.items():
+                child_spec.model.objects.bulk_create(instances)
+
+        if parents:
+            self.stats['created'] += len(parents)
+            self.touched.add(self.spec.model)
+        for child_spec, instances in new_children.items():
+            child_keys = self.existing_keys(child_spec)
+            for instance in instances:
+                child_keys[child_spec.key_of(instance)] = instance.pk
+            self.stats['children_created'] += len(instances)
+            self.touched.add(child_spec.model)
+
+    def run(self, records):
+        batch = []
+        for row_number, row in enumerate(records, 1):
+            self.stats['read'] += 1
+            batch.append((row_number, row))
+            if len(batch) >= self.batch_size:
+                self.ingest_batch(batch)
+                batch = []
+        if batch:
+            self.ingest_batch(batch)
+
+    def finish(self):
+        """Expire caches and rebuild counters of the models written to (bulk_create sends no signals)"""
+        for model in self.touched:
+            invalidate(model_version_name(model), *CACHE_DEPENDENCIES.get(model._meta.label, []))
+            if model in MODEL_TRACKERS:
+                rebuild_stats(MODEL_TRACKERS[model][0])
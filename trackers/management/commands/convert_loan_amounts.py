@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+from trackers.models import ExchangeRate, Loan, convert_loan_amounts
+
+
+class Command(BaseCommand):
+    help = 'Recompute every loan\'s amount_ugx / amount_usd from the Exchange Rates. Rate changes made in the admin do this automatically; run it after importing rates or loans in bulk.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Loans per UPDATE batch (default: 500)'
+        )
+
+    def handle(self, *args, **options):
+        if not ExchangeRate.objects.filter(currency='USD').exists():
+            self.stdout.write(self.style.WARNING('No USD exchange rate: no loan can be converted until one is added'))
+
+        changed = convert_loan_amounts(options['batch_size'])
+        unconverted = Loan.objects.filter(amount_usd__isnull=True).count()
+
+        # Summary
+        self.stdout.write(self.style.SUCCESS('\n' + '='*60))
+        self.stdout.write(self.style.SUCCESS('Loan Conversion Summary:'))
+        self.stdout.write(self.style.SUCCESS(f'  Updated: {changed}'))
+        if unconverted > 0:
+            self.stdout.write(self.style.WARNING(f'  Without a rate: {unconverted}'))
+        self.stdout.write(self.style.SUCCESS('='*60))
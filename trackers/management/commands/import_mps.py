@@ -1,16 +1,57 @@
-import json
-from django.core.management.base import BaseCommand
-from trackers.models import MP, ParliamentTerm
+import os
+import time
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from main.cache import CACHE_DEPENDENCIES, invalidate, model_version_name
+from main.utils import render_rich_text
+from trackers.ingest import read_records
+from trackers.models import District, MP, ParliamentTerm, Party
+from trackers.stats import rebuild_stats
+
+# Columns an import sets; the rendered bio and updated_at are written with them
+IMPORT_FIELDS = [
+    'parliament_term', 'first_name', 'middle_name', 'last_name', 'name',
+    'party', 'constituency', 'district', 'phone_no', 'email', 'bio',
+]
+UPDATE_FIELDS = IMPORT_FIELDS + ['bio_html', 'updated_at']
+
+
+class NameIndex:
+    """Party/District rows by lower-cased name, loaded once. Unknown names are created, or left unsaved in a dry run."""
+
+    def __init__(self, model, dry_run):
+        self.model = model
+        self.dry_run = dry_run
+        self.rows = {row.name.lower(): row for row in model.objects.all()}
+
+    def get(self, name):
+        name = name.strip()
+        if not name:
+            return None
+        key = name.lower()
+        if key not in self.rows:
+            self.rows[key] = self.model(name=name) if self.dry_run else self.model.objects.for_name(name)
+        return self.rows[key]
 
 
 class Command(BaseCommand):
-    help = 'Import MPs from a JSON file. Use --term <id> to assign MPs to a parliament term (e.g. when adding a new parliament).'
+    help = (
+        'Import MPs from a CSV, JSON-lines or JSON file, matching existing MPs by email, then name. '
+        'Records are streamed and upserted in batches of --batch-size, each in its own transaction. '
+        'Use --term <id> to assign MPs to a parliament term (e.g. when adding a new parliament) '
+        'and --dry-run to list what would change without writing.'
+    )
 
     def add_arguments(self, parser):
         parser.add_argument(
-            'json_file',
+            'file',
             type=str,
-            help='Path to the JSON file containing MPs data'
+            help='Path to the MPs file: .csv (header row), .jsonl/.ndjson (one object per line) or .json (an array)'
+        )
+        parser.add_argument(
+            '--format',
+            choices=['csv', 'jsonl', 'json'],
+            help='Input format (default: from the file extension)'
         )
         parser.add_argument(
             '--clear',
@@ -23,10 +64,85 @@ class Command(BaseCommand):
             metavar='ID',
             help='Parliament term ID to assign imported MPs to. If omitted, uses the current parliament term.'
         )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='MPs per INSERT ... ON CONFLICT batch and transaction (default: 500)'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report the MPs that would be created or changed, field by field, without writing anything'
+        )
+
+    @staticmethod
+    def clean(record, parliament_term):
+        """The imported field values of one record; party and district are still names"""
+        def text(key, default=''):
+            return str(record.get(key) or '').strip() or default
+
+        values = {
+            'first_name': text('first_name', 'Unknown'),
+            'middle_name': text('middle_name'),
+            'last_name': text('last_name', 'Unknown'),
+            'name': text('name'),
+            'party': text('party', 'Unknown'),
+            'constituency': text('constituency', 'N/A'),
+            'district': text('district', 'N/A'),
+            'phone_no': text('phone_no'),
+            'email': text('email'),
+            'bio': record.get('bio') or None,
+        }
+        if parliament_term is not None:
+            values['parliament_term'] = parliament_term
+
+        # Auto-generate name if not provided
+        if not values['name']:
+            name_parts = [values['first_name']]
+            if values['middle_name']:
+                name_parts.append(values['middle_name'])
+            name_parts.append(values['last_name'])
+            values['name'] = ' '.join(name_parts)
+        return values
+
+    @staticmethod
+    def changes(mp, values):
+        """{field: (current, new)} for the values that differ from the MP's"""
+        changed = {}
+        for field, value in values.items():
+            current = getattr(mp, field)
+            if field in ('party', 'district', 'parliament_term'):
+                differs = current != value
+            else:
+                differs = (current or '') != (value or '')
+            if differs:
+                changed[field] = (current, value)
+        return changed
+
+    @staticmethod
+    def show(value):
+        return '(empty)' if value in (None, '') else f'"{value}"'
+
+    def write_batch(self, batch):
+        """Upsert a batch in one transaction: MPs with a pk are updated in place, the others inserted"""
+        mps = list(batch.values())
+        for mp in mps:
+            render_rich_text(mp, MP.RICH_TEXT_FIELDS)
+        with transaction.atomic():
+            MP.objects.bulk_create(mps, update_conflicts=True, unique_fields=['id'], update_fields=UPDATE_FIELDS)
+        return len(mps)
 
     def handle(self, *args, **options):
-        json_file = options['json_file']
+        path = options['file']
         term_id = options.get('term')
+        dry_run = options['dry_run']
+        batch_size = max(options['batch_size'], 1)
+        verbose = options['verbosity'] >= 2
+
+        if not os.path.exists(path):
+            self.stdout.write(self.style.ERROR(f'File not found: {path}'))
+            return
 
         parliament_term = None
         if term_id:
@@ -41,99 +157,116 @@ class Command(BaseCommand):
             if parliament_term:
                 self.stdout.write(f'Using current term: {parliament_term}')
 
+        if dry_run:
+            self.stdout.write(self.style.WARNING('Dry run: nothing will be written'))
+
         # Clear existing MPs if requested
-        if options['clear']:
+        if options['clear'] and not dry_run:
             count = MP.objects.count()
             MP.objects.all().delete()
             self.stdout.write(
                 self.style.WARNING(f'Deleted {count} existing MPs')
             )
 
-        # Read JSON file
-        try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                mps_data = json.load(f)
-        except FileNotFoundError:
-            self.stdout.write(
-                self.style.ERROR(f'File not found: {json_file}')
-            )
-            return
-        except json.JSONDecodeError:
-            self.stdout.write(
-                self.style.ERROR('Invalid JSON format')
-            )
-            return
+        # Key index of the MPs an import can match (same term, if one is set), loaded once
+        by_email, by_name = {}, {}
+        if not (options['clear'] and dry_run):
+            existing = MP.objects.select_related('parliament_term', 'party', 'district')
+            if parliament_term is not None:
+                existing = existing.filter(parliament_term=parliament_term)
+            for mp in existing.order_by('pk'):
+                if mp.email:
+                    by_email.setdefault(mp.email, mp)
+                by_name.setdefault(mp.name, mp)
+        parties = NameIndex(Party, dry_run)
+        districts = NameIndex(District, dry_run)
 
-        created_count = 0
-        updated_count = 0
-        skipped_count = 0
+        started = time.perf_counter()
+        read_count = created_count = updated_count = unchanged_count = skipped_count = 0
+        written = batches = 0
         errors = []
+        batch = {}
 
-        for mp_data in mps_data:
-            try:
-                # Get party name directly (no mapping needed)
-                party = mp_data.get('party', 'Unknown').strip() or 'Unknown'
-
-                # Prepare MP data
-                mp_fields = {
-                    'first_name': mp_data.get('first_name', '').strip() or 'Unknown',
-                    'middle_name': mp_data.get('middle_name', '').strip(),
-                    'last_name': mp_data.get('last_name', '').strip() or 'Unknown',
-                    'name': mp_data.get('name', '').strip(),
-                    'party': party,
-                    'constituency': mp_data.get('constituency', 'N/A').strip(),
-                    'district': mp_data.get('district', 'N/A').strip(),
-                    'phone_no': mp_data.get('phone_no', '').strip(),
-                    'email': mp_data.get('email', '').strip(),
-                    'bio': mp_data.get('bio'),
-                }
-                if parliament_term is not None:
-                    mp_fields['parliament_term'] = parliament_term
-
-                # Auto-generate name if not provided
-                if not mp_fields['name']:
-                    name_parts = [mp_fields['first_name']]
-                    if mp_fields['middle_name']:
-                        name_parts.append(mp_fields['middle_name'])
-                    name_parts.append(mp_fields['last_name'])
-                    mp_fields['name'] = ' '.join(name_parts)
-
-                # Check if MP already exists (by name or email, within same term if term is set)
-                existing_mp = None
-                lookup = MP.objects.all()
-                if parliament_term is not None:
-                    lookup = lookup.filter(parliament_term=parliament_term)
-                if mp_fields.get('email'):
-                    existing_mp = lookup.filter(email=mp_fields['email']).first()
-                if not existing_mp:
-                    existing_mp = lookup.filter(name=mp_fields['name']).first()
-
-                if existing_mp:
-                    # Update existing MP
-                    for field, value in mp_fields.items():
-                        setattr(existing_mp, field, value)
-                    existing_mp.save()
-                    updated_count += 1
-                    self.stdout.write(f'Updated: {mp_fields["name"]}')
-                else:
-                    # Create new MP
-                    MP.objects.create(**mp_fields)
+        try:
+            for record in read_records(path, options['format']):
+                read_count += 1
+                try:
+                    if not isinstance(record, dict):
+                        raise ValueError('not an object')
+                    values = self.clean(record, parliament_term)
+                    values['party'] = parties.get(values['party'])
+                    values['district'] = districts.get(values['district'])
+                except Exception as e:
+                    skipped_count += 1
+                    name = record.get('name') if isinstance(record, dict) else None
+                    errors.append(f'Error processing record {read_count} ({name or "Unknown"}): {e}')
+                    continue
+
+                mp = (values['email'] and by_email.get(values['email'])) or by_name.get(values['name'])
+                created = mp is None
+                if created:
+                    mp = MP()
+                changes = self.changes(mp, values)
+                if not changes and not created:
+                    unchanged_count += 1
+                    continue
+
+                if created:
                     created_count += 1
-                    self.stdout.write(f'Created: {mp_fields["name"]}')
+                else:
+                    updated_count += 1
+                if dry_run:
+                    if created:
+                        self.stdout.write(self.style.SUCCESS(f'+ {values["name"]}'))
+                    else:
+                        details = '; '.join(f'{field}: {self.show(old)} -> {self.show(new)}' for field, (old, new) in changes.items())
+                        self.stdout.write(f'~ {mp.name}: {details}')
+                elif verbose:
+                    self.stdout.write(f'{"Created" if created else "Updated"}: {values["name"]}')
+
+                for field, value in values.items():
+                    setattr(mp, field, value)
+                # Later records in the file match this MP too, even before it is written
+                if mp.email:
+                    by_email[mp.email] = mp
+                by_name[mp.name] = mp
+
+                if not dry_run:
+                    batch[id(mp)] = mp
+                    if len(batch) >= batch_size:
+                        written += self.write_batch(batch)
+                        batches += 1
+                        batch = {}
+
+            if batch:
+                written += self.write_batch(batch)
+                batches += 1
+        except Exception as e:
+            raise CommandError(
+                f'Import stopped at record {read_count}: {e}. Batch {batches + 1} was rolled back; '
+                f'{written} MPs from earlier batches were saved, and re-running the import is safe.'
+            )
+        finally:
+            if written:
+                # bulk_create sends no signals: rebuild the MP counters and expire MP caches here
+                rebuild_stats('mps')
+                invalidate(model_version_name(MP), *CACHE_DEPENDENCIES['trackers.MP'])
 
-            except Exception as e:
-                skipped_count += 1
-                error_msg = f'Error processing {mp_data.get("name", "Unknown")}: {str(e)}'
-                errors.append(error_msg)
-                self.stdout.write(self.style.ERROR(error_msg))
+        elapsed = time.perf_counter() - started
 
         # Summary
         self.stdout.write(self.style.SUCCESS('\n' + '='*60))
-        self.stdout.write(self.style.SUCCESS('Import Summary:'))
-        self.stdout.write(self.style.SUCCESS(f'  Created: {created_count}'))
-        self.stdout.write(self.style.SUCCESS(f'  Updated: {updated_count}'))
+        self.stdout.write(self.style.SUCCESS('Import Summary (dry run):' if dry_run else 'Import Summary:'))
+        self.stdout.write(self.style.SUCCESS(f'  Read: {read_count}'))
+        self.stdout.write(self.style.SUCCESS(f'  {"To create" if dry_run else "Created"}: {created_count}'))
+        self.stdout.write(self.style.SUCCESS(f'  {"To update" if dry_run else "Updated"}: {updated_count}'))
+        self.stdout.write(self.style.SUCCESS(f'  Unchanged: {unchanged_count}'))
         if skipped_count > 0:
             self.stdout.write(self.style.WARNING(f'  Skipped (errors): {skipped_count}'))
+        if not dry_run:
+            self.stdout.write(self.style.SUCCESS(f'  Written: {written} in {batches} batch(es)'))
+        rate = read_count / elapsed if elapsed > 0 else 0
+        self.stdout.write(self.style.SUCCESS(f'  Time: {elapsed:.2f}s ({rate:.0f} records/s)'))
         self.stdout.write(self.style.SUCCESS(f'  Total MPs in database: {MP.objects.count()}'))
         self.stdout.write(self.style.SUCCESS('='*60))
 
@@ -142,4 +275,4 @@ class Command(BaseCommand):
             for error in errors[:10]:  # Show first 10 errors
                 self.stdout.write(self.style.WARNING(f'  - {error}'))
             if len(errors) > 10:
-                self.stdout.write(self.style.WARNING(f'  ... and {len(errors) - 10} more errors'))
\ No newline at end of file
+                self.stdout.write(self.style.WARNING(f'  ... and {len(errors) - 10} more errors'))
@@ -0,0 +1,120 @@
+import os
+import time
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError
+from search.extraction import DOCUMENT_FIELDS
+from trackers.ingest import INGEST_SPECS, Ingester, read_records
+
+
+class Command(BaseCommand):
+    help = (
+        'Bulk-load tracker records and their files from a CSV, JSON-lines or JSON manifest: '
+        'files are hashed and copied into storage in parallel, rows are created in batches, '
+        'and rows that already exist are skipped, so re-running a manifest is safe.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'model',
+            choices=sorted(INGEST_SPECS),
+            help='What the manifest holds (bill rows may carry a "readings" list)'
+        )
+        parser.add_argument(
+            'manifest',
+            type=str,
+            help='Path to the manifest: .csv (header row), .jsonl/.ndjson (one object per line) or .json (an array)'
+        )
+        parser.add_argument(
+            '--format',
+            choices=['csv', 'jsonl', 'json'],
+            help='Manifest format (default: from the file extension)'
+        )
+        parser.add_argument(
+            '--base-dir',
+            type=str,
+            help='Directory file paths in the manifest are relative to (default: the manifest\'s directory)'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=8,
+            help='Threads hashing and copying files (default: 8)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=200,
+            help='Rows per bulk insert and transaction (default: 200)'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Validate the manifest and report what would be created, without copying or writing anything'
+        )
+
+    def handle(self, *args, **options):
+        manifest = options['manifest']
+        if not os.path.exists(manifest):
+            raise CommandError(f'File not found: {manifest}')
+
+        spec = INGEST_SPECS[options['model']]
+        ingester = Ingester(
+            spec,
+            base_dir=options['base_dir'] or os.path.dirname(os.path.abspath(manifest)),
+            workers=max(options['workers'], 1),
+            batch_size=max(options['batch_size'], 1),
+            dry_run=options['dry_run'],
+        )
+        if options['dry_run']:
+            self.stdout.write(self.style.WARNING('Dry run: nothing will be copied or written'))
+
+        started = time.perf_counter()
+        try:
+            ingester.run(read_records(manifest, options['format']))
+        except (ValueError, DatabaseError) as e:
+            raise CommandError(
+                f'Ingest stopped after {ingester.stats["read"]} rows: {e}. The current batch was rolled back; '
+                'earlier batches were saved, and re-running the manifest is safe.'
+            )
+        finally:
+            ingester.finish()
+        elapsed = time.perf_counter() - started
+        stats = ingester.stats
+
+        # Summary
+        model_name = spec.model._meta.verbose_name_plural
+        self.stdout.write(self.style.SUCCESS('\n' + '='*60))
+        self.stdout.write(self.style.SUCCESS(f'Ingest Summary ({model_name}{", dry run" if options["dry_run"] else ""}):'))
+        self.stdout.write(self.style.SUCCESS(f'  Rows read: {stats["read"]}'))
+        self.stdout.write(self.style.SUCCESS(f'  {"To create" if options["dry_run"] else "Created"}: {stats["created"]}'))
+        self.stdout.write(self.style.SUCCESS(f'  Already present: {stats["existing"]}'))
+        for _, (child_spec, _) in spec.children.items():
+            child_name = child_spec.model._meta.verbose_name_plural
+            self.stdout.write(self.style.SUCCESS(
+                f'  {child_name}: {stats["children_created"]} {"to create" if options["dry_run"] else "created"}, '
+                f'{stats["children_existing"]} already present'
+            ))
+        if options['dry_run']:
+            self.stdout.write(self.style.SUCCESS(f'  Files to copy: {stats["files_to_copy"]}'))
+        else:
+            self.stdout.write(self.style.SUCCESS(
+                f'  Files: {stats["files_copied"]} copied, {stats["files_reused"]} already in storage'
+            ))
+        if stats['invalid'] > 0:
+            self.stdout.write(self.style.WARNING(f'  Invalid rows (skipped): {stats["invalid"]}'))
+        rate = stats['read'] / elapsed if elapsed > 0 else 0
+        self.stdout.write(self.style.SUCCESS(f'  Time: {elapsed:.2f}s ({rate:.0f} rows/s)'))
+        self.stdout.write(self.style.SUCCESS('='*60))
+
+        if ingester.errors:
+            self.stdout.write(self.style.WARNING('\nErrors encountered:'))
+            for error in ingester.errors[:10]:  # Show first 10 errors
+                self.stdout.write(self.style.WARNING(f'  - {error}'))
+            if len(ingester.errors) > 10:
+                self.stdout.write(self.style.WARNING(f'  ... and {len(ingester.errors) - 10} more errors'))
+
+        if stats['created'] and spec.model._meta.label in DOCUMENT_FIELDS and not options['dry_run']:
+            self.stdout.write(
+                f'\nRun `python manage.py extract_documents --model {spec.model._meta.label}` '
+                'to make the new files searchable.'
+            )
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+from trackers.stats import TRACKERS, rebuild_stats
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the materialized tracker statistics (TrackerStats) from the tables, correcting any drift from bulk writes. Run periodically (e.g. nightly) and after bulk imports.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--tracker',
+            choices=sorted(TRACKERS),
+            action='append',
+            help='Tracker to rebuild; repeat for several (default: all)'
+        )
+
+    def handle(self, *args, **options):
+        trackers = options['tracker'] or list(TRACKERS)
+        total_drifted = 0
+
+        for tracker in trackers:
+            stats, drifted = rebuild_stats(tracker)
+            total_drifted += drifted
+            line = f'  {tracker}: {len(stats.counts)} counters, {drifted} corrected'
+            self.stdout.write(self.style.WARNING(line) if drifted else line)
+
+        # Summary
+        self.stdout.write(self.style.SUCCESS('\n' + '='*60))
+        self.stdout.write(self.style.SUCCESS('Tracker Statistics Summary:'))
+        self.stdout.write(self.style.SUCCESS(f'  Rebuilt: {len(trackers)}'))
+        if total_drifted > 0:
+            self.stdout.write(self.style.WARNING(f'  Corrected counters: {total_drifted}'))
+        self.stdout.write(self.style.SUCCESS('='*60))
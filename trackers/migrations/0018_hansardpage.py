@@ -0,0 +1,33 @@
+# Generated by Django 6.0 on 2026-10-19 09:30
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trackers', '0017_committee_chairperson_deputy_text'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HansardPage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('page_number', models.PositiveIntegerField(help_text='1-based page number in the PDF')),
+                ('text', models.TextField(blank=True)),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(editable=False, null=True)),
+                ('hansard', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='pages', to='trackers.hansard')),
+            ],
+            options={
+                'verbose_name': 'Hansard Page',
+                'verbose_name_plural': 'Hansard Pages',
+                'ordering': ['hansard', 'page_number'],
+                'indexes': [django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='trackers_hansardpage_fts_gin')],
+                'unique_together': {('hansard', 'page_number')},
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 6.0 on 2026-10-19 13:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trackers', '0018_hansardpage'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='mp',
+            name='bio_html',
+            field=models.TextField(blank=True, editable=False, help_text='Bio with absolute image URLs, rendered on save'),
+        ),
+        migrations.AddField(
+            model_name='loan',
+            name='description_html',
+            field=models.TextField(blank=True, editable=False, help_text='Description with absolute image URLs, rendered on save'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 6.0 on 2026-10-19 15:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trackers', '0019_mp_bio_html_loan_description_html'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TrackerStats',
+            fields=[
+                ('tracker', models.CharField(max_length=20, primary_key=True, serialize=False)),
+                ('counts', models.JSONField(default=dict, help_text="Counter key -> number of rows, e.g. 'status:passed'")),
+                ('amounts', models.JSONField(default=dict, help_text='Counter key -> summed amount (decimal string), per currency')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('reconciled_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Tracker Statistics',
+                'verbose_name_plural': 'Tracker Statistics',
+            },
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 6.0 on 2026-10-19 15:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trackers', '0020_trackerstats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExchangeRate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('currency', models.CharField(choices=[('USD', 'US Dollar'), ('EUR', 'Euro'), ('GBP', 'British Pound'), ('CNY', 'Chinese Yuan')], max_length=3)),
+                ('date', models.DateField(help_text='Date the rate applies from')),
+                ('ugx_per_unit', models.DecimalField(decimal_places=6, help_text='Uganda Shillings per one unit of the currency', max_digits=20)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Exchange Rate',
+                'verbose_name_plural': 'Exchange Rates',
+                'ordering': ['-date', 'currency'],
+                'unique_together': {('currency', 'date')},
+            },
+        ),
+        migrations.AddField(
+            model_name='loan',
+            name='amount_ugx',
+            field=models.DecimalField(blank=True, db_index=True, decimal_places=2, editable=False, help_text='Approved amount in Uganda Shillings', max_digits=24, null=True),
+        ),
+        migrations.AddField(
+            model_name='loan',
+            name='amount_usd',
+            field=models.DecimalField(blank=True, db_index=True, decimal_places=2, editable=False, help_text='Approved amount in US Dollars', max_digits=24, null=True),
+        ),
+    ]
@@ -0,0 +1,95 @@
+# Generated by Django 6.0 on 2026-10-19 17:05
+
+from collections import Counter, defaultdict
+
+import django.db.models.deletion
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+def normalize_names(apps, schema_editor):
+    """
+    One Party / District row per name ignoring case and surrounding spaces. The
+    spelling most MPs use becomes the canonical name. Blank values become NULL.
+    """
+    MP = apps.get_model('trackers', 'MP')
+    TrackerStats = apps.get_model('trackers', 'TrackerStats')
+
+    for field, model_name in (('party', 'Party'), ('district', 'District')):
+        Model = apps.get_model('trackers', model_name)
+        # lower-cased name -> {raw value: number of MPs}
+        spellings = defaultdict(Counter)
+        for value, count in MP.objects.values_list(field).annotate(count=models.Count('id')).order_by():
+            name = (value or '').strip()
+            if name:
+                spellings[name.lower()][value] += count
+
+        for raw_values in spellings.values():
+            totals = Counter()
+            for value, count in raw_values.items():
+                totals[value.strip()] += count
+            canonical = sorted(totals.items(), key=lambda item: (-item[1], item[0]))[0][0]
+            row = Model.objects.create(name=canonical)
+            MP.objects.filter(**{f'{field}__in': list(raw_values)}).update(**{f'{field}_ref': row})
+
+    # MP counters are now keyed by party/district id; the row is rebuilt on next read
+    TrackerStats.objects.filter(pk='mps').delete()
+
+
+def restore_names(apps, schema_editor):
+    MP = apps.get_model('trackers', 'MP')
+    TrackerStats = apps.get_model('trackers', 'TrackerStats')
+    for field in ('party', 'district'):
+        Model = apps.get_model('trackers', field.capitalize())
+        for row in Model.objects.all():
+            MP.objects.filter(**{f'{field}_ref': row}).update(**{field: row.name})
+    TrackerStats.objects.filter(pk='mps').delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trackers', '0021_exchangerate_loan_amounts'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='District',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+            ],
+            options={
+                'verbose_name': 'District',
+                'verbose_name_plural': 'Districts',
+                'ordering': ['name'],
+                'abstract': False,
+                'constraints': [models.UniqueConstraint(django.db.models.functions.text.Lower('name'), name='trackers_district_name_ci_unique')],
+            },
+        ),
+        migrations.CreateModel(
+            name='Party',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+            ],
+            options={
+                'verbose_name': 'Party',
+                'verbose_name_plural': 'Parties',
+                'ordering': ['name'],
+                'abstract': False,
+                'constraints': [models.UniqueConstraint(django.db.models.functions.text.Lower('name'), name='trackers_party_name_ci_unique')],
+            },
+        ),
+        migrations.AddField(
+            model_name='mp',
+            name='party_ref',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='trackers.party'),
+        ),
+        migrations.AddField(
+            model_name='mp',
+            name='district_ref',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='trackers.district'),
+        ),
+        migrations.RunPython(normalize_names, restore_names),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 6.0 on 2026-10-19 17:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Separate from 0022: PostgreSQL will not alter a table with the data
+    # migration's deferred foreign key checks still pending in the transaction
+
+    dependencies = [
+        ('trackers', '0022_party_district'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='mp',
+            name='party',
+        ),
+        migrations.RemoveField(
+            model_name='mp',
+            name='district',
+        ),
+        migrations.RenameField(
+            model_name='mp',
+            old_name='party_ref',
+            new_name='party',
+        ),
+        migrations.RenameField(
+            model_name='mp',
+            old_name='district_ref',
+            new_name='district',
+        ),
+        migrations.AlterField(
+            model_name='mp',
+            name='party',
+            field=models.ForeignKey(help_text='Political party affiliation', null=True, on_delete=django.db.models.deletion.PROTECT, related_name='mps', to='trackers.party'),
+        ),
+        migrations.AlterField(
+            model_name='mp',
+            name='district',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='mps', to='trackers.district'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 6.0 on 2026-10-19 19:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trackers', '0023_mp_party_district_fk'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='mp',
+            index=models.Index(fields=['last_name', 'first_name', 'id'], name='trackers_mp_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='loan',
+            index=models.Index(fields=['-approval_date', '-created_at', '-id'], name='trackers_loan_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='hansard',
+            index=models.Index(fields=['-date', '-created_at', '-id'], name='trackers_hansard_keyset_idx'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+from django.db import migrations
+
+
+def backfill_loan_amounts(apps, schema_editor):
+    """Fill amount_ugx / amount_usd of loans created before 0021 added them"""
+    from trackers.models import convert_loan_amounts
+
+    convert_loan_amounts(
+        loans=apps.get_model('trackers', 'Loan').objects,
+        rates=apps.get_model('trackers', 'ExchangeRate').objects,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trackers', '0024_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_loan_amounts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-19 16:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trackers', '0025_backfill_loan_amounts'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='trackerstats',
+            name='labels',
+            field=models.JSONField(default=dict, help_text='Lookups the summary reads with the counters, e.g. the current term and party names'),
+        ),
+    ]
@@ -1,8 +1,31 @@
-from django.db import models
+from bisect import bisect_right
+from decimal import Decimal
+
+from django.db import IntegrityError, models, router, transaction
+from django.db.models.functions import Lower
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from ckeditor.fields import RichTextField
+from main.cache import CACHE_DEPENDENCIES, invalidate, model_version_name
+from main.utils import render_rich_text
+from search.extraction import document_extracted
+from search.models import SEARCH_CONFIG
 
 
-class Bill(models.Model):
+class AtomicSaveMixin:
+    """
+    Save inside a transaction. TrackerStats reads the previous row with SELECT FOR UPDATE
+    before a save (trackers/stats.py), and this keeps that lock until its counters are updated.
+    """
+
+    def save(self, *args, **kwargs):
+        with transaction.atomic(using=kwargs.get('using') or router.db_for_write(type(self), instance=self)):
+            super().save(*args, **kwargs)
+
+
+class Bill(AtomicSaveMixin, models.Model):
     BILL_TYPE_CHOICES = [
         ('government', 'Government'),
         ('private_member', 'Private Member'),
@@ -83,7 +106,62 @@ class ParliamentTerm(models.Model):
         return f"{self.name} ({self.start_year}-{self.end_year})"
 
 
-class MP(models.Model):
+class LookupNameQuerySet(models.QuerySet):
+    def matching(self, names):
+        """Rows named like any of names, ignoring case and surrounding spaces (served by the Lower(name) index)"""
+        keys = {name.strip().lower() for name in names if name and name.strip()}
+        return self.annotate(name_key=Lower('name')).filter(name_key__in=keys)
+
+    def for_name(self, name):
+        """The row with this name in any casing, created if missing; None for a blank name"""
+        name = (name or '').strip()
+        if not name:
+            return None
+        existing = self.matching([name]).first()
+        if existing is not None:
+            return existing
+        try:
+            with transaction.atomic():
+                return self.create(name=name)
+        except IntegrityError:
+            # Created concurrently under another casing
+            return self.matching([name]).get()
+
+
+class LookupName(models.Model):
+    """A normalized name dimension (Party, District); names are unique ignoring case"""
+    name = models.CharField(max_length=100)
+
+    objects = LookupNameQuerySet.as_manager()
+
+    class Meta:
+        abstract = True
+        ordering = ['name']
+        constraints = [
+            models.UniqueConstraint(Lower('name'), name='%(app_label)s_%(class)s_name_ci_unique'),
+        ]
+
+    def __str__(self):
+        return self.name
+
+
+class Party(LookupName):
+    """Political party an MP belongs to"""
+
+    class Meta(LookupName.Meta):
+        verbose_name = 'Party'
+        verbose_name_plural = 'Parties'
+
+
+class District(LookupName):
+    """District an MP represents"""
+
+    class Meta(LookupName.Meta):
+        verbose_name = 'District'
+        verbose_name_plural = 'Districts'
+
+
+class MP(AtomicSaveMixin, models.Model):
     """Model for Members of Parliament"""
     parliament_term = models.ForeignKey(
         ParliamentTerm,
@@ -105,22 +183,41 @@ class MP(models.Model):
     email = models.EmailField(blank=True)
 
     # Political Information
-    party = models.CharField(max_length=100, help_text="Political party affiliation", db_index=True)
+    party = models.ForeignKey(
+        Party,
+        on_delete=models.PROTECT,
+        null=True,
+        related_name='mps',
+        help_text="Political party affiliation",
+    )
     constituency = models.CharField(max_length=200, db_index=True)
-    district = models.CharField(max_length=100, db_index=True)
+    district = models.ForeignKey(
+        District,
+        on_delete=models.PROTECT,
+        null=True,
+        related_name='mps',
+    )
 
     # Additional Information
     photo = models.ImageField(upload_to='mps/', blank=True, null=True)
     bio = RichTextField(blank=True, null=True)
+    bio_html = models.TextField(blank=True, editable=False, help_text="Bio with absolute image URLs, rendered on save")
 
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Rich text source field -> stored rendered HTML (see main.utils.render_rich_text)
+    RICH_TEXT_FIELDS = {'bio': 'bio_html'}
+
     class Meta:
         ordering = ['last_name', 'first_name']
         verbose_name = 'Member of Parliament'
         verbose_name_plural = 'Members of Parliament'
+        indexes = [
+            # Default list ordering plus the pk tiebreaker, for keyset pagination
+            models.Index(fields=['last_name', 'first_name', 'id'], name='trackers_mp_keyset_idx'),
+        ]
 
     def __str__(self):
         return self.name
@@ -133,6 +230,7 @@ class MP(models.Model):
                 name_parts.append(self.middle_name)
             name_parts.append(self.last_name)
             self.name = ' '.join(name_parts)
+        kwargs['update_fields'] = render_rich_text(self, self.RICH_TEXT_FIELDS, kwargs.get('update_fields'))
         super().save(*args, **kwargs)
 
 
@@ -217,7 +315,7 @@ class Lender(models.Model):
         return self.name
 
 
-class Loan(models.Model):
+class Loan(AtomicSaveMixin, models.Model):
     """Model for Government Loans and Projects"""
     SECTOR_CHOICES = [
         ('energy', 'Energy'),
@@ -273,19 +371,48 @@ class Loan(models.Model):
     )
     currency = models.CharField(max_length=3, choices=CURRENCY_CHOICES, default='USD')
     approval_date = models.DateField(null=True, blank=True)
+    # approved_amount converted with the ExchangeRate in force on approval_date;
+    # null while no rate exists for the currency
+    amount_ugx = models.DecimalField(
+        max_digits=24, decimal_places=2, null=True, blank=True, editable=False, db_index=True,
+        help_text="Approved amount in Uganda Shillings"
+    )
+    amount_usd = models.DecimalField(
+        max_digits=24, decimal_places=2, null=True, blank=True, editable=False, db_index=True,
+        help_text="Approved amount in US Dollars"
+    )
     description = RichTextField(blank=True)
+    description_html = models.TextField(blank=True, editable=False, help_text="Description with absolute image URLs, rendered on save")
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Rich text source field -> stored rendered HTML (see main.utils.render_rich_text)
+    RICH_TEXT_FIELDS = {'description': 'description_html'}
+
+    # Fields amount_ugx / amount_usd are computed from
+    CONVERSION_FIELDS = {'approved_amount', 'currency', 'approval_date'}
+
     class Meta:
         ordering = ['-approval_date', '-created_at']
         verbose_name = 'Loan'
         verbose_name_plural = 'Loans'
+        indexes = [
+            models.Index(fields=['-approval_date', '-created_at', '-id'], name='trackers_loan_keyset_idx'),
+        ]
 
     def __str__(self):
         return f"{self.get_sector_display()}: {self.label[:50]}"
 
+    def save(self, *args, **kwargs):
+        update_fields = render_rich_text(self, self.RICH_TEXT_FIELDS, kwargs.get('update_fields'))
+        if update_fields is None or update_fields & self.CONVERSION_FIELDS:
+            self.amount_ugx, self.amount_usd = RateTable().convert(self.approved_amount, self.currency, self.approval_date)
+            if update_fields is not None:
+                update_fields.update({'amount_ugx', 'amount_usd'})
+        kwargs['update_fields'] = update_fields
+        super().save(*args, **kwargs)
+
     @property
     def lender_display(self):
         if self.lender_id:
@@ -308,6 +435,92 @@ class LoanDocument(models.Model):
     def __str__(self):
         return f"{self.label} – {self.loan.label}"
 
+
+class ExchangeRate(models.Model):
+    """Value of one unit of a loan currency in Uganda Shillings, from a given date"""
+    currency = models.CharField(max_length=3, choices=[c for c in Loan.CURRENCY_CHOICES if c[0] != 'UGX'])
+    date = models.DateField(help_text="Date the rate applies from")
+    ugx_per_unit = models.DecimalField(
+        max_digits=20,
+        decimal_places=6,
+        help_text="Uganda Shillings per one unit of the currency"
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['-date', 'currency']
+        verbose_name = 'Exchange Rate'
+        verbose_name_plural = 'Exchange Rates'
+        unique_together = ['currency', 'date']
+
+    def __str__(self):
+        return f"{self.currency} {self.date}: {self.ugx_per_unit} UGX"
+
+
+class RateTable:
+    """
+    Every ExchangeRate, loaded once, for converting loan amounts without a query per loan.
+    A loan uses the latest rate on or before its approval date (the earliest rate for
+    older loans, the latest rate for loans without a date).
+    `rates` is the ExchangeRate manager to read (a historical one in migrations).
+    """
+    CENT = Decimal('0.01')
+
+    def __init__(self, rates=None):
+        self.dates = {}
+        self.rates = {}
+        rates = ExchangeRate.objects if rates is None else rates
+        for currency, date, rate in rates.order_by('currency', 'date').values_list('currency', 'date', 'ugx_per_unit'):
+            self.dates.setdefault(currency, []).append(date)
+            self.rates.setdefault(currency, []).append(rate)
+
+    def ugx_per_unit(self, currency, on_date):
+        if currency == 'UGX':
+            return Decimal('1')
+        rates = self.rates.get(currency)
+        if not rates:
+            return None
+        if on_date is None:
+            return rates[-1]
+        return rates[max(bisect_right(self.dates[currency], on_date) - 1, 0)]
+
+    def convert(self, amount, currency, on_date):
+        """(amount_ugx, amount_usd); each is None when a rate it needs is missing"""
+        if amount is None:
+            return None, None
+        amount = Decimal(str(amount))
+        to_ugx = self.ugx_per_unit(currency, on_date)
+        amount_ugx = None if to_ugx is None else (amount * to_ugx).quantize(self.CENT)
+        if currency == 'USD':
+            return amount_ugx, amount.quantize(self.CENT)
+        # A missing USD rate only leaves amount_usd unset; UGX totals still count the loan
+        usd_to_ugx = self.ugx_per_unit('USD', on_date)
+        if amount_ugx is None or not usd_to_ugx:
+            return amount_ugx, None
+        return amount_ugx, (amount_ugx / usd_to_ugx).quantize(self.CENT)
+
+
+def convert_loan_amounts(batch_size=500, loans=None, rates=None):
+    """
+    Recompute amount_ugx / amount_usd of every loan from the current rates. Returns the number changed.
+    `loans` / `rates` are the Loan and ExchangeRate managers to use (historical ones in migrations).
+    """
+    table = RateTable(rates)
+    changed = []
+    loans = (Loan.objects if loans is None else loans).only('approved_amount', 'currency', 'approval_date', 'amount_ugx', 'amount_usd')
+    for loan in loans.order_by().iterator(chunk_size=2000):
+        amounts = table.convert(loan.approved_amount, loan.currency, loan.approval_date)
+        if amounts != (loan.amount_ugx, loan.amount_usd):
+            loan.amount_ugx, loan.amount_usd = amounts
+            changed.append(loan)
+    if changed:
+        loans.model.objects.bulk_update(changed, ['amount_ugx', 'amount_usd'], batch_size=batch_size)
+        # bulk_update sends no signals: expire loan ETags and cached loan payloads here
+        invalidate(model_version_name(Loan), *CACHE_DEPENDENCIES['trackers.Loan'])
+    return len(changed)
+
+
 class Hansard(models.Model):
     """Model for Hansards"""
     name = models.CharField(
@@ -325,11 +538,34 @@ class Hansard(models.Model):
         ordering = ['-date', '-created_at']
         verbose_name = 'Hansard'
         verbose_name_plural = 'Hansards'
+        indexes = [
+            models.Index(fields=['-date', '-created_at', '-id'], name='trackers_hansard_keyset_idx'),
+        ]
 
     def __str__(self):
         return self.name
 
 
+class HansardPage(models.Model):
+    """Text of a single Hansard PDF page, for page-level full-text search"""
+    hansard = models.ForeignKey(Hansard, on_delete=models.CASCADE, related_name='pages')
+    page_number = models.PositiveIntegerField(help_text="1-based page number in the PDF")
+    text = models.TextField(blank=True)
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        ordering = ['hansard', 'page_number']
+        verbose_name = 'Hansard Page'
+        verbose_name_plural = 'Hansard Pages'
+        unique_together = ['hansard', 'page_number']
+        indexes = [
+            GinIndex(fields=['search_vector'], name='trackers_hansardpage_fts_gin'),
+        ]
+
+    def __str__(self):
+        return f"{self.hansard.name} - page {self.page_number}"
+
+
 class Budget(models.Model):
     """Model for National Budget Documents"""
     name = models.CharField(max_length=200, help_text="Budget document name", db_index=True)
@@ -424,5 +660,47 @@ class CommitteeDocument(models.Model):
         return f"{self.committee.title} - {self.title}"
 
 
+class TrackerStats(models.Model):
+    """
+    Pre-aggregated counts for a tracker's summary endpoints, one row per tracker.
+    Maintained incrementally on save/delete and rebuilt by reconcile_tracker_stats
+    (see trackers/stats.py).
+    """
+    tracker = models.CharField(max_length=20, primary_key=True)
+    counts = models.JSONField(default=dict, help_text="Counter key -> number of rows, e.g. 'status:passed'")
+    amounts = models.JSONField(default=dict, help_text="Counter key -> summed amount (decimal string), per currency")
+    labels = models.JSONField(default=dict, help_text="Lookups the summary reads with the counters, e.g. the current term and party names")
+    updated_at = models.DateTimeField(auto_now=True)
+    reconciled_at = models.DateTimeField(null=True, blank=True)
 
+    class Meta:
+        verbose_name = 'Tracker Statistics'
+        verbose_name_plural = 'Tracker Statistics'
 
+    def __str__(self):
+        return self.tracker
+
+
+@receiver([post_save, post_delete], sender=ExchangeRate)
+def reconvert_loans(sender, instance, raw=False, **kwargs):
+    """Any rate change can move the rate in force for any loan date (and every USD amount)"""
+    if not raw:
+        transaction.on_commit(convert_loan_amounts)
+
+
+@receiver(document_extracted, sender=Hansard)
+def store_hansard_pages(sender, instance, field_name, pages, **kwargs):
+    """Replace a Hansard's page rows whenever its PDF text is (re)extracted"""
+    with transaction.atomic():
+        HansardPage.objects.filter(hansard=instance).delete()
+        HansardPage.objects.bulk_create(
+            [
+                HansardPage(hansard=instance, page_number=number, text=text)
+                for number, text in enumerate(pages, start=1)
+                if text
+            ],
+            batch_size=200,
+        )
+        HansardPage.objects.filter(hansard=instance).update(
+            search_vector=SearchVector('text', config=SEARCH_CONFIG)
+        )
@@ -1,6 +1,21 @@
 from rest_framework import serializers
-from main.utils import get_full_media_url, process_content_images
-from .models import Bill, BillReading, MP, ParliamentTerm, DebtData, Lender, Loan, LoanDocument, Hansard, Budget, OrderPaper, Committee, CommitteeDocument
+from main.serializers import ValuesSerializer
+from main.utils import get_full_media_url, rendered_rich_text
+from .models import Bill, BillReading, MP, Party, District, ParliamentTerm, DebtData, Lender, Loan, LoanDocument, Hansard, Budget, OrderPaper, Committee, CommitteeDocument
+
+
+class LookupNameField(serializers.SlugRelatedField):
+    """A Party/District foreign key as its name; writes accept any casing and create unknown names"""
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault('slug_field', 'name')
+        kwargs.setdefault('allow_null', True)
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        if not isinstance(data, str):
+            self.fail('invalid')
+        return self.get_queryset().for_name(data)
 
 
 class ParliamentTermSerializer(serializers.ModelSerializer):
@@ -98,8 +113,15 @@ class BillListSerializer(serializers.ModelSerializer):
         ]
 
 
+class BillListValuesSerializer(ValuesSerializer):
+    """values() fast path for BillListSerializer (list endpoint)"""
+    serializer_class = BillListSerializer
+
+
 class MPListSerializer(serializers.ModelSerializer):
     """Simplified serializer for MP listing"""
+    party = LookupNameField(queryset=Party.objects.all())
+    district = LookupNameField(queryset=District.objects.all())
     photo = serializers.SerializerMethodField()
 
     class Meta:
@@ -124,8 +146,23 @@ class MPListSerializer(serializers.ModelSerializer):
         return None
 
 
+class MPListValuesSerializer(ValuesSerializer):
+    """values() fast path for MPListSerializer (list endpoint)"""
+    serializer_class = MPListSerializer
+    media_fields = {'photo': 'photo'}
+    extra_columns = ['party__name', 'district__name']
+
+    def get_party(self, row):
+        return row['party__name']
+
+    def get_district(self, row):
+        return row['district__name']
+
+
 class MPDetailSerializer(serializers.ModelSerializer):
     """Full serializer for MP detail view"""
+    party = LookupNameField(queryset=Party.objects.all())
+    district = LookupNameField(queryset=District.objects.all())
     photo = serializers.SerializerMethodField()
     bio = serializers.SerializerMethodField()
 
@@ -150,9 +187,9 @@ class MPDetailSerializer(serializers.ModelSerializer):
         read_only_fields = ['created_at', 'updated_at']
     
     def get_bio(self, obj):
-        """Process bio HTML to convert relative image URLs to absolute URLs"""
+        """Bio HTML with absolute image URLs, rendered when the MP was saved"""
         if obj.bio:
-            return process_content_images(obj.bio)
+            return rendered_rich_text(obj, 'bio', 'bio_html')
         return obj.bio
 
     def get_photo(self, obj):
@@ -215,6 +252,8 @@ class LoanSerializer(serializers.ModelSerializer):
             'approved_amount',
             'currency',
             'currency_display',
+            'amount_ugx',
+            'amount_usd',
             'lender',
             'lender_display',
             'source',
@@ -237,7 +276,7 @@ class LoanDetailSerializer(LoanSerializer):
 
     def get_description(self, obj):
         if obj.description:
-            return process_content_images(obj.description)
+            return rendered_rich_text(obj, 'description', 'description_html')
         return ''
 
 
@@ -382,6 +421,8 @@ class CommitteeDetailSerializer(serializers.ModelSerializer):
 # Lightweight serializers for home page summary
 class HomeSummaryMPSerializer(serializers.ModelSerializer):
     """Minimal serializer for MP home summary"""
+    party = serializers.SlugRelatedField(slug_field='name', read_only=True)
+
     class Meta:
         model = MP
         fields = ['id', 'name', 'party', 'constituency']
@@ -0,0 +1,217 @@
+"""
+Materialized tracker statistics.
+
+TrackerStats keeps one row per tracker with flat counters, e.g. for bills
+{'total': 40, 'status:passed': 12, 'type:government': 30}; MP counters are per
+parliament term and party/district id ('party:<term id>:<party id>'). The
+summary endpoints read that single row instead of running COUNT / GROUP BY
+queries.
+
+Each tracked model has a function returning the counters one instance
+contributes. Saving or deleting an instance applies the difference between its
+old and new contributions to the row, inside a transaction holding the row lock.
+The previous row is read with SELECT FOR UPDATE in the save's transaction
+(tracked models save atomically, see trackers.models.AtomicSaveMixin), so
+concurrent saves of one instance cannot both subtract the same old values.
+Queryset update()/bulk_create() bypass signals, so `manage.py
+reconcile_tracker_stats` rebuilds every row from the tables; run it nightly
+and after bulk imports.
+
+A row also holds `labels`, the lookups its summary needs besides the counters
+(for MPs: the current term and party names), so the summary is a single read.
+They are refreshed after any change to the models they come from.
+"""
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.utils import timezone
+
+from .models import Bill, Loan, MP, ParliamentTerm, Party, TrackerStats
+
+
+def bill_counters(bill):
+    return {'total': 1, f'status:{bill.status}': 1, f'type:{bill.bill_type}': 1}, {}
+
+
+def mp_counters(mp):
+    term = mp.parliament_term_id
+    return {f'total:{term}': 1, f'party:{term}:{mp.party_id}': 1, f'district:{term}:{mp.district_id}': 1}, {}
+
+
+def loan_counters(loan):
+    groups = ['total', f'source:{loan.source}', f'lender:{loan.lender_id}', f'sector:{loan.sector}']
+    counts = {group: 1 for group in groups}
+    amounts = {f'{group}:{loan.currency}': loan.approved_amount or Decimal('0') for group in groups}
+    return counts, amounts
+
+
+# Tracker -> (model, counters function, fields the counters read)
+TRACKERS = {
+    'bills': (Bill, bill_counters, ['status', 'bill_type']),
+    'mps': (MP, mp_counters, ['parliament_term', 'party', 'district']),
+    'loans': (Loan, loan_counters, ['source', 'lender', 'sector', 'currency', 'approved_amount']),
+}
+MODEL_TRACKERS = {model: (tracker, counters, fields) for tracker, (model, counters, fields) in TRACKERS.items()}
+
+
+def mp_labels():
+    return {
+        'current_term': ParliamentTerm.objects.filter(is_current=True).values_list('pk', flat=True).first(),
+        'parties': {str(pk): name for pk, name in Party.objects.values_list('pk', 'name')},
+    }
+
+
+# Tracker -> (labels function, models the labels read)
+LABELS = {
+    'mps': (mp_labels, [ParliamentTerm, Party]),
+}
+
+
+def compute_labels(tracker):
+    return LABELS[tracker][0]() if tracker in LABELS else {}
+
+
+def refresh_labels(tracker):
+    """Recompute a tracker's labels; a missing row gets them when it is built"""
+    TrackerStats.objects.filter(pk=tracker).update(labels=compute_labels(tracker))
+
+
+def _merge(target, source, sign=1):
+    for key, value in source.items():
+        target[key] = target.get(key, 0) + sign * value
+
+
+def _apply(stats, counts, amounts):
+    for key, delta in counts.items():
+        value = stats.counts.get(key, 0) + delta
+        if value:
+            stats.counts[key] = value
+        else:
+            # Drop empty groups, so distinct counts are just the number of keys
+            stats.counts.pop(key, None)
+    for key, delta in amounts.items():
+        value = Decimal(stats.amounts.get(key, '0')) + delta
+        if value:
+            stats.amounts[key] = str(value)
+        else:
+            stats.amounts.pop(key, None)
+
+
+def apply_delta(tracker, counts, amounts):
+    """Add counter deltas to a tracker's row (building the row first if it does not exist)"""
+    counts = {key: value for key, value in counts.items() if value}
+    amounts = {key: value for key, value in amounts.items() if value}
+    if not counts and not amounts:
+        return
+    with transaction.atomic():
+        stats = TrackerStats.objects.select_for_update().filter(pk=tracker).first()
+        if stats is None:
+            # Built from the tables, which already include this write
+            rebuild_stats(tracker)
+            return
+        _apply(stats, counts, amounts)
+        stats.save(update_fields=['counts', 'amounts', 'updated_at'])
+
+
+def compute_stats(tracker):
+    """(counts, amounts) for a tracker computed from its table"""
+    model, counters, fields = TRACKERS[tracker]
+    counts, amounts = {}, {}
+    for instance in model.objects.only(*fields).order_by().iterator(chunk_size=2000):
+        instance_counts, instance_amounts = counters(instance)
+        _merge(counts, instance_counts)
+        _merge(amounts, instance_amounts)
+    return (
+        {key: value for key, value in counts.items() if value},
+        {key: str(value) for key, value in amounts.items() if value},
+    )
+
+
+def rebuild_stats(tracker):
+    """Recompute a tracker's row from its table. Returns (stats, number of counters that had drifted)."""
+    with transaction.atomic():
+        stats, _ = TrackerStats.objects.select_for_update().get_or_create(pk=tracker)
+        counts, amounts = compute_stats(tracker)
+        drifted = sum(
+            1
+            for current, expected in ((stats.counts, counts), (stats.amounts, amounts))
+            for key in current.keys() | expected.keys()
+            if current.get(key) != expected.get(key)
+        )
+        stats.counts = counts
+        stats.amounts = amounts
+        stats.labels = compute_labels(tracker)
+        stats.reconciled_at = timezone.now()
+        stats.save()
+    return stats, drifted
+
+
+def get_stats(tracker):
+    """(counts, amounts, labels) for a tracker; amounts are Decimals"""
+    stats = TrackerStats.objects.filter(pk=tracker).first()
+    # Rows built before labels existed are rebuilt once
+    if stats is None or (tracker in LABELS and not stats.labels):
+        stats, _ = rebuild_stats(tracker)
+    return stats.counts, {key: Decimal(value) for key, value in stats.amounts.items()}, stats.labels
+
+
+def grouped(counters, prefix):
+    """{group value: counter} for the counters named '<prefix><value>'"""
+    return {key[len(prefix):]: value for key, value in counters.items() if key.startswith(prefix)}
+
+
+def _remember_previous(sender, instance, raw=False, using=None, **kwargs):
+    if raw or sender not in MODEL_TRACKERS:
+        return
+    _, counters, fields = MODEL_TRACKERS[sender]
+    previous = None
+    if instance.pk is not None and not instance._state.adding:
+        queryset = sender._default_manager.db_manager(using).only(*fields).filter(pk=instance.pk)
+        # Lock the row until the counters are updated (outside a transaction the lock would end at once)
+        if transaction.get_connection(using).in_atomic_block:
+            queryset = queryset.select_for_update()
+        previous = queryset.first()
+    instance._tracker_stats_previous = counters(previous) if previous is not None else ({}, {})
+
+
+def _update_on_save(sender, instance, raw=False, **kwargs):
+    if raw or sender not in MODEL_TRACKERS:
+        return
+    tracker, counters, _ = MODEL_TRACKERS[sender]
+    counts, amounts = counters(instance)
+    previous_counts, previous_amounts = getattr(instance, '_tracker_stats_previous', ({}, {}))
+    counts, amounts = dict(counts), dict(amounts)
+    _merge(counts, previous_counts, -1)
+    _merge(amounts, previous_amounts, -1)
+    apply_delta(tracker, counts, amounts)
+
+
+def _update_on_delete(sender, instance, **kwargs):
+    if sender not in MODEL_TRACKERS:
+        return
+    tracker, counters, _ = MODEL_TRACKERS[sender]
+    counts, amounts = counters(instance)
+    apply_delta(tracker, {key: -value for key, value in counts.items()}, {key: -value for key, value in amounts.items()})
+
+
+def _update_labels(sender, raw=False, **kwargs):
+    if raw:
+        return
+    for tracker, (_, models) in LABELS.items():
+        if sender in models:
+            # After commit, so the labels are read from the committed tables
+            transaction.on_commit(lambda tracker=tracker: refresh_labels(tracker))
+
+
+def connect_tracker_stats():
+    """Connect the incremental maintenance receivers. Call once apps are ready."""
+    for model in MODEL_TRACKERS:
+        label = model._meta.label
+        pre_save.connect(_remember_previous, sender=model, dispatch_uid=f'tracker_stats_pre_save_{label}')
+        post_save.connect(_update_on_save, sender=model, dispatch_uid=f'tracker_stats_save_{label}')
+        post_delete.connect(_update_on_delete, sender=model, dispatch_uid=f'tracker_stats_delete_{label}')
+    for model in {model for _, models in LABELS.values() for model in models}:
+        label = model._meta.label
+        post_save.connect(_update_labels, sender=model, dispatch_uid=f'tracker_stats_labels_save_{label}')
+        post_delete.connect(_update_labels, sender=model, dispatch_uid=f'tracker_stats_labels_delete_{label}')
@@ -1,3 +1,218 @@
-from django.test import TestCase
+import json
+import os
+import tempfile
+from io import StringIO
 
-# Create your tests here.
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.test import TestCase, override_settings
+
+from .ingest import INGEST_SPECS, Ingester
+from .models import Bill, BillReading, Committee, CommitteeDocument, Hansard, MP, ParliamentTerm, Party
+from .stats import compute_stats, get_stats
+
+
+class MPSummaryTests(TestCase):
+    url = '/api/trackers/mps/summary/'
+
+    def setUp(self):
+        cache.clear()
+        with self.captureOnCommitCallbacks(execute=True):
+            # Migration 0016 creates the current term
+            self.term = ParliamentTerm.objects.get(is_current=True)
+            self.nrm = Party.objects.create(name='NRM')
+            self.fdc = Party.objects.create(name='FDC')
+            for index, party in enumerate([self.nrm, self.nrm, self.fdc]):
+                MP.objects.create(first_name='Member', last_name=str(index), parliament_term=self.term, party=party)
+        get_stats('mps')
+
+    def test_default_summary_is_one_read(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+        self.assertEqual(response.data['total_mps'], 3)
+        self.assertEqual(
+            [(item['party'], item['count']) for item in response.data['party_distribution']],
+            [('NRM', 2), ('FDC', 1)],
+        )
+
+    def test_party_rename_refreshes_labels(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.fdc.name = 'Forum for Democratic Change'
+            self.fdc.save()
+        parties = [item['party'] for item in self.client.get(self.url).data['party_distribution']]
+        self.assertEqual(parties, ['NRM', 'Forum for Democratic Change'])
+
+    def test_no_current_term(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.term.is_current = False
+            self.term.save()
+        self.assertEqual(self.client.get(self.url).data['total_mps'], 0)
+
+    def test_updates_keep_counters_in_step(self):
+        mp = MP.objects.filter(party=self.fdc).get()
+        mp.party = self.nrm
+        mp.save()
+        MP.objects.filter(party=self.nrm).first().delete()
+        counts, _, _ = get_stats('mps')
+        self.assertEqual(counts, compute_stats('mps')[0])
+
+
+class IngestTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.base_dir = os.path.join(directory.name, 'manifest')
+        os.makedirs(self.base_dir)
+        media = override_settings(MEDIA_ROOT=os.path.join(directory.name, 'media'))
+        media.enable()
+        self.addCleanup(media.disable)
+        for name in ('one.pdf', 'two.pdf'):
+            with open(os.path.join(self.base_dir, name), 'wb') as f:
+                f.write(name.encode() * 100)
+
+    def ingest(self, model, rows):
+        ingester = Ingester(INGEST_SPECS[model], self.base_dir, workers=2, batch_size=2)
+        ingester.run(rows)
+        ingester.finish()
+        return ingester
+
+    hansards = [
+        {'name': 'Sitting 1', 'date': '2024-05-01', 'file': 'one.pdf'},
+        {'name': 'Sitting 2', 'date': '2024-05-02', 'file': 'two.pdf'},
+        {'name': 'Sitting 2 (copy)', 'date': '2024-05-02', 'file': 'two.pdf'},
+    ]
+
+    def test_reingest_is_idempotent(self):
+        first = self.ingest('hansard', self.hansards)
+        # The third row is in the second batch and finds two.pdf already stored
+        self.assertEqual((first.stats['created'], first.stats['files_copied'], first.stats['files_reused']), (3, 2, 1))
+        files = sorted(Hansard.objects.values_list('file', flat=True))
+
+        second = self.ingest('hansard', self.hansards)
+        self.assertEqual((second.stats['created'], second.stats['existing']), (0, 3))
+        self.assertEqual(second.stats['files_copied'], 0)
+        self.assertEqual(sorted(Hansard.objects.values_list('file', flat=True)), files)
+
+    def test_existing_rows_are_skipped_and_new_ones_created(self):
+        self.ingest('hansard', self.hansards[:1])
+        ingester = self.ingest('hansard', self.hansards)
+        self.assertEqual((ingester.stats['existing'], ingester.stats['created']), (1, 2))
+        self.assertEqual(Hansard.objects.count(), 3)
+
+    def test_bill_readings_are_added_to_existing_bills(self):
+        bill = {
+            'title': 'Finance Bill', 'bill_type': 'government', 'year_introduced': '2024-07-01',
+            'mover': 'Minister', 'assigned_to': 'Budget Committee', 'status': '1st_reading',
+            'readings': [{'stage': '1st_reading', 'date': '2024-07-02', 'details': 'Read', 'document': 'one.pdf'}],
+        }
+        self.ingest('bill', [bill])
+        counts = get_stats('bills')[0]
+
+        bill['readings'] = bill['readings'] + [{'stage': '2nd_reading', 'date': '2024-08-01', 'details': 'Debated'}]
+        ingester = self.ingest('bill', [bill, bill])
+        self.assertEqual((ingester.stats['existing'], ingester.stats['created']), (2, 0))
+        self.assertEqual((ingester.stats['children_created'], ingester.stats['children_existing']), (1, 3))
+        self.assertEqual(Bill.objects.count(), 1)
+        self.assertEqual(sorted(BillReading.objects.values_list('stage', flat=True)), ['1st_reading', '2nd_reading'])
+        self.assertEqual(get_stats('bills')[0], counts)
+
+    def test_malformed_rows_are_rejected(self):
+        Committee.objects.create(title='Budget Committee')
+        rows = [
+            'not an object',
+            {'committee': 'Budget Committee', 'title': 'No file'},
+            {'committee': 'Budget Committee', 'title': 'Missing file', 'file': 'missing.pdf'},
+            {'committee': 'Budget Committee', 'title': 'Bad date', 'file': 'one.pdf', 'document_date': '2024-13-40'},
+            {'committee': 'Unknown Committee', 'title': 'Unknown', 'file': 'one.pdf'},
+            {'committee': 'budget committee', 'title': 'Report', 'file': 'one.pdf', 'document_date': '2024-05-01'},
+        ]
+        ingester = self.ingest('committeedocument', rows)
+        self.assertEqual((ingester.stats['invalid'], ingester.stats['created']), (5, 1))
+        self.assertEqual([error.split(':')[0] for error in ingester.errors], [f'Row {row}' for row in range(1, 6)])
+        self.assertEqual(list(CommitteeDocument.objects.values_list('title', flat=True)), ['Report'])
+
+    def test_command_rejects_invalid_json(self):
+        path = os.path.join(self.base_dir, 'hansards.jsonl')
+        with open(path, 'w') as f:
+            f.write(json.dumps(self.hansards[0]) + '\n{not json\n')
+        with self.assertRaisesMessage(CommandError, 'Invalid JSON on line 2'):
+            call_command('ingest', 'hansard', path, stdout=StringIO())
+        # The batch holding the valid row was never written
+        self.assertEqual(Hansard.objects.count(), 0)
+
+
+class ImportMPsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.term = ParliamentTerm.objects.get(is_current=True)
+
+    def run_import(self, records, *args):
+        path = os.path.join(self.directory, 'mps.json')
+        with open(path, 'w') as f:
+            json.dump(records, f)
+        stdout = StringIO()
+        call_command('import_mps', path, *args, stdout=stdout)
+        summary = {}
+        for line in stdout.getvalue().splitlines():
+            label, _, value = line.strip().partition(': ')
+            if label in ('Read', 'Created', 'Updated', 'Unchanged', 'Skipped (errors)', 'To create', 'To update'):
+                summary[label] = int(value)
+        return summary, stdout.getvalue()
+
+    records = [
+        {'first_name': 'Ann', 'last_name': 'Apio', 'party': 'NRM', 'district': 'Kampala', 'email': 'ann@example.org'},
+        {'first_name': 'Bob', 'last_name': 'Okello', 'party': 'FDC', 'district': 'Gulu'},
+    ]
+
+    def test_reimport_is_idempotent(self):
+        self.run_import(self.records)
+        counts = get_stats('mps')[0]
+        rows = sorted(MP.objects.values_list('pk', 'name', 'party__name', 'district__name'))
+
+        summary, _ = self.run_import(self.records)
+        self.assertEqual(summary, {'Read': 2, 'Created': 0, 'Updated': 0, 'Unchanged': 2})
+        self.assertEqual(sorted(MP.objects.values_list('pk', 'name', 'party__name', 'district__name')), rows)
+        self.assertEqual(get_stats('mps')[0], counts)
+        self.assertEqual(Party.objects.count(), 2)
+
+    def test_updates_matched_mps_and_creates_new_ones(self):
+        self.run_import(self.records)
+        ann = MP.objects.get(email='ann@example.org')
+        records = [
+            # Matched by email, although the name changed
+            dict(self.records[0], last_name='Apio-Okot', constituency='Central'),
+            # Matched by name
+            dict(self.records[1], party='nrm'),
+            {'first_name': 'Cate', 'last_name': 'Nansubuga', 'party': 'NUP', 'district': 'Wakiso'},
+        ]
+        summary, _ = self.run_import(records)
+        self.assertEqual(summary, {'Read': 3, 'Created': 1, 'Updated': 2, 'Unchanged': 0})
+        ann.refresh_from_db()
+        self.assertEqual((ann.name, ann.constituency), ('Ann Apio-Okot', 'Central'))
+        self.assertEqual(MP.objects.get(name='Bob Okello').party.name, 'NRM')
+        self.assertEqual(MP.objects.count(), 3)
+        self.assertEqual(get_stats('mps')[0], compute_stats('mps')[0])
+
+    def test_dry_run_writes_nothing(self):
+        summary, _ = self.run_import(self.records, '--dry-run')
+        self.assertEqual((summary['To create'], summary['To update']), (2, 0))
+        self.assertFalse(MP.objects.exists())
+        self.assertFalse(Party.objects.exists())
+
+    def test_malformed_records_are_skipped(self):
+        summary, output = self.run_import(['not an object', self.records[0], [1, 2]])
+        self.assertEqual((summary['Read'], summary['Created'], summary['Skipped (errors)']), (3, 1, 2))
+        self.assertIn('Error processing record 1', output)
+        self.assertEqual(MP.objects.count(), 1)
+
+    def test_invalid_json_stops_the_import(self):
+        path = os.path.join(self.directory, 'mps.json')
+        with open(path, 'w') as f:
+            f.write('[{"first_name": ')
+        with self.assertRaisesMessage(CommandError, 'Invalid JSON format'):
+            call_command('import_mps', path, stdout=StringIO())
+        self.assertFalse(MP.objects.exists())
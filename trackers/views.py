@@ -1,17 +1,29 @@
 from rest_framework import viewsets, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.pagination import PageNumberPagination
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny
+from rest_framework.utils.urls import replace_query_param
+from rest_framework import status
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Count, Q
-from django.views.decorators.cache import cache_page
-from django.utils.decorators import method_decorator
-from django.core.cache import cache
-from .models import Bill, BillReading, MP, ParliamentTerm, DebtData, Loan, Hansard, Budget, OrderPaper, Committee, CommitteeDocument
+from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank
+from django.db.models import Count, F, Max, Prefetch, Q, Sum, Value, Window
+from django.db.models.functions import Coalesce, ExtractYear, RowNumber
+from django.conf import settings
+from main.cache import stale_while_revalidate
+from main.compression import entry_response
+from main.mixins import ConditionalGetMixin, SparseFieldsetsMixin, ValuesListMixin
+from main.pagination import KeysetPageNumberPagination, decode_cursor, encode_cursor
+import datetime
+from urllib.parse import urlencode
+from search.models import SEARCH_CONFIG
+from .models import Bill, BillReading, MP, Party, District, ParliamentTerm, DebtData, Lender, Loan, LoanDocument, Hansard, HansardPage, Budget, OrderPaper, Committee, CommitteeDocument
+from .debt import SERIES_FIELDS, compute_series
+from .facets import facet_counts
+from .stats import get_stats, grouped
 from .serializers import (
-    BillSerializer, BillListSerializer, BillReadingSerializer, MPListSerializer, MPDetailSerializer,
+    BillSerializer, BillListSerializer, BillListValuesSerializer, BillReadingSerializer,
+    MPListSerializer, MPListValuesSerializer, MPDetailSerializer,
     ParliamentTermSerializer,
     DebtDataSerializer, LoanSerializer, LoanDetailSerializer, HansardSerializer, BudgetSerializer, OrderPaperSerializer,
     CommitteeListSerializer, CommitteeDetailSerializer,
@@ -20,11 +32,13 @@ from .serializers import (
 )
 
 
-class BillViewSet(viewsets.ModelViewSet):
+class BillViewSet(ConditionalGetMixin, SparseFieldsetsMixin, ValuesListMixin, viewsets.ModelViewSet):
     """
     ViewSet for viewing and editing bills.
     """
     queryset = Bill.objects.all()
+    conditional_models = [Bill, BillReading]
+    values_serializer_class = BillListValuesSerializer
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['bill_type', 'status', 'year_introduced']
     search_fields = ['title', 'mover', 'assigned_to']
@@ -38,12 +52,9 @@ class BillViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=['get'])
     def summary(self, request):
-        """Get summary statistics for bills by status"""
-        queryset = self.get_queryset()
-        
-        # Count bills by status
-        status_counts = queryset.values('status').annotate(count=Count('id'))
-        
+        """Get summary statistics for bills by status (from the materialized TrackerStats row)"""
+        counts, _, _ = get_stats('bills')
+
         # Create a dictionary with all statuses, defaulting to 0
         summary = {
             '1st_reading': 0,
@@ -53,20 +64,20 @@ class BillViewSet(viewsets.ModelViewSet):
             'assented': 0,
             'withdrawn': 0,  # Not in model, but included for frontend
         }
-        
+
         # Update with actual counts
-        for item in status_counts:
-            status = item['status']
+        for status, count in grouped(counts, 'status:').items():
             if status in summary:
-                summary[status] = item['count']
-        
-        # Also include total count
-        summary['total'] = queryset.count()
-        
+                summary[status] = count
+
+        # Also include total count and the split by bill type
+        summary['total'] = counts.get('total', 0)
+        summary['by_type'] = grouped(counts, 'type:')
+
         return Response(summary)
 
 
-class BillReadingViewSet(viewsets.ModelViewSet):
+class BillReadingViewSet(ConditionalGetMixin, SparseFieldsetsMixin, viewsets.ModelViewSet):
     """
     ViewSet for viewing and editing bill readings.
     """
@@ -76,20 +87,20 @@ class BillReadingViewSet(viewsets.ModelViewSet):
     filterset_fields = ['bill', 'stage']
 
 
-class MPPagination(PageNumberPagination):
+class MPPagination(KeysetPageNumberPagination):
     page_size = 20
     page_size_query_param = 'page_size'
     max_page_size = 100
 
 
-class ParliamentTermViewSet(viewsets.ReadOnlyModelViewSet):
+class ParliamentTermViewSet(ConditionalGetMixin, SparseFieldsetsMixin, viewsets.ReadOnlyModelViewSet):
     """Read-only list of parliament terms for the frontend selector."""
     queryset = ParliamentTerm.objects.all().order_by('-start_year')
     serializer_class = ParliamentTermSerializer
     pagination_class = None
 
 
-class MPViewSet(viewsets.ModelViewSet):
+class MPViewSet(ConditionalGetMixin, SparseFieldsetsMixin, ValuesListMixin, viewsets.ModelViewSet):
     """
     ViewSet for Members of Parliament
 
@@ -98,48 +109,49 @@ class MPViewSet(viewsets.ModelViewSet):
     Search by name, constituency, and district
     By default shows only MPs from the current parliament term; use ?parliament_term=<id> for a specific term.
     """
-    queryset = MP.objects.all()
+    queryset = MP.objects.select_related('party', 'district')
+    conditional_models = [MP, ParliamentTerm, Party, District]
+    values_serializer_class = MPListValuesSerializer
+    columnar_dictionary_fields = ['party', 'district']
     pagination_class = MPPagination
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = ['party', 'district', 'constituency']
-    search_fields = ['name', 'first_name', 'last_name', 'constituency', 'district']
+    # party and district are matched by name in get_queryset
+    filterset_fields = ['constituency']
+    search_fields = ['name', 'first_name', 'last_name', 'constituency', 'district__name']
+    # party/district order by name (Party/District Meta.ordering)
     ordering_fields = ['name', 'last_name', 'first_name', 'party', 'district', 'constituency', 'created_at']
     ordering = ['last_name', 'first_name']
 
-    def get_queryset(self):
-        """Default to current parliament term; allow override via ?parliament_term=<id>. Support multi-select party/district."""
-        qs = super().get_queryset()
+    def get_name_params(self, param):
+        """Comma-separated names from a query parameter"""
+        value = self.request.query_params.get(param, '')
+        return [name.strip() for name in value.split(',') if name.strip()]
+
+    def get_mp_filters(self):
+        """
+        {'parliament_term' | 'party' | 'district': Q} for the request.
+        Default to current parliament term; allow override via ?parliament_term=<id>.
+        ?party= and ?district= take comma-separated names in any casing; they are resolved
+        through the Party/District name index and filtered with an indexed IN on the foreign key.
+        """
+        filters = {}
         term_param = self.request.query_params.get('parliament_term')
         if term_param:
             try:
-                term_id = int(term_param)
-                qs = qs.filter(parliament_term_id=term_id)
+                filters['parliament_term'] = Q(parliament_term_id=int(term_param))
             except (ValueError, TypeError):
                 pass
         else:
-            qs = qs.filter(parliament_term__is_current=True)
-        party_param = self.request.query_params.get('party')
-        district_param = self.request.query_params.get('district')
-
-        if party_param:
-            parties = [p.strip() for p in party_param.split(',') if p.strip()]
-            if parties:
-                # Use case-insensitive matching for parties
-                party_q = Q()
-                for party in parties:
-                    party_q |= Q(party__iexact=party)
-                qs = qs.filter(party_q)
-
-        if district_param:
-            districts = [d.strip() for d in district_param.split(',') if d.strip()]
-            if districts:
-                # Use case-insensitive matching for districts
-                district_q = Q()
-                for district in districts:
-                    district_q |= Q(district__iexact=district)
-                qs = qs.filter(district_q)
-
-        return qs
+            filters['parliament_term'] = Q(parliament_term_id__in=ParliamentTerm.objects.filter(is_current=True).values('pk'))
+
+        for param, model in (('party', Party), ('district', District)):
+            names = self.get_name_params(param)
+            if names:
+                filters[param] = Q(**{f'{param}__in': model.objects.matching(names).values('pk')})
+        return filters
+
+    def get_queryset(self):
+        return super().get_queryset().filter(*self.get_mp_filters().values())
 
     def get_serializer_class(self):
         """Use different serializers for list and detail views"""
@@ -147,19 +159,42 @@ class MPViewSet(viewsets.ModelViewSet):
             return MPListSerializer
         return MPDetailSerializer
 
+    # Query parameters that narrow the MP list; without any, summary reads TrackerStats
+    summary_filter_params = ['parliament_term', 'party', 'district', 'constituency', 'search']
+
     @action(detail=False, methods=['get'])
     def summary(self, request):
-        """Get summary statistics for MPs"""
-        queryset = self.filter_queryset(self.get_queryset())
-
-        total_mps = queryset.count()
-        total_parties = queryset.values('party').distinct().count()
-        total_districts = queryset.values('district').distinct().count()
-
-        # Get party distribution
-        parties = queryset.values('party').annotate(
-            count=Count('id')
-        ).order_by('-count')
+        """
+        Get summary statistics for MPs.
+        The default (current term, unfiltered) summary is read from the materialized
+        TrackerStats row; filtered summaries are counted from the table.
+        """
+        if any(request.query_params.get(param) for param in self.summary_filter_params):
+            queryset = self.filter_queryset(self.get_queryset())
+            total_mps = queryset.count()
+            total_parties = queryset.values('party').distinct().count()
+            total_districts = queryset.values('district').distinct().count()
+            parties = [
+                {'party': row['party__name'], 'count': row['count']}
+                for row in queryset.values('party__name').annotate(count=Count('id')).order_by('-count')
+            ]
+        else:
+            # One read: the row carries the current term and party names with the counters
+            counts, _, labels = get_stats('mps')
+            term = labels['current_term']
+            # No current term means no MPs, as in the list endpoint
+            if term is None:
+                counts = {}
+            total_mps = counts.get(f'total:{term}', 0)
+            party_counts = grouped(counts, f'party:{term}:')
+            total_parties = len(party_counts)
+            total_districts = len(grouped(counts, f'district:{term}:'))
+            # Counters are keyed by party id
+            party_names = labels['parties']
+            parties = [
+                {'party': party_names.get(party), 'count': count}
+                for party, count in sorted(party_counts.items(), key=lambda item: -item[1])
+            ]
 
         # Calculate percentages
         party_distribution = []
@@ -177,8 +212,48 @@ class MPViewSet(viewsets.ModelViewSet):
             'party_distribution': party_distribution
         })
 
-
-class DebtDataViewSet(viewsets.ModelViewSet):
+    @action(detail=False, methods=['get'])
+    def facets(self, request):
+        """
+        GET /api/trackers/mps/facets/
+        MP counts per party, district and parliament term for the list's filters. Each
+        facet ignores its own filter, so every chip shows what selecting it would give
+        (see trackers.facets). Cached per normalized filter set.
+        """
+        signature = self.get_facet_signature()
+        queryset = self.filter_queryset(MP.objects.all())
+        return entry_response(request, self.build_facets.lookup_entry(signature, queryset, self.get_mp_filters())[0])
+
+    def get_facet_signature(self):
+        """The filter params in a canonical form: names lower-cased, sorted and de-duplicated"""
+        params = self.request.query_params
+        term = params.get('parliament_term')
+        if not term:
+            term = 'current'
+        else:
+            try:
+                term = str(int(term))
+            except ValueError:
+                term = 'all'  # an invalid id filters nothing, as in the list
+        signature = [('parliament_term', term)]
+        for param in ('party', 'district'):
+            signature.append((param, ','.join(sorted({name.lower() for name in self.get_name_params(param)}))))
+        signature.append(('constituency', params.get('constituency', '')))
+        signature.append(('search', ' '.join(params.get('search', '').lower().split())))
+        return tuple((param, value) for param, value in signature if value)
+
+    @staticmethod
+    @stale_while_revalidate(
+        'mp_facets', settings.HOME_CACHE_TIMEOUT, settings.HOME_CACHE_STALE_TIMEOUT,
+        key=lambda signature, queryset, filters: (urlencode(signature),),
+        precompress=True,
+    )
+    def build_facets(signature, queryset, filters):
+        """Facet counts for a queryset with the shared filters and the per-facet Qs; signature only keys the cache"""
+        return facet_counts(queryset, filters)
+
+
+class DebtDataViewSet(ConditionalGetMixin, SparseFieldsetsMixin, viewsets.ModelViewSet):
     """
     ViewSet for National Debt and Economic Data
 
@@ -200,21 +275,50 @@ class DebtDataViewSet(viewsets.ModelViewSet):
             return Response(serializer.data)
         return Response({})
 
-
-class LoanPagination(PageNumberPagination):
+    @action(detail=False, methods=['get'])
+    def series(self, request):
+        """
+        GET /api/trackers/debt/series/
+        The whole table as parallel arrays indexed like `years`: raw series,
+        debt-to-GDP and interest-to-expenditure ratios (%), annualized growth (%),
+        CAGR over the full range (%) and a trend projection (see trackers.debt).
+        Cached per table version: the latest updated_at and the row count.
+        """
+        return entry_response(request, self.build_series.lookup_entry(*self.series_version())[0])
+
+    @staticmethod
+    def series_version():
+        version = DebtData.objects.aggregate(updated=Max('updated_at'), rows=Count('id'))
+        return version['updated'], version['rows']
+
+    @staticmethod
+    @stale_while_revalidate(
+        'debt_series', settings.HOME_CACHE_TIMEOUT, settings.HOME_CACHE_STALE_TIMEOUT,
+        key=lambda updated, rows: (updated.isoformat() if updated else 'empty', rows),
+        precompress=True,
+    )
+    def build_series(updated, rows):
+        """Series payload; the version arguments only key the cache"""
+        data = list(DebtData.objects.order_by('year').values('year', *SERIES_FIELDS))
+        return {'updated_at': updated, **compute_series(data)}
+
+
+class LoanPagination(KeysetPageNumberPagination):
     page_size = 10
     page_size_query_param = 'page_size'
     max_page_size = 100
 
 
-class LoanViewSet(viewsets.ModelViewSet):
+class LoanViewSet(ConditionalGetMixin, SparseFieldsetsMixin, viewsets.ModelViewSet):
     """
     ViewSet for Government Loans
 
     Provides loan data with filtering by sector and source
     """
     queryset = Loan.objects.all().select_related('lender').prefetch_related('documents')
+    conditional_models = [Loan, Lender, LoanDocument]
     serializer_class = LoanSerializer
+    columnar_dictionary_fields = ['lender_display']
     pagination_class = LoanPagination
 
     def get_serializer_class(self):
@@ -222,47 +326,154 @@ class LoanViewSet(viewsets.ModelViewSet):
             return LoanDetailSerializer
         return LoanSerializer
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = ['sector', 'currency', 'source']
+    filterset_fields = {
+        'sector': ['exact'],
+        'currency': ['exact'],
+        'source': ['exact'],
+        # Range filters on the converted amounts, e.g. ?amount_usd__gte=1000000
+        'amount_ugx': ['gte', 'lte'],
+        'amount_usd': ['gte', 'lte'],
+    }
     search_fields = ['label', 'description', 'sector']
-    ordering_fields = ['approved_amount', 'approval_date', 'created_at']
+    ordering_fields = ['approved_amount', 'amount_ugx', 'amount_usd', 'approval_date', 'created_at']
     ordering = ['-approval_date', '-created_at']
 
+    # Query parameters that narrow the loan list; without any, sources_summary reads
+    # TrackerStats. analytics caches one payload per combination of them.
+    summary_filter_params = [
+        'sector', 'currency', 'source', 'search',
+        'amount_ugx__gte', 'amount_ugx__lte', 'amount_usd__gte', 'amount_usd__lte',
+    ]
+
     @action(detail=False, methods=['get'])
     def sources_summary(self, request):
         """Get loan sources summary for pie chart"""
-        # Use the same filtering as the main queryset to respect search/filters
-        queryset = self.filter_queryset(self.get_queryset())
-        
-        sources = queryset.values('source').annotate(
-            count=Count('id')
-        ).order_by('-count')
+        if any(request.query_params.get(param) for param in self.summary_filter_params):
+            # Use the same filtering as the main queryset to respect search/filters
+            queryset = self.filter_queryset(self.get_queryset())
+            sources = queryset.values('source').annotate(
+                count=Count('id')
+            ).order_by('-count')
+        else:
+            counts, _, _ = get_stats('loans')
+            sources = [
+                {'source': source, 'count': count}
+                for source, count in sorted(grouped(counts, 'source:').items(), key=lambda item: -item[1])
+            ]
 
         # Calculate percentages
+        source_names = dict(Loan.SOURCE_CHOICES)
         total = sum(item['count'] for item in sources)
         summary = []
         for item in sources:
-            source_obj = queryset.filter(source=item['source']).first()
             summary.append({
                 'source': item['source'],
-                'name': source_obj.get_source_display() if source_obj else item['source'],
+                'name': source_names.get(item['source'], item['source']),
                 'count': item['count'],
                 'percentage': round((item['count'] / total * 100), 1) if total > 0 else 0
             })
 
         return Response(summary)
 
+    @action(detail=False, methods=['get'])
+    def analytics(self, request):
+        """
+        GET /api/trackers/loans/analytics/
+        Loan counts and approved amounts grouped by lender, sector, currency and
+        approval year, for the same filters as the list. `amounts` are summed per
+        original currency; amount_ugx / amount_usd are the converted totals (loans
+        without an exchange rate are left out of those).
+        Cached per filter set; invalidated whenever a loan or lender changes.
+        """
+        filters = tuple(sorted(
+            (param, request.query_params[param]) for param in self.summary_filter_params if request.query_params.get(param)
+        ))
+        queryset = self.filter_queryset(self.get_queryset())
+        return entry_response(request, self.build_analytics.lookup_entry(filters, queryset)[0])
+
+    @staticmethod
+    @stale_while_revalidate(
+        'loan_analytics', settings.HOME_CACHE_TIMEOUT, settings.HOME_CACHE_STALE_TIMEOUT,
+        key=lambda filters, queryset: (urlencode(filters),),
+        precompress=True,
+    )
+    def build_analytics(filters, queryset):
+        """Analytics payload for an (unevaluated) filtered loan queryset; filters only key the cache"""
+        # One GROUP BY over every combination; each breakdown is rolled up from it in memory
+        rows = (
+            queryset.order_by().prefetch_related(None)
+            .annotate(year=ExtractYear('approval_date'))
+            .values('lender_id', 'lender__name', 'source', 'sector', 'currency', 'year')
+            .annotate(
+                count=Count('id'),
+                amount=Sum('approved_amount'),
+                amount_ugx=Sum('amount_ugx'),
+                amount_usd=Sum('amount_usd'),
+            )
+        )
+        sector_names = dict(Loan.SECTOR_CHOICES)
+        currency_names = dict(Loan.CURRENCY_CHOICES)
+        source_names = dict(Loan.SOURCE_CHOICES)
+
+        groups = {'total': {}, 'lender': {}, 'sector': {}, 'currency': {}, 'year': {}}
+        for row in rows:
+            if row['lender_id'] is not None:
+                lender = {'lender': row['lender_id'], 'source': None, 'name': row['lender__name']}
+            else:
+                # Legacy loans without a Lender, labelled like Loan.lender_display
+                lender = {'lender': None, 'source': row['source'], 'name': source_names.get(row['source'], row['source'])}
+            keys = {
+                'total': ('total', {}),
+                'lender': ((lender['lender'], lender['source']), lender),
+                'sector': (row['sector'], {'sector': row['sector'], 'name': sector_names.get(row['sector'], row['sector'])}),
+                'currency': (row['currency'], {'currency': row['currency'], 'name': currency_names.get(row['currency'], row['currency'])}),
+                'year': (row['year'], {'year': row['year']}),
+            }
+            for dimension, (group_key, labels) in keys.items():
+                group = groups[dimension].setdefault(
+                    group_key, {**labels, 'count': 0, 'amounts': {}, 'amount_ugx': 0, 'amount_usd': 0}
+                )
+                group['count'] += row['count']
+                amounts = group['amounts']
+                amounts[row['currency']] = amounts.get(row['currency'], 0) + (row['amount'] or 0)
+                group['amount_ugx'] += row['amount_ugx'] or 0
+                group['amount_usd'] += row['amount_usd'] or 0
+
+        def finish(group):
+            group['amounts'] = {currency: str(amount) for currency, amount in sorted(group['amounts'].items())}
+            group['amount_ugx'] = str(group['amount_ugx'])
+            group['amount_usd'] = str(group['amount_usd'])
+            return group
+
+        def by_count(dimension):
+            return [finish(group) for group in sorted(groups[dimension].values(), key=lambda group: -group['count'])]
+
+        total = groups['total'].get('total', {'count': 0, 'amounts': {}, 'amount_ugx': 0, 'amount_usd': 0})
+        return {
+            'total': finish(total),
+            'by_lender': by_count('lender'),
+            'by_sector': by_count('sector'),
+            'by_currency': by_count('currency'),
+            # Chronological; loans without an approval date last
+            'by_year': [
+                finish(group)
+                for group in sorted(groups['year'].values(), key=lambda group: (group['year'] is None, group['year'] or 0))
+            ],
+        }
+
 
-class HansardPagination(PageNumberPagination):
+class HansardPagination(KeysetPageNumberPagination):
     page_size = 15
     page_size_query_param = 'page_size'
     max_page_size = 100
 
 
-class HansardViewSet(viewsets.ModelViewSet):
+class HansardViewSet(ConditionalGetMixin, SparseFieldsetsMixin, viewsets.ModelViewSet):
     """
     ViewSet for Hansards
 
     Provides parliamentary hansard records with file downloads
+    Full-text search inside the PDFs, page by page, via /hansards/search/?q=
     """
     queryset = Hansard.objects.all()
     serializer_class = HansardSerializer
@@ -273,14 +484,119 @@ class HansardViewSet(viewsets.ModelViewSet):
     ordering_fields = ['date', 'created_at', 'name']
     ordering = ['-date', '-created_at']
 
+    # Number of best-matching pages returned per Hansard
+    search_pages_per_result = 3
+
+    @action(detail=False, methods=['get'])
+    def search(self, request):
+        """
+        Page-level full-text search inside Hansard PDFs.
+
+        GET /api/trackers/hansards/search/?q=<terms>&page_size=<n>&cursor=<token>
+        Returns matching Hansards (newest session first), each with its number of
+        matching pages and the best pages with highlighted snippets. Paginated by
+        keyset: follow `next` (or pass `next_cursor` as ?cursor=) for more results.
+        """
+        query = request.query_params.get('q', '').strip()
+        if not query:
+            return Response({'query': '', 'next': None, 'next_cursor': None, 'results': []})
+
+        try:
+            page_size = int(request.query_params.get('page_size', 10))
+            page_size = max(1, min(page_size, HansardPagination.max_page_size))
+        except (ValueError, TypeError):
+            page_size = 10
+
+        search_query = SearchQuery(query, config=SEARCH_CONFIG, search_type='websearch')
+        matching_pages = HansardPage.objects.filter(search_vector=search_query)
+
+        # Sessions without a date sort last, as they do in the list view
+        hansards = self.filter_queryset(self.get_queryset()).filter(
+            pk__in=matching_pages.values('hansard_id')
+        ).annotate(sort_date=Coalesce('date', Value(datetime.date.min)))
+
+        cursor_param = request.query_params.get('cursor')
+        if cursor_param:
+            try:
+                after_date, after_id = decode_cursor(cursor_param)
+                after_date = datetime.date.fromisoformat(after_date)
+                after_id = int(after_id)
+            except (ValueError, TypeError):
+                return Response({'error': 'Invalid cursor'}, status=status.HTTP_400_BAD_REQUEST)
+            hansards = hansards.filter(
+                Q(sort_date__lt=after_date) | Q(sort_date=after_date, pk__lt=after_id)
+            )
+
+        hansards = list(hansards.order_by('-sort_date', '-pk')[:page_size + 1])
+        has_more = len(hansards) > page_size
+        hansards = hansards[:page_size]
+
+        hansard_ids = [hansard.pk for hansard in hansards]
+        page_hits = matching_pages.filter(hansard_id__in=hansard_ids)
+        match_counts = dict(
+            page_hits.values('hansard_id').annotate(count=Count('id')).values_list('hansard_id', 'count')
+        )
+
+        # Pick the best pages per Hansard first, then build headlines for those pages only
+        top_page_ids = list(
+            page_hits.annotate(
+                position=Window(
+                    RowNumber(),
+                    partition_by=[F('hansard_id')],
+                    order_by=[SearchRank(F('search_vector'), search_query).desc(), F('page_number').asc()],
+                )
+            ).filter(position__lte=self.search_pages_per_result).values_list('id', flat=True)
+        )
+        snippets = HansardPage.objects.filter(pk__in=top_page_ids).annotate(
+            snippet=SearchHeadline(
+                'text',
+                search_query,
+                config=SEARCH_CONFIG,
+                start_sel='<mark>',
+                stop_sel='</mark>',
+                max_words=35,
+                min_words=15,
+                max_fragments=2,
+            )
+        ).order_by('hansard_id', 'page_number').values('hansard_id', 'page_number', 'snippet')
+
+        pages_by_hansard = {}
+        for row in snippets:
+            pages_by_hansard.setdefault(row['hansard_id'], []).append({
+                'page_number': row['page_number'],
+                'snippet': row['snippet'],
+            })
+
+        results = []
+        for hansard, data in zip(hansards, HansardSerializer(hansards, many=True).data):
+            results.append({
+                **data,
+                'match_count': match_counts.get(hansard.pk, 0),
+                'pages': pages_by_hansard.get(hansard.pk, []),
+            })
+
+        next_cursor = None
+        next_url = None
+        if has_more:
+            last = hansards[-1]
+            next_cursor = encode_cursor([last.sort_date.isoformat(), last.pk])
+            next_url = replace_query_param(request.build_absolute_uri(), 'cursor', next_cursor)
+
+        return Response({
+            'query': query,
+            'next': next_url,
+            'next_cursor': next_cursor,
+            'results': results,
+        })
+
 
-class BudgetPagination(PageNumberPagination):
+class BudgetPagination(KeysetPageNumberPagination):
     page_size = 15
     page_size_query_param = 'page_size'
     max_page_size = 100
 
 
-class BudgetViewSet(viewsets.ModelViewSet):
+class BudgetViewSet(ConditionalGetMixin, SparseFieldsetsMixin, viewsets.ModelViewSet):
     """
     ViewSet for Budgets
 
@@ -294,13 +610,13 @@ class BudgetViewSet(viewsets.ModelViewSet):
     ordering = ['-financial_year', '-created_at']
 
 
-class OrderPaperPagination(PageNumberPagination):
+class OrderPaperPagination(KeysetPageNumberPagination):
     page_size = 15
     page_size_query_param = 'page_size'
     max_page_size = 100
 
 
-class OrderPaperViewSet(viewsets.ModelViewSet):
+class OrderPaperViewSet(ConditionalGetMixin, SparseFieldsetsMixin, viewsets.ModelViewSet):
     """
     ViewSet for Order Papers
 
@@ -315,19 +631,22 @@ class OrderPaperViewSet(viewsets.ModelViewSet):
     ordering = ['-created_at']
 
 
-class CommitteePagination(PageNumberPagination):
+class CommitteePagination(KeysetPageNumberPagination):
     page_size = 20
     page_size_query_param = 'page_size'
     max_page_size = 100
 
 
-class CommitteeViewSet(viewsets.ModelViewSet):
+class CommitteeViewSet(ConditionalGetMixin, SparseFieldsetsMixin, viewsets.ModelViewSet):
     """
     ViewSet for Parliamentary Committees
 
     Provides committee information including chairperson, deputy, members, and documents
     """
-    queryset = Committee.objects.prefetch_related('members', 'documents')
+    queryset = Committee.objects.prefetch_related(
+        Prefetch('members', queryset=MP.objects.select_related('party', 'district')), 'documents'
+    )
+    conditional_models = [Committee, CommitteeDocument, MP, Party, District]
     pagination_class = CommitteePagination
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     search_fields = ['title', 'description', 'chairperson', 'deputy_chairperson']
@@ -346,21 +665,23 @@ class HomeSummaryView(APIView):
     """
     Optimized endpoint for home page trackers summary.
     Returns latest 5 items from each tracker in a single response.
-    Cached for 10 minutes to improve performance.
+    Cached for hours; invalidated whenever a model it reads changes (main.cache.CACHE_DEPENDENCIES),
+    with stale-while-revalidate rebuilds.
     """
     permission_classes = [AllowAny]
 
-    @method_decorator(cache_page(600))  # Cache for 10 minutes
     def get(self, request):
-        cache_key = 'home_trackers_summary'
-        cached_data = cache.get(cache_key)
-        
-        if cached_data is not None:
-            return Response(cached_data)
-        
+        return entry_response(request, self.build_summary.lookup_entry()[0])
+
+    @staticmethod
+    @stale_while_revalidate('home_trackers_summary', settings.HOME_CACHE_TIMEOUT, settings.HOME_CACHE_STALE_TIMEOUT, precompress=True)
+    def build_summary():
         # Fetch latest 5 items from each tracker with optimized queries
         # Using only() to fetch only needed fields
-        mps = MP.objects.filter(parliament_term__is_current=True).only('id', 'name', 'party', 'constituency').order_by('-created_at')[:5]
+        mps = (
+            MP.objects.filter(parliament_term__is_current=True).select_related('party')
+            .only('id', 'name', 'party', 'party__name', 'constituency').order_by('-created_at')[:5]
+        )
         bills = Bill.objects.only('id', 'title').order_by('-created_at')[:5]
         loans = Loan.objects.only('id', 'label', 'sector', 'source').order_by('-created_at')[:5]
         budgets = Budget.objects.only('id', 'name', 'financial_year', 'file').order_by('-created_at')[:5]
@@ -377,7 +698,4 @@ class HomeSummaryView(APIView):
             'order_papers': HomeSummaryOrderPaperSerializer(order_papers, many=True).data,
         }
         
-        # Cache the response
-        cache.set(cache_key, data, 600)  # Cache for 10 minutes
-        
-        return Response(data)
\ No newline at end of file
+        return data
\ No newline at end of file